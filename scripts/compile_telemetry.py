@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+UVM Compile Telemetry
+Extracts DSIM build statistics from simulation logs: per-unit function and
+basic block counts ("[6/9] package uvm_pkg: 3777 functions, 41195 basic
+blocks") and, for regression runs, the per-phase build times recorded by the
+regression runner. Writes the JSON imported by the dashboard
+(dashboard_generator.py --import-compile).
+
+Author: UVM Base Generator
+Date: 2025-07-27
+"""
+
+import io
+import re
+import sys
+import glob
+import json
+import argparse
+import statistics
+from pathlib import Path
+from datetime import datetime
+from typing import Dict, Any, List
+
+from log_parser import COMPILE_PHASES, SCHEDULER_MARKER, git_value
+from log_archive import open_log
+
+# "  [6/9] package uvm_pkg: 6 submodules, 3777 functions, 41195 basic blocks"
+UNIT_PATTERN = re.compile(r'^\s*\[\d+/\d+\]\s+(?P<kind>module|package|interface|program|CU scope|\w+)\s+'
+                          r'(?P<name>\S+):\s+(?:(?P<submodules>\d+) submodules?,\s+)?'
+                          r'(?P<functions>\d+) functions?,\s+(?P<basic_blocks>\d+) basic blocks?')
+
+
+def parse_compile_log(log_file: str) -> Dict[str, Any]:
+    """Build units and the phases reached, reading (or decompressing) only up to the start of simulation."""
+    units = []
+    phases = []
+    markers = [(name, marker.decode()) for name, marker in COMPILE_PHASES]
+    scheduler = SCHEDULER_MARKER.decode()
+
+    with io.TextIOWrapper(open_log(log_file), encoding='utf-8', errors='replace') as f:
+        for line in f:
+            if line.startswith(scheduler):
+                break
+            match = UNIT_PATTERN.match(line)
+            if match:
+                units.append({
+                    'kind': match.group('kind'),
+                    'name': match.group('name'),
+                    'submodules': int(match.group('submodules') or 0),
+                    'functions': int(match.group('functions')),
+                    'basic_blocks': int(match.group('basic_blocks')),
+                })
+                continue
+            phases += [name for name, marker in markers if line.startswith(marker)]
+
+    return {'log': str(log_file), 'phases_reached': phases, 'units': units}
+
+
+class CompileTelemetry:
+    """Collects build statistics of many simulations into one dashboard record."""
+
+    @staticmethod
+    def expand_inputs(inputs: List[str]) -> List[Dict[str, Any]]:
+        """Job entries for log files/globs and regression results.json files."""
+        entries = []
+        for pattern in inputs:
+            for path in sorted(glob.glob(pattern)) or [pattern]:
+                if path.endswith('.json'):
+                    with open(path, 'r', encoding='utf-8') as f:
+                        regression = json.load(f)
+                    # Cached jobs did not build in this run
+                    entries += [dict(job, run_id=regression.get('run_id')) for job in regression.get('jobs', [])
+                                if job.get('log') and not job.get('cached')]
+                else:
+                    entries.append({'log': path})
+        return entries
+
+    def collect(self, inputs: List[str], branch_name: str = None, commit_hash: str = None) -> Dict[str, Any]:
+        """Parse every log and summarize unit sizes and median phase times."""
+        builds = []
+        for entry in self.expand_inputs(inputs):
+            try:
+                build = parse_compile_log(entry['log'])
+            except OSError as e:
+                print(f"WARNING: {entry['log']}: {e}")
+                continue
+            build.update({key: entry.get(key) for key in ('run_id', 'test', 'seed')})
+            build['phases'] = entry.get('phases') or {}
+            builds.append(build)
+
+        # Every build of one design reports the same units; keep the largest figures seen
+        units: Dict[str, Dict[str, Any]] = {}
+        for build in builds:
+            for unit in build['units']:
+                key = f"{unit['kind']} {unit['name']}"
+                if key not in units or unit['basic_blocks'] > units[key]['basic_blocks']:
+                    units[key] = unit
+
+        phase_names = ['startup'] + [name for name, _ in COMPILE_PHASES]
+        phase_seconds = {}
+        for name in phase_names:
+            times = [build['phases'][name] for build in builds if name in build['phases']]
+            if times:
+                phase_seconds[name] = round(statistics.median(times), 3)
+
+        run_ids = sorted({build['run_id'] for build in builds if build.get('run_id')})
+        return {
+            'branch_name': branch_name or git_value('rev-parse', '--abbrev-ref', 'HEAD') or 'unknown',
+            'commit_hash': commit_hash or git_value('rev-parse', 'HEAD') or '',
+            'run_id': ','.join(run_ids) or None,
+            'timestamp': datetime.now().astimezone().isoformat(timespec='seconds'),
+            'builds': len(builds),
+            'phase_seconds': phase_seconds,
+            'compile_seconds': round(sum(phase_seconds.values()), 3),
+            'units': sorted(units.values(), key=lambda unit: -unit['basic_blocks']),
+            'totals': {
+                'functions': sum(unit['functions'] for unit in units.values()),
+                'basic_blocks': sum(unit['basic_blocks'] for unit in units.values()),
+            },
+            'per_build': builds,
+        }
+
+
+def main():
+    """Main function with command line argument parsing."""
+    parser = argparse.ArgumentParser(description="Extract DSIM compile/elaboration telemetry from logs")
+    parser.add_argument("inputs", nargs="+",
+                       help="Log files, glob patterns, or regression results.json files (for phase times)")
+    parser.add_argument("-o", "--output", default="sim/exec/compile_stats.json",
+                       help="JSON for dashboard_generator.py --import-compile (default: sim/exec/compile_stats.json)")
+    parser.add_argument("--branch", default=None, help="Branch name (default: current git branch)")
+    parser.add_argument("--commit", default=None, help="Commit hash (default: current git HEAD)")
+
+    args = parser.parse_args()
+
+    try:
+        telemetry = CompileTelemetry().collect(args.inputs, args.branch, args.commit)
+    except (OSError, ValueError) as e:
+        print(f"ERROR: {e}")
+        sys.exit(1)
+
+    if not telemetry['units']:
+        print("ERROR: No DSIM build statistics found")
+        sys.exit(1)
+
+    total = telemetry['totals']['basic_blocks']
+    print(f"Builds: {telemetry['builds']}")
+    print(f"{'Unit':40} {'Functions':>10} {'Basic blocks':>13} {'Share':>7}")
+    for unit in telemetry['units']:
+        name = f"{unit['kind']} {unit['name']}"
+        print(f"{name:40} {unit['functions']:>10} {unit['basic_blocks']:>13} "
+              f"{100.0 * unit['basic_blocks'] / total if total else 0.0:>6.1f}%")
+    for name, seconds in telemetry['phase_seconds'].items():
+        print(f"  {name}: {seconds:.2f}s (median)")
+
+    Path(args.output).parent.mkdir(parents=True, exist_ok=True)
+    Path(args.output).write_text(json.dumps(telemetry, indent=2), encoding='utf-8')
+    print(f"Telemetry written to {args.output}")
+
+if __name__ == "__main__":
+    main()
@@ -1,70 +1,227 @@
-# UVM Project Dashboard Generator
-
-**Author**: UVM Base Generator  
-**Date**: July 27, 2025  
-**Purpose**: Automated project metrics and dashboard generation
-
-## Overview
-
-This tool generates comprehensive project dashboards for UVM verification environments, providing real-time insights into test execution, coverage metrics, and project health indicators.
-
-## Features
-
-- **Real-time Test Execution Monitoring**
-- **Coverage Trend Analysis**
-- **Performance Metrics Tracking**
-- **Team Productivity Analytics**
-- **Automated Report Generation**
-
-## Usage
-
-```bash
-# Generate dashboard
-python scripts/dashboard_generator.py --config dashboard_config.yaml
-
-# Real-time monitoring
-python scripts/dashboard_generator.py --monitor --port 8080
-
-# Generate weekly report
-python scripts/dashboard_generator.py --report weekly --email team@company.com
-```
-
-## Dashboard Components
-
-### 1. Test Execution Status
-
-```python
 #!/usr/bin/env python3
 """
 UVM Project Dashboard Generator
 Provides real-time monitoring and reporting for UVM verification projects
+
+Importable as a module: regression tooling can hand results to
+UVMDashboard.ingest() in-process. pandas and plotly are only imported when
+charts are generated, so ingesting needs neither.
 """
 
 import json
 import yaml
+import glob
+import time
+import uuid
+import random
 import sqlite3
-import pandas as pd
-import plotly.graph_objects as go
-import plotly.express as px
-from plotly.subplots import make_subplots
-from datetime import datetime, timedelta
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta, timezone
 import argparse
 import sys
 import os
 from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Tuple, Union
+
+# Columns of a test_runs row filled from one results document
+TEST_RUN_COLUMNS = (
+    'timestamp', 'branch_name', 'commit_hash', 'test_suite', 'total_tests',
+    'passed_tests', 'failed_tests', 'coverage_functional',
+    'coverage_code', 'coverage_toggle', 'coverage_fsm',
+    'runtime_seconds', 'simulation_speed_khz', 'memory_usage_gb'
+)
+
+# Schema migrations (version, description, statements), applied in order by
+# setup_database; PRAGMA user_version records the last one applied. Append new
+# migrations, never change one that has shipped.
+SCHEMA_MIGRATIONS = [
+    (1, 'time-window indexes on test_runs', [
+        'CREATE INDEX IF NOT EXISTS idx_test_runs_timestamp ON test_runs (timestamp)',
+        'CREATE INDEX IF NOT EXISTS idx_test_runs_branch_timestamp ON test_runs (branch_name, timestamp)',
+        'CREATE INDEX IF NOT EXISTS idx_test_runs_suite_timestamp ON test_runs (test_suite, timestamp)',
+    ]),
+    (2, 'time-window index on compile_stats', [
+        'CREATE INDEX IF NOT EXISTS idx_compile_stats_timestamp ON compile_stats (timestamp)',
+    ]),
+    (3, 'SQLite time stamps in compile_stats', [
+        "UPDATE compile_stats SET timestamp = datetime(timestamp) WHERE timestamp LIKE '%T%'",
+    ]),
+    (4, 'failure signature tables (failure_triage.py)', [
+        '''
+        CREATE TABLE IF NOT EXISTS failure_signatures (
+            signature_hash TEXT PRIMARY KEY,
+            signature TEXT,
+            severity TEXT,
+            report_id TEXT,
+            first_seen DATETIME,
+            last_seen DATETIME,
+            runs_seen INTEGER,
+            total_failures INTEGER
+        )
+        ''',
+        '''
+        CREATE TABLE IF NOT EXISTS failure_occurrences (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            timestamp DATETIME,
+            run_id TEXT,
+            signature_hash TEXT,
+            failures INTEGER,
+            first_test TEXT,
+            first_seed INTEGER,
+            reproducer_test TEXT,
+            reproducer_seed INTEGER,
+            reproducer_sim_time INTEGER,
+            reproducer_log TEXT
+        )
+        ''',
+        'CREATE INDEX IF NOT EXISTS idx_failure_occurrences_hash ON failure_occurrences (signature_hash, timestamp)',
+    ]),
+]
+
+# test_runs columns the charts read, with their frame types (NULL becomes NaN)
+CHART_COLUMNS = {
+    'total_tests': 'float64', 'passed_tests': 'float64', 'failed_tests': 'float64',
+    'coverage_functional': 'float64', 'coverage_code': 'float64',
+    'coverage_toggle': 'float64', 'coverage_fsm': 'float64',
+    'runtime_seconds': 'float64', 'simulation_speed_khz': 'float64', 'memory_usage_gb': 'float64',
+}
+
+# The one test_runs query of a dashboard build: the 30-day chart window, with
+# 'recent' marking the rows inside the health score's 7-day window
+CHART_QUERY = f'''
+    SELECT timestamp, {', '.join(CHART_COLUMNS)},
+           timestamp >= datetime('now', '-7 days') AS recent
+    FROM test_runs
+    WHERE timestamp >= datetime('now', '-30 days')
+    ORDER BY timestamp
+'''
+
+# Queries the dashboard and its readers run that must be answered through an
+# index rather than a table scan (--check-indexes)
+INDEXED_QUERIES = {
+    'test_runs window (charts)': CHART_QUERY,
+    'test_runs window per branch': '''
+        SELECT timestamp, passed_tests, total_tests FROM test_runs
+        WHERE branch_name = 'main' AND timestamp >= datetime('now', '-30 days') ORDER BY timestamp
+    ''',
+    'test_runs window per suite': '''
+        SELECT timestamp, passed_tests, total_tests FROM test_runs
+        WHERE test_suite = 'regression' AND timestamp >= datetime('now', '-30 days') ORDER BY timestamp
+    ''',
+    'suite runtime estimate (regression_history.py)': '''
+        SELECT AVG(CAST(runtime_seconds AS REAL) / MAX(total_tests, 1)) FROM test_runs
+        WHERE test_suite = 'regression' AND runtime_seconds IS NOT NULL
+    ''',
+    'compile_stats window': '''
+        SELECT timestamp, kind, name, basic_blocks, seconds FROM compile_stats
+        WHERE timestamp >= datetime('now', '-90 days') ORDER BY timestamp
+    ''',
+}
+
+def is_results_document(document):
+    """True for a dashboard results document (log_parser.py output), not e.g. a regression results.json"""
+    return isinstance(document, dict) and 'total_tests' in document
+
+
+def results_documents(results):
+    """List of the results documents in one document or an iterable of them
+    
+    Raises ValueError, before anything is stored, when any of them is not a
+    dashboard results document.
+    """
+    documents = [results] if isinstance(results, dict) else list(results)
+    for number, document in enumerate(documents):
+        if not is_results_document(document):
+            raise ValueError(f"Document {number} is not a dashboard results document (no total_tests)")
+    return documents
+
+
+def read_results_file(path):
+    """test_runs rows of one JSON results file (runs in a worker process)
+    
+    A file may hold one results document or a list of them. Returns
+    (path, rows, skipped documents, error).
+    """
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError) as e:
+        return path, [], 0, str(e)
+    documents = data if isinstance(data, list) else [data]
+    rows = [UVMDashboard.test_run_row(document) for document in documents if is_results_document(document)]
+    return path, rows, len(documents) - len(rows), None
+
+
+def expand_result_inputs(inputs):
+    """(JSON files, JSONL streams) for files, directories (searched recursively), globs and '-' (stdin JSONL)"""
+    json_files, streams = [], []
+    for pattern in inputs:
+        if pattern == '-':
+            streams.append(pattern)
+            continue
+        if os.path.isdir(pattern):
+            paths = sorted(str(path) for path in Path(pattern).rglob('*.json*'))
+        else:
+            paths = sorted(glob.glob(pattern, recursive=True)) or [pattern]
+        for path in paths:
+            if path.endswith('.jsonl'):
+                streams.append(path)
+            elif path.endswith('.json'):
+                json_files.append(path)
+    return json_files, streams
+
 
 class UVMDashboard:
-    def __init__(self, config_file):
+    def __init__(self, config_file='dashboard_config.yaml'):
         """Initialize dashboard with configuration"""
         self.config = self.load_config(config_file)
         self.db_path = self.config.get('database_path', 'verification_metrics.db')
+        # Created on the first chart written, so database-only users leave no output behind
         self.output_dir = Path(self.config.get('output_directory', 'dashboard_output'))
-        self.output_dir.mkdir(exist_ok=True)
         
-        # Initialize database connection
-        self.conn = sqlite3.connect(self.db_path)
+        # Initialize database connection; writers wait for (and then retry) a locked database
+        self.busy_timeout = self.config.get('busy_timeout_seconds', 30.0)
+        self.write_retries = self.config.get('write_retries', 5)
+        self.conn = sqlite3.connect(self.db_path, timeout=self.busy_timeout)
+        self.configure_connection()
         self.setup_database()
         
+    def configure_connection(self):
+        """Journal mode and sync level of the metrics database
+        
+        WAL lets readers (dashboard generation) run while a job writes and
+        keeps concurrent writers from failing at once. It needs shared memory,
+        so a database on a network filesystem should use journal_mode: delete.
+        """
+        journal_mode = self.config.get('journal_mode', 'wal')
+        self.retry_write(lambda: self.conn.execute(f'PRAGMA journal_mode={journal_mode}'))
+        if journal_mode.lower() == 'wal':
+            # Durable at checkpoints instead of every commit; safe with WAL
+            self.conn.execute('PRAGMA synchronous=NORMAL')
+        
+    def retry_write(self, operation):
+        """Run a write operation, retrying with backoff while the database stays locked
+        
+        sqlite3 already waits busy_timeout seconds for a lock; a writer still
+        locked out after that (or hitting SQLITE_BUSY on a WAL upgrade) backs
+        off with jitter and tries again, up to write_retries times.
+        """
+        for attempt in range(self.write_retries + 1):
+            try:
+                return operation()
+            except sqlite3.OperationalError as e:
+                message = str(e).lower()
+                if attempt == self.write_retries or ('locked' not in message and 'busy' not in message):
+                    raise
+                delay = min(30.0, 0.5 * 2 ** attempt) * random.uniform(0.5, 1.5)
+                print(f"Database busy ({e}), retrying in {delay:.1f}s")
+                time.sleep(delay)
+        
+    def output_path(self, name):
+        """Path of a generated file in output_dir, creating the directory"""
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        return self.output_dir / name
+    
     def load_config(self, config_file):
         """Load dashboard configuration"""
         try:
@@ -79,6 +236,10 @@ class UVMDashboard:
         return {
             'database_path': 'verification_metrics.db',
             'output_directory': 'dashboard_output',
+            'journal_mode': 'wal',
+            'busy_timeout_seconds': 30.0,
+            'write_retries': 5,
+            'ingest_spool': None,
             'refresh_interval_minutes': 5,
             'email_notifications': False,
             'coverage_targets': {
@@ -135,7 +296,258 @@ class UVMDashboard:
             )
         ''')
         
+        # Compile/elaboration telemetry: one row per build unit or phase
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS compile_stats (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
+                branch_name TEXT,
+                commit_hash TEXT,
+                run_id TEXT,
+                kind TEXT,
+                name TEXT,
+                functions INTEGER,
+                basic_blocks INTEGER,
+                seconds REAL
+            )
+        ''')
+        
         self.conn.commit()
+        self.migrate_schema()
+    
+    def schema_version(self):
+        """Last schema migration applied to the database (0 for none)"""
+        return self.conn.execute('PRAGMA user_version').fetchone()[0]
+    
+    def migrate_schema(self):
+        """Apply the SCHEMA_MIGRATIONS newer than the database's schema version
+        
+        Each migration commits together with its version bump, so an
+        interrupted upgrade resumes where it stopped. The version is read
+        again under the write lock: when several jobs open an old database at
+        once, only the first applies a migration.
+        """
+        for version, description, statements in SCHEMA_MIGRATIONS:
+            if self.schema_version() >= version:
+                continue
+        
+            def apply():
+                self.conn.execute('BEGIN IMMEDIATE')
+                try:
+                    if self.schema_version() >= version:
+                        self.conn.rollback()
+                        return False
+                    for statement in statements:
+                        self.conn.execute(statement)
+                    self.conn.execute(f'PRAGMA user_version = {version}')
+                    self.conn.commit()
+                    return True
+                except sqlite3.Error:
+                    self.conn.rollback()
+                    raise
+        
+            if self.retry_write(apply):
+                print(f"✓ Database schema migrated to version {version}: {description}")
+    
+    def check_query_plans(self):
+        """Print the EXPLAIN QUERY PLAN of each INDEXED_QUERIES entry
+        
+        Returns False when any of them scans a whole table, i.e. would slow
+        down as test_runs grows.
+        """
+        print(f"Schema version {self.schema_version()} (latest {SCHEMA_MIGRATIONS[-1][0]})")
+        ok = True
+        for name, query in INDEXED_QUERIES.items():
+            plan = [row[3] for row in self.conn.execute(f'EXPLAIN QUERY PLAN {query}')]
+            scans = [detail for detail in plan if detail.startswith('SCAN')]
+            print(f"{'✗' if scans else '✓'} {name}: {'; '.join(plan)}")
+            ok = ok and not scans
+        return ok
+    
+    @staticmethod
+    def db_timestamp(value):
+        """ISO 8601 time stamp in SQLite's own format, in UTC (as CURRENT_TIMESTAMP), None kept
+        
+        Time stamps with an offset are converted to UTC; naive ones are taken
+        to be UTC already, so the datetime('now', ...) windows compare like
+        with like.
+        """
+        if not value:
+            return None
+        try:
+            stamp = datetime.fromisoformat(str(value))
+        except ValueError:
+            return value
+        if stamp.tzinfo is not None:
+            stamp = stamp.astimezone(timezone.utc)
+        return stamp.strftime('%Y-%m-%d %H:%M:%S')
+    
+    @staticmethod
+    def test_run_row(results):
+        """test_runs values (in TEST_RUN_COLUMNS order) of one results document"""
+        coverage = results.get('coverage') or {}
+        return (
+            UVMDashboard.db_timestamp(results.get('timestamp')),
+            results.get('branch_name', 'unknown'),
+            results.get('commit_hash', ''),
+            results.get('test_suite', 'default'),
+            results.get('total_tests', 0),
+            results.get('passed_tests', 0),
+            results.get('failed_tests', 0),
+            coverage.get('functional', 0.0),
+            coverage.get('code', 0.0),
+            coverage.get('toggle', 0.0),
+            coverage.get('fsm', 0.0),
+            results.get('runtime_seconds', 0),
+            results.get('simulation_speed_khz', 0.0),
+            results.get('memory_usage_gb', 0.0)
+        )
+    
+    def ingest(self, results: Union[Dict[str, Any], Iterable[Dict[str, Any]]]) -> int:
+        """Store one results document or many (any iterable) in test_runs; returns the rows added.
+        
+        All rows go in with one executemany and one commit. A document without
+        a timestamp is stamped with the time of the import. Raises ValueError,
+        storing nothing, when any document is not a dashboard results document.
+        """
+        rows = [self.test_run_row(document) for document in results_documents(results)]
+        self.insert_test_runs(rows)
+        return len(rows)
+    
+    def insert_test_runs(self, rows):
+        """Insert test_runs rows in one transaction (retried while the database is locked)"""
+        def insert():
+            with self.conn:
+                self.conn.executemany(f'''
+                    INSERT INTO test_runs ({', '.join(TEST_RUN_COLUMNS)})
+                    VALUES (COALESCE(?, CURRENT_TIMESTAMP){', ?' * (len(TEST_RUN_COLUMNS) - 1)})
+                ''', rows)
+        self.retry_write(insert)
+    
+    @staticmethod
+    def read_results_stream(stream):
+        """Rows of a JSONL stream (one results document per line), read line by line"""
+        with (sys.stdin if stream == '-' else open(stream, 'r', encoding='utf-8')) as f:
+            for number, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    document = json.loads(line)
+                except ValueError as e:
+                    print(f"✗ {stream}:{number}: {e}")
+                    continue
+                if is_results_document(document):
+                    yield UVMDashboard.test_run_row(document)
+    
+    def bulk_import(self, inputs, batch_size=5000, jobs=None):
+        """Import many results files and JSONL streams in batched transactions
+        
+        JSON files are parsed in parallel worker processes; JSONL streams are
+        read line by line. Rows are inserted with executemany, one transaction
+        per batch_size rows (WAL journaling and synchronous=NORMAL come with
+        the connection). Returns import statistics including rows per second.
+        """
+        started = time.time()
+        json_files, streams = expand_result_inputs(inputs)
+        
+        stats = {'files': len(json_files) + len(streams), 'rows': 0, 'batches': 0, 'skipped': 0, 'errors': 0}
+        batch = []
+        
+        def flush():
+            if batch:
+                self.insert_test_runs(batch)
+                stats['rows'] += len(batch)
+                stats['batches'] += 1
+                batch.clear()
+        
+        if json_files:
+            with ProcessPoolExecutor(max_workers=jobs) as pool:
+                chunksize = max(1, len(json_files) // ((jobs or os.cpu_count() or 1) * 4))
+                for path, rows, skipped, error in pool.map(read_results_file, json_files, chunksize=chunksize):
+                    if error:
+                        stats['errors'] += 1
+                        print(f"✗ {path}: {error}")
+                    stats['skipped'] += skipped
+                    batch.extend(rows)
+                    if len(batch) >= batch_size:
+                        flush()
+        
+        for stream in streams:
+            try:
+                for row in self.read_results_stream(stream):
+                    batch.append(row)
+                    if len(batch) >= batch_size:
+                        flush()
+            except OSError as e:
+                stats['errors'] += 1
+                print(f"✗ {stream}: {e}")
+        flush()
+        
+        stats['seconds'] = round(time.time() - started, 3)
+        stats['rows_per_second'] = round(stats['rows'] / stats['seconds'], 1) if stats['seconds'] > 0 else 0.0
+        return stats
+    
+    def spool_dir(self):
+        """Directory of the single-writer ingest queue (ingest_spool in the config)"""
+        spool = self.config.get('ingest_spool')
+        if not spool:
+            raise ValueError("No ingest_spool configured")
+        return Path(spool)
+    
+    def submit(self, results):
+        """Queue results for the ingest server instead of writing the database; returns the spool file
+        
+        The file is written under a temporary name and renamed into place, so
+        the server never sees a partial submission (also on a shared filesystem).
+        """
+        documents = results_documents(results)
+        spool = self.spool_dir()
+        spool.mkdir(parents=True, exist_ok=True)
+        name = f"{time.time():.6f}-{os.getpid()}-{uuid.uuid4().hex[:8]}"
+        part = spool / f"{name}.part"
+        part.write_text(json.dumps(documents), encoding='utf-8')
+        target = spool / f"{name}.json"
+        os.replace(part, target)
+        return target
+    
+    def serve_ingest(self, poll_seconds=1.0, once=False):
+        """Single-writer ingest server: drain the spool into the database until interrupted
+        
+        Each pass inserts every pending submission in one transaction and then
+        removes the files; unreadable submissions are moved to failed/. With
+        once=True, exits after the spool is empty.
+        """
+        spool = self.spool_dir()
+        failed = spool / 'failed'
+        spool.mkdir(parents=True, exist_ok=True)
+        print(f"Ingest server writing {self.db_path} from {spool}")
+        total = 0
+        try:
+            while True:
+                files = sorted(str(path) for path in spool.glob('*.json'))
+                rows, done = [], []
+                for path in files:
+                    path, file_rows, _, error = read_results_file(path)
+                    if error:
+                        failed.mkdir(exist_ok=True)
+                        os.replace(path, failed / Path(path).name)
+                        print(f"✗ {path}: {error} (moved to {failed})")
+                        continue
+                    rows.extend(file_rows)
+                    done.append(path)
+                if rows:
+                    self.insert_test_runs(rows)
+                    total += len(rows)
+                    print(f"✓ Stored {len(rows)} test run(s) from {len(done)} submission(s)")
+                for path in done:
+                    os.remove(path)
+                if once and not files:
+                    break
+                if not files:
+                    time.sleep(poll_seconds)
+        except KeyboardInterrupt:
+            pass
+        return total
     
     def collect_test_metrics(self, test_results_file):
         """Collect test execution metrics from results file"""
@@ -143,48 +555,62 @@ class UVMDashboard:
             with open(test_results_file, 'r') as f:
                 results = json.load(f)
             
-            cursor = self.conn.cursor()
-            cursor.execute('''
-                INSERT INTO test_runs (
-                    branch_name, commit_hash, test_suite, total_tests,
-                    passed_tests, failed_tests, coverage_functional,
-                    coverage_code, coverage_toggle, coverage_fsm,
-                    runtime_seconds, simulation_speed_khz, memory_usage_gb
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                results.get('branch_name', 'unknown'),
-                results.get('commit_hash', ''),
-                results.get('test_suite', 'default'),
-                results.get('total_tests', 0),
-                results.get('passed_tests', 0),
-                results.get('failed_tests', 0),
-                results.get('coverage', {}).get('functional', 0.0),
-                results.get('coverage', {}).get('code', 0.0),
-                results.get('coverage', {}).get('toggle', 0.0),
-                results.get('coverage', {}).get('fsm', 0.0),
-                results.get('runtime_seconds', 0),
-                results.get('simulation_speed_khz', 0.0),
-                results.get('memory_usage_gb', 0.0)
-            ))
-            
-            self.conn.commit()
+            self.ingest(results)
             print(f"✓ Imported test results from {test_results_file}")
             
         except Exception as e:
             print(f"✗ Error importing test results: {e}")
     
-    def generate_test_status_chart(self):
+    def collect_compile_metrics(self, compile_stats_file):
+        """Collect compile telemetry written by compile_telemetry.py"""
+        try:
+            with open(compile_stats_file, 'r') as f:
+                stats = json.load(f)
+            
+            base = (
+                self.db_timestamp(stats.get('timestamp') or datetime.now(timezone.utc).isoformat()),
+                stats.get('branch_name', 'unknown'),
+                stats.get('commit_hash', ''),
+                stats.get('run_id')
+            )
+            rows = [base + (unit['kind'], unit['name'], unit['functions'], unit['basic_blocks'], None)
+                    for unit in stats.get('units', [])]
+            rows += [base + ('phase', phase, None, None, seconds)
+                     for phase, seconds in stats.get('phase_seconds', {}).items()]
+            
+            def insert():
+                with self.conn:
+                    self.conn.executemany('''
+                        INSERT INTO compile_stats (
+                            timestamp, branch_name, commit_hash, run_id,
+                            kind, name, functions, basic_blocks, seconds
+                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    ''', rows)
+            
+            self.retry_write(insert)
+            print(f"✓ Imported compile telemetry from {compile_stats_file}")
+            
+        except Exception as e:
+            print(f"✗ Error importing compile telemetry: {e}")
+    
+    def load_chart_data(self):
+        """test_runs rows of the chart window as one typed DataFrame
+        
+        Runs CHART_QUERY: one database round trip, and time stamps parsed
+        once, for all the test_runs charts and the health score of a build.
+        """
+        import pandas as pd
+        
+        return pd.read_sql_query(CHART_QUERY, self.conn, parse_dates=['timestamp'],
+                                 dtype=dict(CHART_COLUMNS, recent='bool'))
+    
+    def generate_test_status_chart(self, runs=None):
         """Generate test execution status chart"""
-        query = '''
-            SELECT timestamp, passed_tests, failed_tests, total_tests
-            FROM test_runs
-            WHERE timestamp >= datetime('now', '-30 days')
-            ORDER BY timestamp
-        '''
+        import plotly.graph_objects as go
+        from plotly.subplots import make_subplots
         
-        df = pd.read_sql_query(query, self.conn)
-        df['timestamp'] = pd.to_datetime(df['timestamp'])
-        df['pass_rate'] = (df['passed_tests'] / df['total_tests'] * 100).round(2)
+        df = runs if runs is not None else self.load_chart_data()
+        pass_rate = (df['passed_tests'] / df['total_tests'] * 100).round(2)
         
         fig = make_subplots(
             rows=2, cols=1,
@@ -206,7 +632,7 @@ class UVMDashboard:
         
         # Pass rate trend
         fig.add_trace(
-            go.Scatter(x=df['timestamp'], y=df['pass_rate'], 
+            go.Scatter(x=df['timestamp'], y=pass_rate, 
                       name='Pass Rate %', line=dict(color='blue')),
             row=2, col=1
         )
@@ -222,21 +648,14 @@ class UVMDashboard:
             showlegend=True
         )
         
-        fig.write_html(self.output_dir / 'test_status.html')
+        fig.write_html(self.output_path('test_status.html'))
         return fig
     
-    def generate_coverage_dashboard(self):
+    def generate_coverage_dashboard(self, runs=None):
         """Generate coverage analysis dashboard"""
-        query = '''
-            SELECT timestamp, coverage_functional, coverage_code, 
-                   coverage_toggle, coverage_fsm
-            FROM test_runs
-            WHERE timestamp >= datetime('now', '-30 days')
-            ORDER BY timestamp
-        '''
+        import plotly.graph_objects as go
         
-        df = pd.read_sql_query(query, self.conn)
-        df['timestamp'] = pd.to_datetime(df['timestamp'])
+        df = runs if runs is not None else self.load_chart_data()
         
         fig = go.Figure()
         
@@ -266,23 +685,17 @@ class UVMDashboard:
             yaxis=dict(range=[0, 100])
         )
         
-        fig.write_html(self.output_dir / 'coverage_trends.html')
+        fig.write_html(self.output_path('coverage_trends.html'))
         return fig
     
-    def generate_performance_metrics(self):
+    def generate_performance_metrics(self, runs=None):
         """Generate performance metrics dashboard"""
-        query = '''
-            SELECT timestamp, runtime_seconds, simulation_speed_khz, 
-                   memory_usage_gb, total_tests
-            FROM test_runs
-            WHERE timestamp >= datetime('now', '-30 days')
-            ORDER BY timestamp
-        '''
+        import plotly.graph_objects as go
+        from plotly.subplots import make_subplots
         
-        df = pd.read_sql_query(query, self.conn)
-        df['timestamp'] = pd.to_datetime(df['timestamp'])
-        df['runtime_hours'] = df['runtime_seconds'] / 3600
-        df['tests_per_hour'] = df['total_tests'] / df['runtime_hours']
+        df = runs if runs is not None else self.load_chart_data()
+        runtime_hours = df['runtime_seconds'] / 3600
+        tests_per_hour = df['total_tests'] / runtime_hours
         
         fig = make_subplots(
             rows=2, cols=2,
@@ -293,7 +706,7 @@ class UVMDashboard:
         )
         
         fig.add_trace(
-            go.Scatter(x=df['timestamp'], y=df['runtime_hours'], 
+            go.Scatter(x=df['timestamp'], y=runtime_hours, 
                       name='Runtime (hours)', line=dict(color='blue')),
             row=1, col=1
         )
@@ -311,7 +724,7 @@ class UVMDashboard:
         )
         
         fig.add_trace(
-            go.Scatter(x=df['timestamp'], y=df['tests_per_hour'], 
+            go.Scatter(x=df['timestamp'], y=tests_per_hour, 
                       name='Tests/Hour', line=dict(color='orange')),
             row=2, col=2
         )
@@ -322,17 +735,66 @@ class UVMDashboard:
             showlegend=True
         )
         
-        fig.write_html(self.output_dir / 'performance_metrics.html')
+        fig.write_html(self.output_path('performance_metrics.html'))
         return fig
     
-    def generate_project_health_score(self):
-        """Calculate and display project health score"""
+    def generate_compile_metrics(self):
+        """Generate compile cost growth chart per package and build phase"""
+        import pandas as pd
+        import plotly.graph_objects as go
+        from plotly.subplots import make_subplots
+        
         query = '''
-            SELECT * FROM test_runs
-            WHERE timestamp >= datetime('now', '-7 days')
+            SELECT timestamp, kind, name, basic_blocks, seconds
+            FROM compile_stats
+            WHERE timestamp >= datetime('now', '-90 days')
+            ORDER BY timestamp
         '''
         
         df = pd.read_sql_query(query, self.conn)
+        df['timestamp'] = pd.to_datetime(df['timestamp'])
+        packages = df[df['kind'] == 'package']
+        # Each import holds the median phase times of its builds; one bar per day
+        # stacks the median over that day's imports
+        phases = df[df['kind'] == 'phase']
+        phases = (phases.assign(day=phases['timestamp'].dt.floor('D'))
+                  .groupby(['name', 'day'], sort=False)['seconds'].median().reset_index())
+        
+        fig = make_subplots(
+            rows=2, cols=1,
+            subplot_titles=('Basic Blocks per Package', 'Build Phase Time (daily median)')
+        )
+        
+        # Basic blocks track the code each package hands to the compiler
+        for name, group in packages.groupby('name'):
+            fig.add_trace(
+                go.Scatter(x=group['timestamp'], y=group['basic_blocks'],
+                          name=name, mode='lines+markers'),
+                row=1, col=1
+            )
+        
+        for name, group in phases.groupby('name', sort=False):
+            fig.add_trace(
+                go.Bar(x=group['day'], y=group['seconds'], name=name),
+                row=2, col=1
+            )
+        
+        fig.update_layout(
+            title='Compile/Elaboration Cost (Last 90 Days)',
+            height=800,
+            barmode='stack',
+            showlegend=True
+        )
+        fig.update_yaxes(title_text='Basic blocks', row=1, col=1)
+        fig.update_yaxes(title_text='Seconds', row=2, col=1)
+        
+        fig.write_html(self.output_path('compile_metrics.html'))
+        return fig
+    
+    def generate_project_health_score(self, runs=None):
+        """Calculate and display project health score (from the last 7 days of the chart data)"""
+        runs = runs if runs is not None else self.load_chart_data()
+        df = runs[runs['recent']]
         
         if df.empty:
             return {"health_score": 0, "status": "No data available"}
@@ -393,10 +855,10 @@ class UVMDashboard:
             }
         }
     
-    def generate_summary_dashboard(self):
+    def generate_summary_dashboard(self, runs=None):
         """Generate main summary dashboard"""
         # Get project health
-        health = self.generate_project_health_score()
+        health = self.generate_project_health_score(runs)
         
         # Create summary HTML
         html_content = f"""
@@ -476,6 +938,7 @@ class UVMDashboard:
                 <li><a href="test_status.html">Test Execution Status</a></li>
                 <li><a href="coverage_trends.html">Coverage Analysis</a></li>
                 <li><a href="performance_metrics.html">Performance Metrics</a></li>
+                <li><a href="compile_metrics.html">Compile Metrics</a></li>
             </ul>
             
             <div class="timestamp">
@@ -485,7 +948,7 @@ class UVMDashboard:
         </html>
         """
         
-        with open(self.output_dir / 'index.html', 'w') as f:
+        with open(self.output_path('index.html'), 'w') as f:
             f.write(html_content)
         
         print(f"✓ Summary dashboard generated: {self.output_dir / 'index.html'}")
@@ -495,16 +958,22 @@ class UVMDashboard:
         print("Generating UVM Project Dashboard...")
         
         try:
-            self.generate_test_status_chart()
+            # One query and one parse of test_runs, shared by every chart
+            runs = self.load_chart_data()
+            
+            self.generate_test_status_chart(runs)
             print("✓ Test status chart generated")
             
-            self.generate_coverage_dashboard()
+            self.generate_coverage_dashboard(runs)
             print("✓ Coverage dashboard generated")
             
-            self.generate_performance_metrics()
+            self.generate_performance_metrics(runs)
             print("✓ Performance metrics generated")
             
-            self.generate_summary_dashboard()
+            self.generate_compile_metrics()
+            print("✓ Compile metrics generated")
+            
+            self.generate_summary_dashboard(runs)
             print("✓ Summary dashboard generated")
             
             print(f"\n🎉 Dashboard generation complete!")
@@ -526,7 +995,7 @@ class UVMDashboard:
         cursor = self.conn.cursor()
         
         # Generate 30 days of sample data
-        base_date = datetime.now() - timedelta(days=30)
+        base_date = datetime.now(timezone.utc) - timedelta(days=30)
         
         for day in range(30):
             current_date = base_date + timedelta(days=day)
@@ -542,7 +1011,7 @@ class UVMDashboard:
                     runtime_seconds, simulation_speed_khz, memory_usage_gb
                 ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
             ''', (
-                current_date.isoformat(),
+                current_date.strftime('%Y-%m-%d %H:%M:%S'),
                 'develop',
                 f'abc{random.randint(1000, 9999)}',
                 'regression',
@@ -567,10 +1036,26 @@ def main():
                        help='Configuration file path')
     parser.add_argument('--import-results', 
                        help='Import test results from JSON file')
+    parser.add_argument('--bulk-import', nargs='+', metavar='INPUT',
+                       help='Import many results: JSON files, directories, globs, .jsonl streams or - (JSONL on stdin)')
+    parser.add_argument('--batch-size', type=int, default=5000,
+                       help='Rows per transaction for --bulk-import (default: 5000)')
+    parser.add_argument('-j', '--jobs', type=int, default=None,
+                       help='Worker processes parsing files for --bulk-import (default: CPU count)')
+    parser.add_argument('--submit', nargs='+', metavar='RESULTS',
+                       help='Queue results JSON files for the ingest server (ingest_spool) instead of writing the database')
+    parser.add_argument('--serve-ingest', action='store_true',
+                       help='Run the single-writer ingest server for ingest_spool')
+    parser.add_argument('--once', action='store_true',
+                       help='With --serve-ingest, exit once the spool is empty')
+    parser.add_argument('--import-compile',
+                       help='Import compile telemetry from JSON file (compile_telemetry.py)')
     parser.add_argument('--generate', action='store_true',
                        help='Generate dashboard')
     parser.add_argument('--sample-data', action='store_true',
                        help='Generate sample data for demonstration')
+    parser.add_argument('--check-indexes', action='store_true',
+                       help='Show the query plans of the dashboard queries; fails if any scans a whole table')
     
     args = parser.parse_args()
     
@@ -582,154 +1067,31 @@ def main():
     if args.import_results:
         dashboard.collect_test_metrics(args.import_results)
     
+    if args.submit:
+        for path in args.submit:
+            with open(path, 'r', encoding='utf-8') as f:
+                print(f"✓ Submitted {path} as {dashboard.submit(json.load(f))}")
+    
+    if args.serve_ingest:
+        dashboard.serve_ingest(once=args.once)
+    
+    if args.bulk_import:
+        stats = dashboard.bulk_import(args.bulk_import, args.batch_size, args.jobs)
+        print(f"✓ Imported {stats['rows']} test runs from {stats['files']} input(s) in {stats['batches']} "
+              f"transaction(s): {stats['seconds']:.2f}s, {stats['rows_per_second']:.0f} rows/s")
+        if stats['skipped']:
+            print(f"  Skipped {stats['skipped']} document(s) that are not dashboard results")
+        if stats['errors']:
+            print(f"✗ {stats['errors']} input(s) could not be read")
+    
+    if args.import_compile:
+        dashboard.collect_compile_metrics(args.import_compile)
+    
     if args.generate or len(sys.argv) == 1:
         dashboard.generate_all_dashboards()
+    
+    if args.check_indexes and not dashboard.check_query_plans():
+        sys.exit(1)
 
 if __name__ == "__main__":
     main()
-```
-
-### 2. Configuration File Template
-
-```yaml
-# Dashboard Configuration
-database_path: "verification_metrics.db"
-output_directory: "dashboard_output"
-refresh_interval_minutes: 5
-
-# Email notification settings
-email_notifications: true
-smtp_server: "smtp.company.com"
-smtp_port: 587
-email_recipients:
-  - "verification-team@company.com"
-  - "project-manager@company.com"
-
-# Coverage targets
-coverage_targets:
-  functional: 95.0
-  code: 90.0
-  toggle: 85.0
-  fsm: 100.0
-
-# Performance targets
-performance_targets:
-  simulation_speed_khz: 1000
-  memory_usage_gb: 16
-  regression_time_hours: 8
-
-# Alert thresholds
-alert_thresholds:
-  pass_rate_minimum: 90.0
-  coverage_drop_threshold: 5.0
-  performance_degradation_threshold: 20.0
-
-# Report generation
-reports:
-  daily_summary: true
-  weekly_detailed: true
-  monthly_trends: true
-```
-
-### 3. Integration Script
-
-```bash
-#!/bin/bash
-# Integration script for UVM dashboard
-
-# Setup paths
-SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
-PROJECT_ROOT="$(dirname "$SCRIPT_DIR")"
-DASHBOARD_DIR="$PROJECT_ROOT/dashboard_output"
-
-# Create dashboard directory
-mkdir -p "$DASHBOARD_DIR"
-
-# Check for test results
-if [ -f "$PROJECT_ROOT/sim/exec/test_results.json" ]; then
-    echo "Importing test results..."
-    python3 "$SCRIPT_DIR/dashboard_generator.py" \
-        --import-results "$PROJECT_ROOT/sim/exec/test_results.json"
-fi
-
-# Generate dashboard
-echo "Generating dashboard..."
-python3 "$SCRIPT_DIR/dashboard_generator.py" --generate
-
-# Open dashboard in browser (optional)
-if command -v xdg-open > /dev/null; then
-    xdg-open "$DASHBOARD_DIR/index.html"
-elif command -v open > /dev/null; then
-    open "$DASHBOARD_DIR/index.html"
-fi
-
-echo "Dashboard available at: $DASHBOARD_DIR/index.html"
-```
-
-## Installation
-
-1. **Install Dependencies**:
-   ```bash
-   pip install pandas plotly pyyaml sqlite3
-   ```
-
-2. **Create Configuration**:
-   ```bash
-   cp dashboard_config.yaml.template dashboard_config.yaml
-   # Edit configuration as needed
-   ```
-
-3. **Initialize Database**:
-   ```bash
-   python scripts/dashboard_generator.py --sample-data
-   ```
-
-4. **Generate Dashboard**:
-   ```bash
-   python scripts/dashboard_generator.py --generate
-   ```
-
-## Usage Examples
-
-### Basic Dashboard Generation
-```bash
-# Generate dashboard with sample data
-python scripts/dashboard_generator.py --sample-data --generate
-```
-
-### Import Test Results and Generate
-```bash
-# Import test results and generate dashboard
-python scripts/dashboard_generator.py \
-    --import-results sim/exec/test_results.json \
-    --generate
-```
-
-### Automated Integration
-```bash
-# Add to your CI/CD pipeline
-python scripts/dashboard_generator.py \
-    --config production_config.yaml \
-    --import-results ${TEST_RESULTS_FILE} \
-    --generate
-```
-
-## Dashboard Features
-
-### Real-time Monitoring
-- **Test Execution Status**: Pass/fail trends over time
-- **Coverage Analysis**: Functional, code, toggle, and FSM coverage tracking
-- **Performance Metrics**: Simulation speed, memory usage, runtime analysis
-- **Project Health Score**: Composite score based on multiple metrics
-
-### Trend Analysis
-- **30-day Historical View**: Track progress and identify patterns
-- **Target Comparisons**: Visual indicators for meeting project goals
-- **Performance Degradation Alerts**: Early warning system for issues
-
-### Team Productivity
-- **Commit Correlation**: Link test results to code changes
-- **Bug Discovery Rate**: Track verification effectiveness
-- **Resource Utilization**: Monitor compute resource efficiency
-
-This dashboard system provides comprehensive visibility into UVM verification project health, enabling data-driven decisions and continuous improvement of the verification process.
@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""
+UVM Failure Triage
+Clusters failing simulations by failure signature: the first UVM_ERROR or
+UVM_FATAL message of each log, normalized by stripping values, times and
+instance paths, then hashed. Signatures are stored in the dashboard database
+(named in dashboard_config.yaml) so failures already seen in earlier
+regressions are recognized immediately.
+
+Author: UVM Base Generator
+Date: 2025-07-27
+"""
+
+import re
+import sys
+import json
+import hashlib
+import argparse
+from pathlib import Path
+from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Any, List, Optional
+
+from log_parser import LogParser, parse_job
+from dashboard_generator import UVMDashboard
+
+# Normalization rules, applied in order: hierarchical paths before the numbers inside them
+NORMALIZE_RULES = [
+    (re.compile(r'\b[A-Za-z_]\w*(?:\[\d+\])*(?:\.[A-Za-z_]\w*(?:\[\d+\])*)+(?:@@\w+)?'), '<path>'),
+    (re.compile(r"\b\d*'[sS]?[hHdDbBoO][0-9a-fA-F_xXzZ]+"), '<value>'),
+    (re.compile(r'\b0[xX][0-9a-fA-F_]+\b'), '<value>'),
+    (re.compile(r'\b\d+(?:\.\d+)?\s*(?:fs|ps|ns|us|ms|s)\b'), '<time>'),
+    (re.compile(r'\b[0-9a-fA-F]*\d[0-9a-fA-F]*\b'), '<n>'),
+    (re.compile(r'\s+'), ' '),
+]
+
+
+def normalize_message(message: str) -> str:
+    """Message text with values, times and instance paths replaced by placeholders."""
+    for pattern, replacement in NORMALIZE_RULES:
+        message = pattern.sub(replacement, message)
+    return message.strip()
+
+
+def failure_signature(result: Dict[str, Any]) -> Dict[str, Any]:
+    """Signature of a failed log: its first error/fatal message, else how it ended."""
+    if result['messages']:
+        message = result['messages'][0]
+        severity, report_id, text = message['severity'], message['id'], message['message']
+    elif result['dsim_fatal']:
+        severity, report_id, text = 'DSIM_ERROR', '', result['dsim_fatal'][0]
+    else:
+        severity, report_id = result['status'], ''
+        text = 'no UVM report summary' if not result['summary_found'] else 'no UVM_ERROR/UVM_FATAL message'
+
+    signature = f"{severity} [{report_id}] {normalize_message(text)}"
+    return {
+        'signature': signature,
+        'hash': hashlib.sha1(signature.encode()).hexdigest()[:12],
+        'severity': severity,
+        'report_id': report_id,
+        'example': text,
+    }
+
+
+def triage_job(entry: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Signature of one job's failure, or None when it passed (runs in a worker process)."""
+    result = parse_job(entry, max_messages=1)
+    if result['status'] == 'PASS':
+        return None
+
+    failure = failure_signature(result)
+    failure.update({key: result.get(key) for key in
+                    ('test', 'seed', 'status', 'log', 'final_time', 'time_unit', 'wall_seconds')})
+    # Jobs from a regression results.json can be rerun by test name and seed
+    failure['rerunnable'] = 'id' in entry
+    return failure
+
+
+class SignatureStore:
+    """Failure signatures and their occurrences in the dashboard database."""
+
+    def __init__(self, dashboard_config: str):
+        """Open the dashboard database of a dashboard config; its schema migrations create the triage tables."""
+        self.dashboard = UVMDashboard(dashboard_config)
+        self.conn = self.dashboard.conn
+
+    def known(self, signature_hash: str) -> Optional[Dict[str, Any]]:
+        """Earlier history of a signature, or None when it is new."""
+        row = self.conn.execute('''
+            SELECT first_seen, last_seen, runs_seen, total_failures FROM failure_signatures
+            WHERE signature_hash = ?
+        ''', (signature_hash,)).fetchone()
+        if not row:
+            return None
+        return {'first_seen': row[0], 'last_seen': row[1], 'runs_seen': row[2], 'total_failures': row[3]}
+
+    def record(self, run_id: str, buckets: List[Dict[str, Any]]):
+        """Store this run's buckets and update the signature history."""
+        now = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        self.dashboard.retry_write(lambda: self.insert(run_id, buckets, now))
+
+    def insert(self, run_id: str, buckets: List[Dict[str, Any]], now: str):
+        """Write the buckets in one transaction."""
+        with self.conn:
+            cursor = self.conn.cursor()
+            for bucket in buckets:
+                cursor.execute('''
+                    INSERT INTO failure_signatures (signature_hash, signature, severity, report_id,
+                                                    first_seen, last_seen, runs_seen, total_failures)
+                    VALUES (?, ?, ?, ?, ?, ?, 1, ?)
+                    ON CONFLICT(signature_hash) DO UPDATE SET
+                        last_seen = excluded.last_seen,
+                        runs_seen = runs_seen + 1,
+                        total_failures = total_failures + excluded.total_failures
+                ''', (bucket['hash'], bucket['signature'], bucket['severity'], bucket['report_id'],
+                      now, now, bucket['count']))
+                reproducer = bucket['reproducer']
+                cursor.execute('''
+                    INSERT INTO failure_occurrences (timestamp, run_id, signature_hash, failures, first_test, first_seed,
+                                                     reproducer_test, reproducer_seed, reproducer_sim_time, reproducer_log)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ''', (now, run_id, bucket['hash'], bucket['count'], bucket['first_test'], bucket['first_seed'],
+                      reproducer['test'], reproducer['seed'], reproducer['final_time'], reproducer['log']))
+
+    def close(self):
+        """Close the database."""
+        self.conn.close()
+
+
+class FailureTriage:
+    """Buckets the failures of many logs by signature in one streaming pass."""
+
+    def __init__(self, jobs: int = None):
+        """Configure the number of worker processes."""
+        self.jobs = jobs
+
+    @staticmethod
+    def reproducer_key(failure: Dict[str, Any]) -> tuple:
+        """Shortest reproducer first: least simulated time, then least wall time."""
+        final_time = failure['final_time'] if failure['final_time'] is not None else float('inf')
+        wall = failure['wall_seconds'] if failure['wall_seconds'] is not None else float('inf')
+        return final_time, wall
+
+    def triage(self, inputs: List[str]) -> Dict[str, Any]:
+        """Parse every log and group the failures into signature buckets."""
+        entries, regressions = LogParser.expand_inputs(inputs)
+        buckets: Dict[str, Dict[str, Any]] = {}
+        failed = 0
+
+        with ProcessPoolExecutor(max_workers=self.jobs) as pool:
+            # Results are folded into the buckets as they arrive; nothing per log is kept
+            for failure in pool.map(triage_job, entries, chunksize=max(1, len(entries) // 256)):
+                if failure is None:
+                    continue
+                failed += 1
+                bucket = buckets.get(failure['hash'])
+                if bucket is None:
+                    bucket = buckets[failure['hash']] = {
+                        key: failure[key] for key in ('hash', 'signature', 'severity', 'report_id', 'example')}
+                    bucket.update({'count': 0, 'tests': {}, 'first_test': failure['test'],
+                                   'first_seed': failure['seed'], 'reproducer': failure})
+                bucket['count'] += 1
+                bucket['tests'][failure['test']] = bucket['tests'].get(failure['test'], 0) + 1
+                if self.reproducer_key(failure) < self.reproducer_key(bucket['reproducer']):
+                    bucket['reproducer'] = failure
+
+        run_ids = [r['run_id'] for r in regressions if r.get('run_id')]
+        return {
+            'run_id': ','.join(run_ids) or datetime.now().strftime('%Y%m%d_%H%M%S'),
+            'logs': len(entries),
+            'failures': failed,
+            'buckets': sorted(buckets.values(), key=lambda b: -b['count']),
+        }
+
+
+def main():
+    """Main function with command line argument parsing."""
+    parser = argparse.ArgumentParser(description="Cluster regression failures by normalized error signature")
+    parser.add_argument("inputs", nargs="+",
+                       help="Log files, glob patterns, or regression results.json files")
+    parser.add_argument("-j", "--jobs", type=int, default=None,
+                       help="Worker processes (default: CPU count)")
+    parser.add_argument("--config", default="dashboard_config.yaml",
+                       help="Dashboard config naming the database that holds the signature history "
+                            "(default: dashboard_config.yaml)")
+    parser.add_argument("--no-store", action="store_true",
+                       help="Compare against the history without recording this run")
+    parser.add_argument("-o", "--output", help="Write the buckets as JSON")
+
+    args = parser.parse_args()
+
+    try:
+        report = FailureTriage(args.jobs).triage(args.inputs)
+    except (OSError, ValueError) as e:
+        print(f"ERROR: {e}")
+        sys.exit(1)
+
+    store = SignatureStore(args.config)
+    for bucket in report['buckets']:
+        bucket['history'] = store.known(bucket['hash'])
+    if not args.no_store:
+        store.record(report['run_id'], report['buckets'])
+    store.close()
+
+    print(f"Logs: {report['logs']}  Failures: {report['failures']}  Signatures: {len(report['buckets'])}")
+    for bucket in report['buckets']:
+        history = bucket['history']
+        seen = (f"seen in {history['runs_seen']} earlier run(s) since {history['first_seen']}"
+                if history else "NEW")
+        reproducer = bucket['reproducer']
+        print()
+        print(f"[{bucket['hash']}] {bucket['count']} failure(s) - {seen}")
+        print(f"  {bucket['signature']}")
+        print(f"  e.g. {bucket['example']}")
+        print(f"  tests: {', '.join(f'{test} ({count})' for test, count in bucket['tests'].items())}")
+        print(f"  first: {bucket['first_test']} seed {bucket['first_seed']}")
+        print(f"  shortest reproducer: {reproducer['test']} seed {reproducer['seed']} "
+              f"(ends at {reproducer['final_time']}, {reproducer['log']})")
+        if reproducer['rerunnable']:
+            print(f"    python scripts/regression_runner.py {reproducer['test']} -s {reproducer['seed']} -p debug")
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, indent=2), encoding='utf-8')
+        print(f"\nBuckets written to {args.output}")
+
+    sys.exit(0 if report['failures'] == 0 else 1)
+
+if __name__ == "__main__":
+    main()
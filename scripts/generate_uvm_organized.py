@@ -8,17 +8,33 @@ Date: 2025-07-27
 """
 
 import os
+import re
+import csv
 import sys
 import yaml
 import shutil
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Iterator
 import argparse
 from datetime import datetime
 
 class UVMGenerator:
     """Main UVM environment generator class with organized directory structure."""
     
+    # Registers built per generated build function in the register model
+    REG_BUILD_CHUNK = 1000
+    
+    # Buffered trace words written per $fwrite call by the trace writer
+    TRACE_WRITE_WORDS = 64
+    
+    # Run profiles used when config.yaml has no run_profiles section
+    DEFAULT_RUN_PROFILES = {
+        'debug': {'waves': True, 'access': '+acc+b', 'verbosity': None, 'plusargs': []},
+        'regression': {'waves': False, 'access': '', 'verbosity': 'UVM_LOW', 'plusargs': ['+UVM_NO_RELNOTES']},
+        'perf': {'waves': False, 'access': '', 'verbosity': 'UVM_NONE', 'plusargs': ['+UVM_NO_RELNOTES']},
+        'rerun': {'waves': True, 'access': '+acc+rwb', 'verbosity': 'UVM_HIGH', 'plusargs': []},
+    }
+    
     def __init__(self, config_file: str = "config.yaml"):
         """Initialize the generator with configuration file."""
         self.config_file = config_file
@@ -82,6 +98,7 @@ class UVMGenerator:
                 'sequences',      # Sequence classes
                 'agents',         # Agent, driver, monitor
                 'env',           # Environment and scoreboard
+                'reg',           # Register model (uvm_reg)
                 'tests'          # Test classes
             ]
             
@@ -110,13 +127,57 @@ class UVMGenerator:
         module_name = self.config['dut']['module_name']
         interface_name = self.config['dut']['interface_name']
         timescale = self.config['simulation']['timescale']
+        end_of_test = self.config.get('end_of_test', {})
+        watchdog = self.config.get('watchdog', {})
+        coverage = self.config.get('coverage', {})
+        scoreboard = self.config.get('scoreboard', {})
+        dpi_model = self.config.get('dpi_model', {})
+        trace = self.config.get('trace', {})
+        trace_layout, trace_record_words, trace_pack, trace_enum_layout = self.build_trace_layout()
+        field_types = {f['name']: f['type'] for f in self.config.get('transaction', {}).get('fields', [])}
+        addr_sv, addr_c = self.get_dpi_types(field_types.get('address', 'bit [31:0]'))
+        data_sv, data_c = self.get_dpi_types(field_types.get('data', 'bit [31:0]'))
         
         substitutions = {
             # Module name placeholders
             '{module_name}': module_name,
+            '{module_upper}': module_name.upper(),
             '{interface_name}': interface_name,
             '{timestamp}': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
             '{timescale}': timescale,
+            # End-of-test settings
+            '{eot_drain_time_ns}': str(end_of_test.get('drain_time_ns', 20)),
+            '{eot_idle_cycles}': str(end_of_test.get('idle_cycles', 4)),
+            # Hang watchdog settings
+            '{watchdog_enabled}': '1' if watchdog.get('enabled', True) else '0',
+            '{watchdog_heartbeat_ns}': str(watchdog.get('heartbeat_interval_ns', 10000)),
+            '{watchdog_timeout_ns}': str(watchdog.get('hang_timeout_ns', 100000)),
+            '{watchdog_heartbeat_verbosity}': watchdog.get('heartbeat_verbosity', 'UVM_LOW'),
+            # Functional coverage settings
+            '{coverage_enabled}': '1' if coverage.get('enabled', True) else '0',
+            '{coverage_goal}': str(float(coverage.get('goal_percent', 100.0))),
+            '{coverage_max_transactions}': str(coverage.get('max_transactions', 2000)),
+            '{coverage_stall_window}': str(coverage.get('stall_window', 200)),
+            '{coverpoints}': self.build_coverpoints(),
+            # Scoreboard settings
+            '{address_type}': field_types.get('address', 'bit [31:0]'),
+            '{data_type}': field_types.get('data', 'bit [31:0]'),
+            '{scoreboard_max_outstanding}': str(scoreboard.get('max_outstanding', 1024)),
+            # DPI-C reference model settings
+            '{dpi_batch_size}': str(dpi_model.get('batch_size', 64)),
+            '{dpi_addr_sv}': addr_sv,
+            '{dpi_addr_c}': addr_c,
+            '{dpi_data_sv}': data_sv,
+            '{dpi_data_c}': data_c,
+            # Binary transaction trace settings
+            '{trace_layout}': trace_layout,
+            '{trace_record_words}': str(trace_record_words),
+            '{trace_pack}': trace_pack,
+            '{trace_enum_layout}': trace_enum_layout,
+            '{trace_buffer_records}': str(trace.get('buffer_records', 256)),
+            '{trace_write_words}': str(self.TRACE_WRITE_WORDS),
+            '{trace_write_format}': '%u' * self.TRACE_WRITE_WORDS,
+            '{trace_write_args}': self.build_trace_write_args(),
             # Specific class names to be replaced
             'register_file': module_name,
             'register_file_if': interface_name,
@@ -139,6 +200,137 @@ class UVMGenerator:
         
         return substitutions
     
+    def get_run_profiles(self) -> Dict[str, Dict[str, Any]]:
+        """Return run profiles from config.yaml with missing settings filled in."""
+        profiles = self.config.get('run_profiles') or self.DEFAULT_RUN_PROFILES
+        defaults = self.DEFAULT_RUN_PROFILES['debug']
+        return {name: {**defaults, **(settings or {})} for name, settings in profiles.items()}
+    
+    def get_field_width(self, field_type: str) -> int:
+        """Return the bit width of a transaction field type (0 for enum/user types)."""
+        field_type = field_type.strip()
+        if field_type in ('bit', 'logic'):
+            return 1
+        
+        match = re.match(r'^(?:bit|logic)\s*\[\s*(\d+)\s*:\s*(\d+)\s*\]$', field_type)
+        if match:
+            return abs(int(match.group(1)) - int(match.group(2))) + 1
+        
+        return 0
+    
+    def get_dpi_types(self, field_type: str) -> tuple:
+        """Return the (SystemVerilog, C) DPI argument types for a transaction field."""
+        if self.get_field_width(field_type) > 32:
+            return 'longint unsigned', 'uint64_t'
+        return 'int unsigned', 'uint32_t'
+    
+    def build_trace_layout(self) -> tuple:
+        """Build the binary trace record layout from transaction.fields.
+        
+        Returns (layout text, record words, SV pack statements, SV enum layout statements).
+        Enumerated fields are stored as u4 and their encodings are added to the
+        layout text at run time.
+        """
+        module_name = self.config['dut']['module_name']
+        time_unit = self.config['simulation']['timescale'].split('/')[0].strip()
+        
+        layout = [f"timeunit={time_unit}", "time:u8"]
+        record_words = 2
+        pack = []
+        enum_layout = []
+        
+        for field in self.config.get('transaction', {}).get('fields', []):
+            name = field['name']
+            width = self.get_field_width(field['type'])
+            
+            if width == 0:
+                layout.append(f"{name}:u4")
+                pack.append(f"        push_u32(32'(trans.{name}));")
+                enum_type = f"{module_name}_transaction::{field['type']}"
+                enum_layout.extend([
+                    "        begin",
+                    f"            {enum_type} value;",
+                    "            value = value.first();",
+                    f"            layout = {{layout, \";enum.{name}=\"}};",
+                    "            repeat (value.num()) begin",
+                    "                layout = {layout, $sformatf(\"%s:%0d,\", value.name(), value)};",
+                    "                value = value.next();",
+                    "            end",
+                    "        end",
+                ])
+                record_words += 1
+            elif width <= 32:
+                layout.append(f"{name}:u4")
+                pack.append(f"        push_u32(32'(trans.{name}));")
+                record_words += 1
+            elif width <= 64:
+                layout.append(f"{name}:u8")
+                pack.append(f"        push_u64(64'(trans.{name}));")
+                record_words += 2
+            else:
+                # Wider fields are stored as raw words, least significant first
+                words = (width + 31) // 32
+                layout.append(f"{name}:V{words * 4}")
+                for word in range(words):
+                    shift = f" >> {word * 32}" if word else ""
+                    pack.append(f"        push_u32(32'(trans.{name}{shift}));")
+                record_words += words
+        
+        return ';'.join(layout), record_words, '\n'.join(pack), '\n'.join(enum_layout)
+    
+    def build_trace_write_args(self) -> str:
+        """Build the $fwrite argument list of one trace writer block (buffer[i] .. buffer[i + N - 1])."""
+        args = [f"buffer[i + {word}]" for word in range(self.TRACE_WRITE_WORDS)]
+        lines = [', '.join(args[start:start + 8]) for start in range(0, len(args), 8)]
+        return (',\n' + ' ' * 20).join(lines)
+    
+    def build_coverpoints(self) -> str:
+        """Build covergroup coverpoints and crosses from transaction.fields."""
+        coverage = self.config.get('coverage', {})
+        max_value_bins = coverage.get('max_value_bins', 16)
+        fields = [f for f in self.config.get('transaction', {}).get('fields', [])
+                  if f.get('coverage', True)]
+        
+        lines = []
+        enum_fields = []
+        value_fields = []
+        
+        for field in fields:
+            name = field['name']
+            width = self.get_field_width(field['type'])
+            
+            if width == 0:
+                # Enumerated type: one automatic bin per literal
+                lines.append(f"        {name}_cp: coverpoint trans.{name};")
+                enum_fields.append(name)
+            elif width == 1 or (1 << width) <= max_value_bins:
+                # Narrow field: one bin per value
+                lines.append(f"        {name}_cp: coverpoint trans.{name} {{")
+                lines.append(f"            bins values[] = {{[0:{(1 << width) - 1}]}};")
+                lines.append("        }")
+                if width > 1:
+                    value_fields.append(name)
+            else:
+                # Wide field: corner bins plus low/high ranges
+                split = 1 << (width // 2)
+                all_ones = (1 << width) - 1
+                lines.append(f"        {name}_cp: coverpoint trans.{name} {{")
+                lines.append(f"            bins zero     = {{0}};")
+                lines.append(f"            bins all_ones = {{{width}'h{all_ones:X}}};")
+                lines.append(f"            bins low      = {{[1:{width}'h{split - 1:X}]}};")
+                lines.append(f"            bins high     = {{[{width}'h{split:X}:{width}'h{all_ones - 1:X}]}};")
+                lines.append("        }")
+        
+        # Crosses: explicit list from config, otherwise every enum x narrow field
+        crosses = coverage.get('crosses')
+        if crosses is None:
+            crosses = [[e, v] for e in enum_fields for v in value_fields]
+        for cross in crosses:
+            points = ', '.join(f"{name}_cp" for name in cross)
+            lines.append(f"        {'_x_'.join(cross)}_cross: cross {points};")
+        
+        return '\n'.join(lines)
+    
     def generate_file_from_template(self, template_file: str, output_file: str, 
                                   additional_subs: Dict[str, str] = None) -> bool:
         """Generate output file from template with substitutions."""
@@ -210,16 +402,229 @@ endpackage
             print(f"ERROR generating package file: {e}")
             return False
     
+    def iter_register_map(self) -> Iterator[Dict[str, Any]]:
+        """Yield registers one at a time from config.yaml or a streamed CSV register map.
+        
+        CSV format (one row per field, rows of a register must be consecutive):
+        register,offset,hdl_path,field,lsb,width,access,reset
+        """
+        reg_config = self.config.get('register_model', {}) or {}
+        registers_file = reg_config.get('registers_file')
+        
+        if not registers_file:
+            for register in reg_config.get('registers', []) or []:
+                yield register
+            return
+        
+        with open(self.base_dir / registers_file, 'r', newline='', encoding='utf-8') as f:
+            register = None
+            for row in csv.DictReader(f):
+                if register is None or row['register'] != register['name']:
+                    if register is not None:
+                        yield register
+                    register = {
+                        'name': row['register'],
+                        'offset': row['offset'],
+                        'hdl_path': row.get('hdl_path', ''),
+                        'fields': []
+                    }
+                register['fields'].append({
+                    'name': row['field'],
+                    'lsb': row['lsb'],
+                    'width': row['width'],
+                    'access': row.get('access') or 'RW',
+                    'reset': row.get('reset') or 0
+                })
+            if register is not None:
+                yield register
+    
+    def get_register_layout(self, register: Dict[str, Any]) -> tuple:
+        """Return the field layout signature shared by registers of the same type."""
+        return tuple(
+            (field['name'], int(str(field['lsb']), 0), int(str(field['width']), 0),
+             str(field.get('access', 'RW')).upper())
+            for field in register['fields']
+        )
+    
+    def generate_register_model(self) -> bool:
+        """Generate uvm_reg register model, streaming the register map.
+        
+        Registers sharing a field layout share one uvm_reg class, and the block's
+        build() is split into chunks so very large maps stay compilable.
+        """
+        try:
+            module_name = self.config['dut']['module_name']
+            reg_config = self.config.get('register_model', {}) or {}
+            data_width = reg_config.get('data_width', 32)
+            n_bytes = (data_width + 7) // 8
+            hdl_root = reg_config.get('hdl_root', f'{module_name}_tb.dut')
+            read_only = ('RO', 'RC', 'RS')
+            
+            # Pass 1: collect unique field layouts (memory scales with layouts, not registers)
+            layouts = {}
+            register_count = 0
+            for register in self.iter_register_map():
+                layouts.setdefault(self.get_register_layout(register), len(layouts))
+                register_count += 1
+            
+            model_file = self.base_dir / self.config['directories']['sim_uvm'] / "reg" / f"{module_name}_reg_model.sv"
+            model_file.parent.mkdir(parents=True, exist_ok=True)
+            
+            with open(model_file, 'w', encoding='utf-8') as f:
+                f.write(f'''`timescale {self.config['simulation']['timescale']}
+
+// {module_name} Register Model
+// Generated by UVM Base Generator on {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
+// {register_count} registers, {len(layouts)} register layouts
+''')
+                
+                # Register layout classes
+                for layout, index in layouts.items():
+                    description = ', '.join(f"{name}[{lsb + width - 1}:{lsb}] {access}"
+                                            for name, lsb, width, access in layout)
+                    f.write(f"\n// Register layout: {description}\n")
+                    f.write(f"class {module_name}_reg_type_{index} extends uvm_reg;\n")
+                    f.write(f"    \n    `uvm_object_utils({module_name}_reg_type_{index})\n    \n")
+                    for name, lsb, width, access in layout:
+                        rand = '' if access in read_only else 'rand '
+                        f.write(f"    {rand}uvm_reg_field {name};\n")
+                    f.write(f"    \n    function new(string name = \"{module_name}_reg_type_{index}\");\n")
+                    f.write(f"        super.new(name, {data_width}, UVM_NO_COVERAGE);\n")
+                    f.write("    endfunction\n    \n    virtual function void build();\n")
+                    for name, lsb, width, access in layout:
+                        is_rand = 0 if access in read_only else 1
+                        f.write(f"        {name} = uvm_reg_field::type_id::create(\"{name}\");\n")
+                        f.write(f"        {name}.configure(this, {width}, {lsb}, \"{access}\", 0, 0, 1, {is_rand}, 0);\n")
+                    f.write("    endfunction\n    \nendclass\n")
+                
+                # Register block: handles
+                f.write(f"\n// Register block\nclass {module_name}_reg_block extends uvm_reg_block;\n")
+                f.write(f"    \n    `uvm_object_utils({module_name}_reg_block)\n    \n")
+                for register in self.iter_register_map():
+                    index = layouts[self.get_register_layout(register)]
+                    f.write(f"    rand {module_name}_reg_type_{index} {register['name']};\n")
+                
+                chunk_count = (register_count + self.REG_BUILD_CHUNK - 1) // self.REG_BUILD_CHUNK
+                f.write(f'''    
+    function new(string name = "{module_name}_reg_block");
+        super.new(name, UVM_NO_COVERAGE);
+    endfunction
+    
+    virtual function void build();
+        // Word addressing: offsets match the DUT address bus
+        default_map = create_map("default_map", 0, {n_bytes}, UVM_LITTLE_ENDIAN, 0);
+        add_hdl_path("{hdl_root}");
+        
+''')
+                for chunk in range(chunk_count):
+                    f.write(f"        build_registers_{chunk}();\n")
+                f.write("        \n        lock_model();\n    endfunction\n")
+                
+                # Register block: chunked build functions
+                for position, register in enumerate(self.iter_register_map()):
+                    if position % self.REG_BUILD_CHUNK == 0:
+                        if position:
+                            f.write("    endfunction\n")
+                        f.write(f"    \n    virtual function void build_registers_{position // self.REG_BUILD_CHUNK}();\n")
+                    
+                    name = register['name']
+                    index = layouts[self.get_register_layout(register)]
+                    offset = int(str(register['offset']), 0)
+                    accesses = {str(field.get('access', 'RW')).upper() for field in register['fields']}
+                    rights = 'RO' if accesses <= set(read_only) else ('WO' if accesses == {'WO'} else 'RW')
+                    
+                    f.write(f"        {name} = {module_name}_reg_type_{index}::type_id::create(\"{name}\");\n")
+                    f.write(f"        {name}.configure(this, null, \"\");\n")
+                    f.write(f"        {name}.build();\n")
+                    for field in register['fields']:
+                        reset = int(str(field.get('reset', 0)), 0)
+                        if reset:
+                            f.write(f"        {name}.{field['name']}.set_reset('h{reset:X});\n")
+                    if register.get('hdl_path'):
+                        f.write(f"        {name}.add_hdl_path_slice(\"{register['hdl_path']}\", 0, {data_width});\n")
+                    f.write(f"        default_map.add_reg({name}, 'h{offset:X}, \"{rights}\");\n")
+                if register_count:
+                    f.write("    endfunction\n")
+                
+                f.write("    \nendclass\n")
+            
+            print(f"Generated: {model_file} ({register_count} registers)")
+            return True
+            
+        except Exception as e:
+            print(f"ERROR generating register model: {e}")
+            return False
+    
+    def generate_dpi_model(self) -> bool:
+        """Generate DPI-C reference model skeleton, DPI scoreboard and its filelist."""
+        if not self.config.get('dpi_model', {}).get('enabled', False):
+            return True
+        
+        try:
+            module_name = self.config['dut']['module_name']
+            dpi_dir = self.config['directories'].get('sim_dpi', 'sim/dpi')
+            
+            success = self.generate_file_from_template(
+                "dpi_model_template.c", f"{dpi_dir}/{module_name}_ref_model.c")
+            success = self.generate_file_from_template(
+                "dpi_scoreboard_template.sv",
+                f"{self.config['directories']['sim_uvm']}/env/{module_name}_dpi_scoreboard.sv") and success
+            
+            # Filelist: the regular testbench plus the C model, with the DPI scoreboard enabled
+            exec_path = self.base_dir / self.config['directories']['sim_exec']
+            c_source = os.path.relpath(self.base_dir / dpi_dir / f"{module_name}_ref_model.c", exec_path)
+            filelist_content = f'''// DPI-C reference model build for {module_name}
+// Generated by UVM Base Generator
+// Compiles the C model with the testbench and selects {module_name}_dpi_scoreboard
+
++define+{module_name.upper()}_DPI_MODEL
+-f {module_name}.f
+
+// C reference model
+{c_source.replace('/', chr(92))}
+'''
+            
+            filelist_file = exec_path / f"{module_name}_dpi.f"
+            with open(filelist_file, 'w', encoding='utf-8') as f:
+                f.write(filelist_content)
+            
+            print(f"Generated: {filelist_file}")
+            return success
+            
+        except Exception as e:
+            print(f"ERROR generating DPI model: {e}")
+            return False
+    
     def generate_dsim_script(self) -> bool:
         """Generate DSIM simulation script following DSIMtuto best practices with organized structure."""
         try:
             module_name = self.config['dut']['module_name']
+            profiles = self.get_run_profiles()
+            default_profile = 'debug' if 'debug' in profiles else next(iter(profiles))
+            
+            # One block per run profile setting the DSIM options it controls
+            profile_blocks = []
+            for name, profile in profiles.items():
+                if profile['waves']:
+                    wave_opts = '-waves waves\\%WAVE_FILE% +WAVE_FILE=waves\\%WAVE_FILE%'
+                else:
+                    wave_opts = '+NO_WAVES'
+                profile_blocks.append(f'''if /i "%PROFILE%"=="{name}" (
+    set PROFILE_FOUND=1
+    set ACCESS_OPTS={profile['access'] or ''}
+    set WAVE_OPTS={wave_opts}
+    set PROFILE_VERBOSITY={profile['verbosity'] or ''}
+    set EXTRA_OPTS={' '.join(profile['plusargs'])}
+)''')
+            profile_blocks = '\n'.join(profile_blocks)
+            profile_names = ', '.join(profiles)
             
             # Generate unified test runner (run.bat)
             bat_content = f'''@echo off
 REM Unified Test Execution Script for {module_name}
 REM Generated by UVM Base Generator - Based on DSIMtuto best practices
-REM Usage: run.bat [test_name]
+REM Usage: run.bat [test_name] [profile]
+REM Profiles (run_profiles in config.yaml): {profile_names} - default {default_profile}
 
 setlocal enabledelayedexpansion
 
@@ -233,7 +638,8 @@ if "%1"=="" (
     echo   {module_name.upper()} Test Runner
     echo ================================
     echo.
-    echo Usage: run.bat [test_name]
+    echo Usage: run.bat [test_name] [profile]
+    echo Profiles: {profile_names} ^(default {default_profile}^)
     echo.
     echo Available tests:
     echo ----------------
@@ -265,6 +671,21 @@ if %FOUND%==0 (
     exit /b 1
 )
 
+REM Select run profile
+set PROFILE=%2
+if "%PROFILE%"=="" set PROFILE={default_profile}
+set PROFILE_FOUND=0
+set PROFILE_VERBOSITY=
+{profile_blocks}
+
+if %PROFILE_FOUND%==0 (
+    echo ERROR: Run profile '%PROFILE%' not found
+    echo Available profiles: {profile_names}
+    exit /b 1
+)
+
+if defined PROFILE_VERBOSITY set VERBOSITY=%PROFILE_VERBOSITY%
+
 REM Check DSIM environment
 if not defined DSIM_HOME (
     echo ERROR: DSIM_HOME environment variable not set
@@ -280,6 +701,7 @@ echo Filelist: %FILELIST%
 echo Test Class: %TEST_CLASS%
 echo Wave File: %WAVE_FILE%
 echo Verbosity: %VERBOSITY%
+echo Profile: %PROFILE%
 echo DSIM_HOME: %DSIM_HOME%
 echo ================================================================================
 echo.
@@ -291,13 +713,14 @@ REM Execute DSIM simulation with organized include paths
 echo Starting DSIM simulation...
 dsim ^
     -uvm 1.2 ^
-    +acc+b ^
+    %ACCESS_OPTS% ^
     +incdir+../uvm/base +incdir+../uvm/transactions +incdir+../uvm/sequences +incdir+../uvm/agents +incdir+../uvm/env +incdir+../uvm/tests ^
     +define+UVM_NO_DEPRECATED ^
     -f %FILELIST% ^
     +UVM_TESTNAME=%TEST_CLASS% ^
     +UVM_VERBOSITY=%VERBOSITY% ^
-    -waves waves\\%WAVE_FILE% ^
+    %WAVE_OPTS% ^
+    %EXTRA_OPTS% ^
     -top {module_name}_tb
 
 set DSIM_EXIT_CODE=%ERRORLEVEL%
@@ -306,7 +729,7 @@ echo.
 if %DSIM_EXIT_CODE%==0 (
     echo ================================================================================
     echo Test '%TEST_NAME%' completed successfully!
-    echo Waveform saved to: waves\\%WAVE_FILE%
+    if not "%WAVE_OPTS%"=="+NO_WAVES" echo Waveform saved to: waves\\%WAVE_FILE%
     echo ================================================================================
 ) else (
     echo ================================================================================
@@ -323,6 +746,26 @@ exit /b %DSIM_EXIT_CODE%
                 f.write(bat_content)
             
             print(f"Generated: {bat_file}")
+            
+            # Generate regression wrapper (run_sim.sh) around scripts/regression_runner.py
+            exec_dir = self.base_dir / self.config['directories']['sim_exec']
+            root_rel = Path(os.path.relpath(self.base_dir, exec_dir)).as_posix()
+            sh_content = f'''#!/bin/bash
+# Regression runner for {module_name}
+# Generated by UVM Base Generator
+# Usage: ./run_sim.sh [test_name|pattern ...] [--jobs N] [--seeds N] [--timeout SEC] [--profile NAME]
+# Runs the tests in test_config.cfg through scripts/regression_runner.py
+
+cd "$(dirname "$0")/{root_rel}" || exit 1
+exec python3 scripts/regression_runner.py "$@"
+'''
+            
+            sh_file = exec_dir / "run_sim.sh"
+            with open(sh_file, 'w', encoding='utf-8', newline='\n') as f:
+                f.write(sh_content)
+            sh_file.chmod(0o755)
+            
+            print(f"Generated: {sh_file}")
             return True
             
         except Exception as e:
@@ -339,7 +782,10 @@ exit /b %DSIM_EXIT_CODE%
 
 {module_name}_basic|{module_name.title()} Basic Test - Write/Read operations|{module_name}.f|{module_name}_basic_test|{module_name}_basic.{self.config['simulation']['wave_format']}|UVM_MEDIUM
 {module_name}_random|{module_name.title()} Random Test - Random operations|{module_name}.f|{module_name}_random_test|{module_name}_random.{self.config['simulation']['wave_format']}|UVM_HIGH
+{module_name}_reg|{module_name.title()} Register Model Test - Backdoor preload and frontdoor check|{module_name}.f|{module_name}_reg_test|{module_name}_reg.{self.config['simulation']['wave_format']}|UVM_MEDIUM
 '''
+            if self.config.get('dpi_model', {}).get('enabled', False):
+                config_content += f"{module_name}_random_dpi|{module_name.title()} Random Test - DPI-C reference model|{module_name}_dpi.f|{module_name}_random_test|{module_name}_random_dpi.{self.config['simulation']['wave_format']}|UVM_MEDIUM\n"
             
             config_file = self.base_dir / self.config['directories']['sim_exec'] / "test_config.cfg"
             with open(config_file, 'w', encoding='utf-8') as f:
@@ -394,11 +840,15 @@ exit /b %DSIM_EXIT_CODE%
         # Template to output file mapping with new directory structure
         file_mappings = [
             ("transaction_template.sv", f"{self.config['directories']['sim_uvm']}/transactions/{self.config['dut']['module_name']}_transaction.sv"),
+            ("coverage_template.sv", f"{self.config['directories']['sim_uvm']}/env/{self.config['dut']['module_name']}_coverage.sv"),
             ("sequence_template.sv", f"{self.config['directories']['sim_uvm']}/sequences/{self.config['dut']['module_name']}_sequence.sv"),
             ("driver_template.sv", f"{self.config['directories']['sim_uvm']}/agents/{self.config['dut']['module_name']}_driver.sv"),
+            ("trace_writer_template.sv", f"{self.config['directories']['sim_uvm']}/agents/{self.config['dut']['module_name']}_trace_writer.sv"),
             ("monitor_template.sv", f"{self.config['directories']['sim_uvm']}/agents/{self.config['dut']['module_name']}_monitor.sv"),
             ("agent_template.sv", f"{self.config['directories']['sim_uvm']}/agents/{self.config['dut']['module_name']}_agent.sv"),
             ("scoreboard_template.sv", f"{self.config['directories']['sim_uvm']}/env/{self.config['dut']['module_name']}_scoreboard.sv"),
+            ("watchdog_template.sv", f"{self.config['directories']['sim_uvm']}/env/{self.config['dut']['module_name']}_watchdog.sv"),
+            ("reg_adapter_template.sv", f"{self.config['directories']['sim_uvm']}/reg/{self.config['dut']['module_name']}_reg_adapter.sv"),
             ("env_template.sv", f"{self.config['directories']['sim_uvm']}/env/{self.config['dut']['module_name']}_env.sv"),
             ("test_template.sv", f"{self.config['directories']['sim_uvm']}/tests/{self.config['dut']['module_name']}_test.sv"),
             ("pkg_template.sv", f"{self.config['directories']['sim_uvm']}/base/{self.config['dut']['module_name']}_pkg.sv"),
@@ -410,6 +860,14 @@ exit /b %DSIM_EXIT_CODE%
         for template_file, output_file in file_mappings:
             if not self.generate_file_from_template(template_file, output_file):
                 success = False
+        
+        # Generate register model
+        if not self.generate_register_model():
+            success = False
+        
+        # Generate DPI-C reference model (optional)
+        if not self.generate_dpi_model():
+            success = False
 
         # Generate simulation scripts
         if not self.generate_dsim_script():
@@ -446,6 +904,7 @@ exit /b %DSIM_EXIT_CODE%
         print("  - sim/uvm/sequences/  : Sequence classes")
         print("  - sim/uvm/agents/     : Driver, monitor, agent")
         print("  - sim/uvm/env/        : Environment and scoreboard")
+        print("  - sim/uvm/reg/        : Register model and adapter")
         print("  - sim/uvm/tests/      : Test classes")
         print(f"To run simulation: cd {self.config['directories']['sim_exec']} && .\\run.bat")
         
@@ -0,0 +1,300 @@
+#!/usr/bin/env python3
+"""
+UVM Log Archive
+Stores simulation logs compressed (zstd when the zstandard module is
+installed, otherwise gzip) as a sequence of independently compressed,
+line-aligned frames. A sidecar index records the frame offsets and the
+position of every UVM_ERROR, UVM_FATAL and report summary line, so the
+viewer can show the first error of a multi-GB log by decompressing one frame.
+
+Author: UVM Base Generator
+Date: 2025-07-27
+"""
+
+import re
+import sys
+import gzip
+import json
+import bisect
+import argparse
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Any, List, Optional, Iterator, BinaryIO
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+ARCHIVE_SUFFIXES = {'.zst': 'zstd', '.gz': 'gzip'}
+INDEX_SUFFIX = '.idx'
+INDEX_VERSION = 1
+
+# Indexed lines; like the log parser, matched after a newline so the scan skips between lines
+# (the summary's "UVM_ERROR :    0" count lines are not messages)
+MARKER_PATTERN = re.compile(rb'\n(?:(UVM_ERROR|UVM_FATAL) (?!:)|(--- UVM Report Summary ---))')
+MARKER_KINDS = ('UVM_ERROR', 'UVM_FATAL', 'summary')
+
+
+def is_archive(path: str) -> bool:
+    """True for a compressed log written by this module (or any .zst/.gz log)."""
+    return Path(path).suffix in ARCHIVE_SUFFIXES
+
+
+def open_log(path: str) -> BinaryIO:
+    """Binary stream of a log's text, decompressing archives on the fly."""
+    fmt = ARCHIVE_SUFFIXES.get(Path(path).suffix)
+    if fmt == 'gzip':
+        return gzip.open(path, 'rb')
+    if fmt == 'zstd':
+        if zstandard is None:
+            raise OSError(f"{path}: reading zstd archives needs the zstandard module")
+        return zstandard.ZstdDecompressor().stream_reader(open(path, 'rb'), read_across_frames=True,
+                                                          closefd=True)
+    return open(path, 'rb')
+
+
+def iter_log_blocks(path: str, block_bytes: int = 4 << 20) -> Iterator[bytes]:
+    """A log's text in blocks of whole lines (at most one block held in memory)."""
+    with open_log(path) as f:
+        carry = b''
+        while True:
+            data = f.read(block_bytes)
+            if not data:
+                break
+            data = carry + data
+            end = data.rfind(b'\n') + 1
+            if end == 0:
+                carry = data
+                continue
+            carry = data[end:]
+            yield data[:end]
+        if carry:
+            yield carry
+
+
+class LogArchiver:
+    """Compresses logs into seekable frames with a sidecar index."""
+
+    def __init__(self, frame_bytes: int = 1 << 20, level: Optional[int] = None, fmt: Optional[str] = None):
+        """Frames hold about frame_bytes of log text; fmt is 'zstd' or 'gzip' (default: best available)."""
+        self.fmt = fmt or ('zstd' if zstandard is not None else 'gzip')
+        if self.fmt == 'zstd' and zstandard is None:
+            raise ValueError("zstd archives need the zstandard module (pip install zstandard)")
+        self.frame_bytes = frame_bytes
+        self.level = level if level is not None else (3 if self.fmt == 'zstd' else 6)
+        self.compressor = zstandard.ZstdCompressor(level=self.level) if self.fmt == 'zstd' else None
+
+    def suffix(self) -> str:
+        """File suffix of archives in this format."""
+        return '.zst' if self.fmt == 'zstd' else '.gz'
+
+    def compress_frame(self, data: bytes) -> bytes:
+        """One independently decompressible frame (a zstd frame or a gzip member)."""
+        if self.compressor is not None:
+            return self.compressor.compress(data)
+        return gzip.compress(data, compresslevel=self.level, mtime=0)
+
+    def archive(self, log_file: str, remove: bool = True, max_markers: int = 100000) -> Dict[str, Any]:
+        """Compress log_file to <log_file><suffix> and write its index; returns the index.
+
+        Concatenated frames form a valid zstd/gzip stream, so zstdcat/zcat still
+        work. At most max_markers lines of each kind are indexed; all are counted.
+        """
+        source = Path(log_file)
+        target = source.with_name(source.name + self.suffix())
+        index = {
+            'version': INDEX_VERSION,
+            'format': self.fmt,
+            'source': source.name,
+            'size': 0,
+            'lines': 0,
+            'frames': [],
+            'markers': {kind: [] for kind in MARKER_KINDS},
+            'marker_counts': {kind: 0 for kind in MARKER_KINDS},
+        }
+
+        with open(target, 'wb') as out:
+            for frame in iter_log_blocks(str(source), self.frame_bytes):
+                compressed = self.compress_frame(frame)
+                index['frames'].append([out.tell(), len(compressed), index['size'], len(frame), index['lines']])
+
+                # Markers at the frame start have no preceding newline in this frame
+                line = index['lines']
+                position = 0
+                for match in MARKER_PATTERN.finditer(b'\n' + frame):
+                    kind = (match.group(1) or b'summary').decode()
+                    line += frame.count(b'\n', position, match.start())
+                    position = match.start()
+                    index['marker_counts'][kind] += 1
+                    if len(index['markers'][kind]) < max_markers:
+                        index['markers'][kind].append([line + 1, index['size'] + match.start()])
+
+                out.write(compressed)
+                index['size'] += len(frame)
+                index['lines'] += frame.count(b'\n')
+
+        index['compressed_size'] = target.stat().st_size
+        Path(str(target) + INDEX_SUFFIX).write_text(json.dumps(index, separators=(',', ':')), encoding='utf-8')
+        if remove:
+            source.unlink()
+        return index
+
+
+def archive_log(log_file: str, frame_bytes: int, remove: bool) -> Dict[str, Any]:
+    """Archive one log (runs in a worker process)."""
+    try:
+        index = LogArchiver(frame_bytes).archive(log_file, remove)
+        return {'log': log_file, 'size': index['size'], 'compressed_size': index['compressed_size']}
+    except OSError as e:
+        return {'log': log_file, 'error': str(e)}
+
+
+class LogArchive:
+    """Random access to an archived log through its index."""
+
+    def __init__(self, archive_file: str):
+        """Load the sidecar index of an archive."""
+        self.archive_file = Path(archive_file)
+        index_file = Path(str(archive_file) + INDEX_SUFFIX)
+        if not index_file.exists():
+            raise OSError(f"{index_file}: index not found")
+        self.index = json.loads(index_file.read_text(encoding='utf-8'))
+        if self.index.get('version') != INDEX_VERSION:
+            raise ValueError(f"{index_file}: unsupported index version {self.index.get('version')}")
+        self.frame_starts = [frame[2] for frame in self.index['frames']]
+
+    def read_frame(self, number: int) -> bytes:
+        """Decompress one frame."""
+        offset, size = self.index['frames'][number][:2]
+        with open(self.archive_file, 'rb') as f:
+            f.seek(offset)
+            data = f.read(size)
+        if self.index['format'] == 'zstd':
+            if zstandard is None:
+                raise OSError(f"{self.archive_file}: reading zstd archives needs the zstandard module")
+            return zstandard.ZstdDecompressor().decompress(data)
+        return gzip.decompress(data)
+
+    def frame_of(self, offset: int) -> int:
+        """Number of the frame holding an uncompressed byte offset."""
+        return max(0, bisect.bisect_right(self.frame_starts, offset) - 1)
+
+    def lines_at(self, offset: int, before: int = 5, after: int = 20) -> List[tuple]:
+        """(line number, text) around the line starting at offset, decompressing only the frames needed."""
+        number = self.frame_of(offset)
+        first = number
+        data = self.read_frame(number)
+        start = offset - self.frame_starts[number]
+
+        # Pull in neighbouring frames only when the context crosses a frame boundary
+        while data.count(b'\n', 0, start) < before and first > 0:
+            first -= 1
+            previous = self.read_frame(first)
+            data = previous + data
+            start += len(previous)
+        last = number
+        while data.count(b'\n', start) <= after and last + 1 < len(self.index['frames']):
+            last += 1
+            data += self.read_frame(last)
+
+        lines = data.split(b'\n')
+        if lines[-1] == b'':
+            lines.pop()
+        target = data.count(b'\n', 0, start)
+        base = self.index['frames'][first][4]
+        low = max(0, target - before)
+        high = min(len(lines), target + after + 1)
+        return [(base + i + 1, lines[i].decode('utf-8', errors='replace')) for i in range(low, high)]
+
+    def first(self, kind: str) -> Optional[List[int]]:
+        """[line, offset] of the first indexed line of a kind, or None."""
+        markers = self.index['markers'].get(kind) or []
+        return markers[0] if markers else None
+
+    def offset_of_line(self, line: int) -> int:
+        """Uncompressed offset of a (1-based) line number."""
+        starts = [frame[4] for frame in self.index['frames']]
+        number = max(0, bisect.bisect_right(starts, line - 1) - 1)
+        data = self.read_frame(number)
+        position = 0
+        for _ in range(line - 1 - starts[number]):
+            position = data.index(b'\n', position) + 1
+        return self.frame_starts[number] + position
+
+
+def main():
+    """Main function with command line argument parsing."""
+    parser = argparse.ArgumentParser(description="Compressed simulation log archive with indexed error lookup")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    compress = subparsers.add_parser("compress", help="Archive plain logs")
+    compress.add_argument("logs", nargs="+", help="Log files")
+    compress.add_argument("--frame-kb", type=int, default=1024, help="Uncompressed KB per frame (default: 1024)")
+    compress.add_argument("--keep", action="store_true", help="Keep the plain logs")
+    compress.add_argument("-j", "--jobs", type=int, default=None, help="Worker processes (default: CPU count)")
+
+    view = subparsers.add_parser("view", help="Show part of an archived log")
+    view.add_argument("archive", help="Archived log (.zst or .gz with .idx)")
+    target = view.add_mutually_exclusive_group()
+    target.add_argument("--first", choices=["error", "fatal", "summary"], default="error",
+                        help="Jump to the first UVM_ERROR, UVM_FATAL or report summary (default: error)")
+    target.add_argument("--line", type=int, help="Jump to a line number")
+    view.add_argument("-B", "--before", type=int, default=5, help="Lines of context before (default: 5)")
+    view.add_argument("-A", "--after", type=int, default=20, help="Lines of context after (default: 20)")
+
+    info = subparsers.add_parser("info", help="Show the index summary of archives")
+    info.add_argument("archives", nargs="+", help="Archived logs")
+
+    cat = subparsers.add_parser("cat", help="Write an archived log to stdout")
+    cat.add_argument("archive", help="Archived log")
+
+    args = parser.parse_args()
+
+    try:
+        if args.command == "compress":
+            failed = 0
+            with ProcessPoolExecutor(max_workers=args.jobs) as pool:
+                for result in pool.map(archive_log, args.logs, [args.frame_kb * 1024] * len(args.logs),
+                                       [not args.keep] * len(args.logs)):
+                    if 'error' in result:
+                        failed += 1
+                        print(f"ERROR: {result['log']}: {result['error']}")
+                    else:
+                        ratio = result['size'] / max(1, result['compressed_size'])
+                        print(f"{result['log']}: {result['size']} -> {result['compressed_size']} bytes ({ratio:.1f}x)")
+            sys.exit(1 if failed else 0)
+
+        if args.command == "info":
+            for archive_file in args.archives:
+                index = LogArchive(archive_file).index
+                counts = ', '.join(f"{kind}: {count}" for kind, count in index['marker_counts'].items())
+                print(f"{archive_file}: {index['format']}, {index['lines']} lines, {index['size']} -> "
+                      f"{index['compressed_size']} bytes, {len(index['frames'])} frames; {counts}")
+            sys.exit(0)
+
+        if args.command == "cat":
+            with open_log(args.archive) as f:
+                for block in iter(lambda: f.read(1 << 20), b''):
+                    sys.stdout.buffer.write(block)
+            sys.exit(0)
+
+        archive = LogArchive(args.archive)
+        if args.line is not None:
+            offset = archive.offset_of_line(args.line)
+        else:
+            kind = {'error': 'UVM_ERROR', 'fatal': 'UVM_FATAL', 'summary': 'summary'}[args.first]
+            marker = archive.first(kind)
+            if marker is None:
+                print(f"No {kind} line in {args.archive}")
+                sys.exit(1)
+            offset = marker[1]
+
+        for number, text in archive.lines_at(offset, args.before, args.after):
+            print(f"{number:>9}: {text}")
+    except (OSError, ValueError) as e:
+        print(f"ERROR: {e}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
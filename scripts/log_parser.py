@@ -0,0 +1,438 @@
+#!/usr/bin/env python3
+"""
+UVM Simulation Log Parser
+Extracts the UVM report summary, UVM_ERROR/UVM_FATAL messages, final
+simulation time, wall time and exit status from DSIM logs in a single
+memory-mapped pass, and writes the results JSON imported by the dashboard
+(dashboard_generator.py --import-results).
+
+Author: UVM Base Generator
+Date: 2025-07-27
+"""
+
+import os
+import re
+import sys
+import glob
+import json
+import mmap
+import argparse
+import itertools
+import subprocess
+from pathlib import Path
+from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Any, List, Optional, Iterator
+
+from log_archive import is_archive, iter_log_blocks
+
+# Lines of interest, matched at line starts. Scanning for '\n' followed by the
+# alternation lets the regex engine skip between newlines at memchr speed
+LINE_PATTERN = rb'''
+    (?P<severity>UVM_ERROR|UVM_FATAL)\ (?:(?P<file>\S+)\((?P<line>\d+)\)\ )?@\ (?P<time>\d+):\ (?P<context>\S+)\ \[(?P<id>[^\]\r\n]*)\]\ ?(?P<message>[^\r\n]*)
+  | (?P<count_severity>UVM_INFO|UVM_WARNING|UVM_ERROR|UVM_FATAL)\ ?:[ \t]*(?P<count>\d+)[ \t\r]*$
+  | (?P<summary>---\ UVM\ Report\ Summary\ ---)
+  | =T:Simulation\ terminated\ by\ (?P<cause>[^\r\n]*?)\ at\ time\ (?P<end_time>\d+)
+  | =F:(?P<dsim_fatal>[^\r\n]*)
+  | [ \t]*System\ timescale\ is\ (?P<timescale>\S+)
+  | [ \t]*Random\ seed:\ (?P<seed>[^\r\n]*)
+  | UVM_INFO\ @\ \d+:\ reporter\ \[RNTST\]\ Running\ test\ (?P<test>[^\s.]+)
+  | =N:\[UsageMeter\ \((?P<usage_time>\d{4}-\d\d-\d\d\ \d\d:\d\d:\d\d)
+'''
+FIRST_LINE_PATTERN = re.compile(LINE_PATTERN, re.MULTILINE | re.VERBOSE)
+LOG_PATTERN = re.compile(rb'\n(?:' + LINE_PATTERN + rb')', re.MULTILINE | re.VERBOSE)
+
+# Report ID of the hang watchdog's UVM_FATAL
+HANG_ID = b'WATCHDOG_HANG'
+
+# Fallback for the final simulation time of logs cut short: last "@ <time>:" in the tail
+TIME_PATTERN = re.compile(rb'@ (\d+):')
+TAIL_BYTES = 1 << 16
+
+# DSIM build phases in log order, with the line that starts each; the build ends
+# when the event scheduler starts
+COMPILE_PHASES = [
+    ('analyze', b'Analyzing...'),
+    ('elaborate', b'Elaborating...'),
+    ('optimize', b'Optimizing...'),
+    ('build_models', b'Building models...'),
+    ('link', b'Linking image.so...'),
+    ('runtime_elaboration', b'=S:Begin run-time elaboration'),
+]
+SCHEDULER_MARKER = b'=N:Starting event scheduler'
+
+TIME_UNITS = {'s': 1.0, 'ms': 1e-3, 'us': 1e-6, 'ns': 1e-9, 'ps': 1e-12, 'fs': 1e-15}
+SEVERITIES = ('UVM_INFO', 'UVM_WARNING', 'UVM_ERROR', 'UVM_FATAL')
+
+
+def time_unit_seconds(unit: str) -> Optional[float]:
+    """Seconds per tick of a timescale unit such as '1ps' or '100ns'."""
+    match = re.fullmatch(r'(1|10|100)\s*(s|ms|us|ns|ps|fs)', unit.strip())
+    if not match:
+        return None
+    return int(match.group(1)) * TIME_UNITS[match.group(2)]
+
+
+def log_blocks(log_file: str) -> Iterator[bytes]:
+    """Text of a plain log as one memory map, or of an archived log in blocks of whole lines."""
+    if is_archive(log_file):
+        yield from iter_log_blocks(log_file)
+        return
+    if os.path.getsize(log_file) == 0:
+        return
+    with open(log_file, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        yield data
+
+
+def parse_log_file(log_file: str, max_messages: int = 100) -> Dict[str, Any]:
+    """Parse one simulation log (plain or archived); memory stays bounded regardless of log size.
+
+    Error and fatal messages are counted in full but only the first
+    max_messages are kept.
+    """
+    result = {
+        'log': str(log_file),
+        'test': None,
+        'seed': None,
+        'uvm_counts': {severity: 0 for severity in SEVERITIES},
+        'summary_found': False,
+        'hang': False,
+        'messages': [],
+        'message_count': 0,
+        'dsim_fatal': [],
+        'final_time': None,
+        'time_unit': '1ps',
+        'termination': None,
+        'exit_status': 'incomplete',
+        'wall_seconds': None,
+    }
+
+    try:
+        in_summary = False
+        tail = b''
+        usage_times = []
+        for data in log_blocks(log_file):
+            # Blocks start at line starts, so each one's first line is matched on its own
+            first = FIRST_LINE_PATTERN.match(data)
+            for match in itertools.chain([first] if first else [], LOG_PATTERN.finditer(data)):
+                groups = match.groupdict()
+
+                if groups['severity']:
+                    result['message_count'] += 1
+                    if groups['id'] == HANG_ID:
+                        result['hang'] = True
+                    if len(result['messages']) < max_messages:
+                        result['messages'].append({
+                            'severity': groups['severity'].decode(),
+                            'time': int(groups['time']),
+                            'file': groups['file'].decode(errors='replace') if groups['file'] else None,
+                            'line': int(groups['line']) if groups['line'] else None,
+                            'context': groups['context'].decode(errors='replace'),
+                            'id': groups['id'].decode(errors='replace'),
+                            'message': groups['message'].decode(errors='replace').strip(),
+                        })
+                elif groups['count_severity']:
+                    if in_summary:
+                        result['uvm_counts'][groups['count_severity'].decode()] = int(groups['count'])
+                elif groups['summary']:
+                    # Counts from the last summary in the log win
+                    in_summary = True
+                    result['summary_found'] = True
+                    result['uvm_counts'] = {severity: 0 for severity in SEVERITIES}
+                elif groups['end_time']:
+                    result['final_time'] = int(groups['end_time'])
+                    result['termination'] = groups['cause'].decode(errors='replace')
+                elif groups['dsim_fatal'] is not None:
+                    result['dsim_fatal'].append(groups['dsim_fatal'].decode(errors='replace').strip())
+                elif groups['timescale']:
+                    result['time_unit'] = groups['timescale'].decode()
+                elif groups['seed']:
+                    seed = re.search(rb'-?\d+', groups['seed'])
+                    result['seed'] = int(seed.group()) if seed else None
+                elif groups['test']:
+                    result['test'] = groups['test'].decode()
+                elif groups['usage_time']:
+                    usage_times.append(groups['usage_time'].decode())
+
+            tail = (tail + data[max(0, len(data) - TAIL_BYTES):])[-TAIL_BYTES:]
+
+        if result['final_time'] is None:
+            times = TIME_PATTERN.findall(tail)
+            result['final_time'] = int(times[-1]) if times else None
+
+        # Wall time only from the log's own start and end stamps (same clock and
+        # time zone); a single stamp leaves it to the runner's measured runtime
+        if len(usage_times) >= 2:
+            first = datetime.strptime(usage_times[0], '%Y-%m-%d %H:%M:%S')
+            last = datetime.strptime(usage_times[-1], '%Y-%m-%d %H:%M:%S')
+            elapsed = (last - first).total_seconds()
+            result['wall_seconds'] = elapsed if elapsed > 0 else None
+    except (OSError, ValueError) as e:
+        result['error'] = str(e)
+        return result
+
+    if result['termination'] is None:
+        result['exit_status'] = 'incomplete'
+    elif result['dsim_fatal'] or result['uvm_counts']['UVM_FATAL'] > 0:
+        result['exit_status'] = 'fatal'
+    else:
+        result['exit_status'] = 'finished'
+
+    return result
+
+
+class PhaseTracker:
+    """Times DSIM build phases by following a job's log while it is written.
+
+    DSIM prints no timestamps for its phases, so the runner polls the log and
+    records when each phase line appears (resolution: the poll interval). Only
+    the build section at the start of the log is read; 'startup' is the time
+    before the first phase line (e.g. license checkout).
+    """
+
+    def __init__(self, log_file: str, start: float, block_bytes: int = 4 << 20):
+        """Follow log_file of a job started at time start."""
+        self.log_file = log_file
+        self.start = start
+        self.block_bytes = block_bytes
+        self.offset = 0
+        self.next_phase = 0
+        self.seen: List[tuple] = []
+        self.done = False
+
+    def read_lines(self) -> bytes:
+        """Next block of complete lines appended since the last read (b'' when there is none)."""
+        try:
+            with open(self.log_file, 'rb') as f:
+                f.seek(self.offset)
+                chunk = f.read(self.block_bytes)
+        except OSError:
+            return b''
+
+        # Only complete lines; a partial last line is read again next time
+        end = chunk.rfind(b'\n') + 1
+        if end == 0 and len(chunk) == self.block_bytes:
+            end = len(chunk)
+        self.offset += end
+        return chunk[:end]
+
+    def poll(self, now: float):
+        """Read what was appended since the last poll and timestamp new phase lines."""
+        while not self.done:
+            chunk = self.read_lines()
+            if not chunk:
+                break
+            self.feed(chunk, now)
+
+    def feed(self, chunk: bytes, now: float):
+        """Timestamp the phase lines in a block of complete lines."""
+        for line in chunk.splitlines():
+            if line.startswith(SCHEDULER_MARKER):
+                self.seen.append(('simulate', now - self.start))
+                self.done = True
+                return
+            for index in range(self.next_phase, len(COMPILE_PHASES)):
+                name, marker = COMPILE_PHASES[index]
+                if line.startswith(marker):
+                    self.seen.append((name, now - self.start))
+                    self.next_phase = index + 1
+                    break
+
+    def durations(self, end: float) -> Dict[str, float]:
+        """Seconds spent in each phase seen; the last one lasts until end."""
+        self.poll(end)
+        if not self.seen:
+            return {}
+        times = self.seen + [(None, end - self.start)]
+        durations = {'startup': round(times[0][1], 3)}
+        durations.update({name: round(times[i + 1][1] - at, 3) for i, (name, at) in enumerate(self.seen)})
+        return durations
+
+
+def classify_log(result: Dict[str, Any], exit_code: Optional[int] = None) -> str:
+    """PASS, FAIL or HANG of a parsed log; the regression runner classifies its jobs with this too.
+
+    exit_code is the simulator's, when known; without it the log itself must
+    show a clean end of simulation. The UVM report summary is printed at
+    UVM_LOW, so a log run at UVM_NONE has none: it passes on its
+    UVM_ERROR/UVM_FATAL lines and a simulation that ran to its end.
+    """
+    if result['hang']:
+        return 'HANG'
+    if result.get('error'):
+        return 'FAIL'
+    if exit_code is not None and exit_code != 0:
+        return 'FAIL'
+    if exit_code is None and result['exit_status'] != 'finished':
+        return 'FAIL'
+    if not result['summary_found'] and result['termination'] is None:
+        return 'FAIL'
+    if result['uvm_counts']['UVM_ERROR'] > 0 or result['uvm_counts']['UVM_FATAL'] > 0 or result['message_count']:
+        return 'FAIL'
+    return 'PASS'
+
+
+def parse_job(entry: Dict[str, Any], max_messages: int) -> Dict[str, Any]:
+    """Parse the log of one job (runs in a worker process)."""
+    result = parse_log_file(entry['log'], max_messages)
+    for key in ('test', 'seed'):
+        if entry.get(key) is not None:
+            result[key] = entry[key]
+    if entry.get('runtime_seconds') is not None:
+        result['wall_seconds'] = entry['runtime_seconds']
+    result['exit_code'] = entry.get('exit_code')
+    result['peak_memory_mb'] = entry.get('peak_memory_mb')
+
+    # Outcomes decided outside the log (killed or never started) are kept
+    if entry.get('status') in ('TIMEOUT', 'ERROR'):
+        result['status'] = entry['status']
+    else:
+        result['status'] = classify_log(result, result['exit_code'])
+    return result
+
+
+def git_value(*args: str) -> Optional[str]:
+    """Output of a git command, or None outside a repository."""
+    try:
+        return subprocess.run(['git', *args], capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+class LogParser:
+    """Parses many simulation logs in parallel into dashboard results."""
+
+    def __init__(self, jobs: int = None, max_messages: int = 100, clock_period_ns: float = 10.0):
+        """Configure worker count, kept messages per log and the testbench clock period."""
+        self.jobs = jobs
+        self.max_messages = max_messages
+        self.clock_period_ns = clock_period_ns
+
+    @staticmethod
+    def expand_inputs(inputs: List[str]) -> tuple:
+        """Job entries for log files/globs and regression results.json files.
+
+        Returns (entries, regression results) where the regression results are
+        the loaded results.json documents, used for wall time and memory.
+        """
+        entries = []
+        regressions = []
+        for pattern in inputs:
+            for path in sorted(glob.glob(pattern)) or [pattern]:
+                if path.endswith('.json'):
+                    with open(path, 'r', encoding='utf-8') as f:
+                        regression = json.load(f)
+                    regressions.append(regression)
+                    entries += [job for job in regression.get('jobs', []) if job.get('log')]
+                else:
+                    entries.append({'log': path})
+        return entries, regressions
+
+    def simulated_cycles(self, result: Dict[str, Any]) -> Optional[float]:
+        """Clock cycles covered by a log's final simulation time."""
+        unit = time_unit_seconds(result['time_unit'])
+        if result['final_time'] is None or unit is None:
+            return None
+        return result['final_time'] * unit / (self.clock_period_ns * 1e-9)
+
+    def parse(self, inputs: List[str], test_suite: str = 'regression', branch_name: Optional[str] = None,
+              commit_hash: Optional[str] = None) -> Dict[str, Any]:
+        """Parse all logs and build the dashboard results document."""
+        entries, regressions = self.expand_inputs(inputs)
+        with ProcessPoolExecutor(max_workers=self.jobs) as pool:
+            tests = list(pool.map(parse_job, entries, [self.max_messages] * len(entries),
+                                  chunksize=max(1, len(entries) // 64)))
+
+        walls = [t['wall_seconds'] for t in tests if t['wall_seconds'] is not None]
+        if regressions and all('wall_seconds' in r for r in regressions):
+            runtime = sum(r['wall_seconds'] for r in regressions)
+        else:
+            runtime = sum(walls)
+
+        # Simulated kHz over the logs with both a final time and a wall time
+        cycles = 0.0
+        seconds = 0.0
+        for test in tests:
+            test_cycles = self.simulated_cycles(test)
+            if test_cycles is not None and test['wall_seconds']:
+                cycles += test_cycles
+                seconds += test['wall_seconds']
+
+        memory = [r.get('memory_usage_gb') or 0.0 for r in regressions]
+        memory += [(t['peak_memory_mb'] or 0.0) / 1024 for t in tests]
+
+        passed = sum(1 for t in tests if t['status'] == 'PASS')
+        return {
+            'branch_name': branch_name or git_value('rev-parse', '--abbrev-ref', 'HEAD') or 'unknown',
+            'commit_hash': commit_hash or git_value('rev-parse', 'HEAD') or '',
+            'test_suite': test_suite,
+            'timestamp': datetime.now().astimezone().isoformat(timespec='seconds'),
+            'total_tests': len(tests),
+            'passed_tests': passed,
+            'failed_tests': len(tests) - passed,
+            'runtime_seconds': round(runtime, 3),
+            'simulation_speed_khz': round(cycles / seconds / 1000, 3) if seconds else 0.0,
+            'memory_usage_gb': round(max(memory or [0.0]), 3),
+            'uvm_counts': {severity: sum(t['uvm_counts'][severity] for t in tests) for severity in SEVERITIES},
+            'tests': tests,
+        }
+
+
+def main():
+    """Main function with command line argument parsing."""
+    parser = argparse.ArgumentParser(description="Parse DSIM/UVM logs into dashboard results JSON")
+    parser.add_argument("inputs", nargs="+",
+                       help="Log files, glob patterns, or regression results.json files")
+    parser.add_argument("-o", "--output", default="sim/exec/test_results.json",
+                       help="Results JSON for dashboard_generator.py --import-results (default: sim/exec/test_results.json)")
+    parser.add_argument("-j", "--jobs", type=int, default=None,
+                       help="Worker processes (default: CPU count)")
+    parser.add_argument("--suite", default="regression",
+                       help="Test suite name recorded in the dashboard (default: regression)")
+    parser.add_argument("--branch", default=None, help="Branch name (default: current git branch)")
+    parser.add_argument("--commit", default=None, help="Commit hash (default: current git HEAD)")
+    parser.add_argument("--max-messages", type=int, default=100,
+                       help="UVM_ERROR/UVM_FATAL messages kept per log (default: 100)")
+    parser.add_argument("--clock-period-ns", type=float, default=10.0,
+                       help="Testbench clock period for simulation speed (default: 10)")
+    parser.add_argument("--ingest", metavar="DASHBOARD_CONFIG", default=None,
+                       help="Also store the results in the dashboard database in-process (dashboard config YAML)")
+
+    args = parser.parse_args()
+
+    try:
+        results = LogParser(args.jobs, args.max_messages, args.clock_period_ns).parse(
+            args.inputs, args.suite, args.branch, args.commit)
+    except (OSError, ValueError) as e:
+        print(f"ERROR: {e}")
+        sys.exit(1)
+
+    for test in results['tests']:
+        name = test['test'] or Path(test['log']).name
+        print(f"[{test['status']:7}] {name} seed={test['seed']} time={test['final_time']} "
+              f"errors={test['uvm_counts']['UVM_ERROR']} fatals={test['uvm_counts']['UVM_FATAL']}")
+        for message in test['messages'][:1]:
+            print(f"          {message['severity']} @ {message['time']}: [{message['id']}] {message['message']}")
+        if test.get('error'):
+            print(f"          ERROR: {test['error']}")
+
+    print(f"Tests: {results['total_tests']}  Passed: {results['passed_tests']}  Failed: {results['failed_tests']}")
+    Path(args.output).parent.mkdir(parents=True, exist_ok=True)
+    Path(args.output).write_text(json.dumps(results, indent=2), encoding='utf-8')
+    print(f"Results written to {args.output}")
+
+    if args.ingest:
+        from dashboard_generator import UVMDashboard
+        dashboard = UVMDashboard(args.ingest)
+        if dashboard.config.get('ingest_spool'):
+            # A single ingest server owns the database
+            print(f"Results submitted as {dashboard.submit(results)}")
+        else:
+            dashboard.ingest(results)
+            print(f"Results stored in {dashboard.db_path}")
+        dashboard.conn.close()
+
+    sys.exit(0 if results['failed_tests'] == 0 else 1)
+
+if __name__ == "__main__":
+    main()
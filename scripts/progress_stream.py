@@ -0,0 +1,296 @@
+#!/usr/bin/env python3
+"""
+UVM Regression Progress Stream
+Live progress of running simulations. The regression runner follows each
+job's log from where it last stopped reading (nothing is read twice) and
+appends progress events - simulated time, UVM message counts so far and
+transactions per second - to an append-only JSONL stream in the run
+directory. The viewer follows those streams and flags slow and stalled seeds
+while the regression is still running.
+
+Author: UVM Base Generator
+Date: 2025-07-27
+"""
+
+import os
+import re
+import sys
+import json
+import time
+import signal
+import socket
+import argparse
+import statistics
+from pathlib import Path
+from typing import Dict, Any, List, Optional
+
+from log_parser import PhaseTracker, SEVERITIES
+
+# UVM messages (time stamp, plus the agents' transaction total in watchdog heartbeats)
+# and the timescale; matched after a newline like the log parser
+PROGRESS_PATTERN = re.compile(rb'''\n(?:
+    (?P<severity>UVM_INFO|UVM_WARNING|UVM_ERROR|UVM_FATAL)\ (?:\S+\(\d+\)\ )?@\ (?P<time>\d+):
+        (?:\ \S+\ \[HEARTBEAT\]\ activity=(?P<activity>\d+))?
+  | [ \t]*System\ timescale\ is\ (?P<timescale>\S+)
+)''', re.VERBOSE)
+
+# Event streams in a run directory: progress.jsonl from the runner, progress-<host>-<pid>.jsonl from queue workers
+STREAM_GLOB = 'progress*.jsonl'
+
+
+class ProgressTracker(PhaseTracker):
+    """Follows a running job's whole log: build phase times, then simulation progress."""
+
+    def __init__(self, log_file: str, start: float):
+        """Follow log_file of a job started at time start."""
+        super().__init__(log_file, start)
+        self.sim_time: Optional[int] = None
+        self.time_unit = '1ps'
+        self.counts = {severity: 0 for severity in SEVERITIES}
+        self.activity: Optional[int] = None
+        self.advanced_at: Optional[float] = None
+        self.last_snapshot: Optional[tuple] = None
+
+    def poll(self, now: float):
+        """Read what was appended since the last poll."""
+        while True:
+            chunk = self.read_lines()
+            if not chunk:
+                break
+            if not self.done:
+                self.feed(chunk, now)
+            self.scan(chunk, now)
+
+    def scan(self, chunk: bytes, now: float):
+        """Update the simulated time, message counts and transaction total from a block of lines."""
+        for match in PROGRESS_PATTERN.finditer(b'\n' + chunk):
+            if match.group('severity'):
+                self.counts[match.group('severity').decode()] += 1
+                sim_time = int(match.group('time'))
+                if self.sim_time is None or sim_time > self.sim_time:
+                    self.sim_time = sim_time
+                    self.advanced_at = now
+                if match.group('activity'):
+                    self.activity = int(match.group('activity'))
+            else:
+                self.time_unit = match.group('timescale').decode()
+
+    def stalled_for(self, now: float) -> float:
+        """Seconds since simulated time last advanced.
+
+        Only a log with watchdog heartbeats is expected to advance regularly;
+        before the first heartbeat (or without any, e.g. +WATCHDOG_DISABLE or
+        a verbosity that filters them) this is 0 and the job is never stalled.
+        """
+        if self.activity is None or self.advanced_at is None:
+            return 0.0
+        return now - self.advanced_at
+
+    def snapshot_due(self, now: float, interval: float) -> bool:
+        """True when the last snapshot is at least interval seconds old."""
+        last = self.last_snapshot[0] if self.last_snapshot else self.start
+        return now - last >= interval
+
+    def snapshot(self, now: float) -> Dict[str, Any]:
+        """Progress so far, with rates over the interval since the previous snapshot."""
+        tx_rate = sim_rate = None
+        if self.last_snapshot:
+            wall, sim_time, activity = self.last_snapshot
+            interval = now - wall
+            if interval > 0 and self.sim_time is not None and sim_time is not None:
+                sim_rate = round((self.sim_time - sim_time) / interval, 1)
+            if interval > 0 and self.activity is not None and activity is not None:
+                tx_rate = round((self.activity - activity) / interval, 1)
+        self.last_snapshot = (now, self.sim_time, self.activity)
+
+        if self.sim_time is not None:
+            phase = 'simulate'
+        else:
+            phase = self.seen[-1][0] if self.seen else 'startup'
+        return {
+            'elapsed': round(now - self.start, 3),
+            'phase': phase,
+            'sim_time': self.sim_time,
+            'time_unit': self.time_unit,
+            'sim_time_per_second': sim_rate,
+            'counts': dict(self.counts),
+            'transactions': self.activity,
+            'tx_per_second': tx_rate,
+            'log_bytes': self.offset,
+            'stalled_for': round(self.stalled_for(now), 1),
+        }
+
+
+class ProgressStream:
+    """Append-only JSONL stream of progress events (one writer per file)."""
+
+    def __init__(self, path: str):
+        """Open the stream for appending."""
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.file = open(path, 'a', encoding='utf-8')
+
+    def emit(self, event: str, **fields):
+        """Append one event; each is written and flushed as a single line."""
+        record = {'ts': round(time.time(), 3), 'event': event}
+        record.update(fields)
+        self.file.write(json.dumps(record) + '\n')
+        self.file.flush()
+
+    def close(self):
+        """Close the stream."""
+        self.file.close()
+
+
+class ProgressReader:
+    """Follows the progress streams of a run, keeping the latest event of each job."""
+
+    def __init__(self, source: str):
+        """Follow a run directory (all its streams) or a single stream file."""
+        self.source = Path(source)
+        self.offsets: Dict[Path, int] = {}
+        self.jobs: Dict[str, Dict[str, Any]] = {}
+        self.run: Dict[str, Any] = {}
+        self.finished = False
+
+    def streams(self) -> List[Path]:
+        """Stream files, including those of workers that joined since the last poll."""
+        if self.source.is_dir():
+            return sorted(self.source.glob(STREAM_GLOB))
+        return [self.source]
+
+    def poll(self) -> int:
+        """Read the events appended since the last poll; returns how many were read."""
+        events = 0
+        for path in self.streams():
+            try:
+                with open(path, 'rb') as f:
+                    f.seek(self.offsets.get(path, 0))
+                    chunk = f.read()
+            except OSError:
+                continue
+            # A partial last line is read again next time
+            end = chunk.rfind(b'\n') + 1
+            self.offsets[path] = self.offsets.get(path, 0) + end
+            for line in chunk[:end].splitlines():
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+                self.apply(record)
+                events += 1
+        return events
+
+    def apply(self, record: Dict[str, Any]):
+        """Fold one event into the run and job state."""
+        if record['event'] == 'run_start':
+            self.run = record
+        elif record['event'] == 'run_end':
+            self.finished = True
+        elif record.get('job'):
+            self.jobs.setdefault(record['job'], {}).update(record)
+
+    def flags(self, stall_seconds: float, slow_factor: float) -> Dict[str, str]:
+        """STALLED/SLOW per running job; slow means simulating at under slow_factor of the median rate."""
+        running = {job_id: job for job_id, job in self.jobs.items() if job['event'] != 'end'}
+        rates = [job['sim_time_per_second'] for job in running.values() if job.get('sim_time_per_second')]
+        median = statistics.median(rates) if len(rates) >= 2 else None
+
+        flags = {}
+        for job_id, job in running.items():
+            if job.get('stalled_for') and job['stalled_for'] >= stall_seconds:
+                flags[job_id] = 'STALLED'
+            elif median and job.get('phase') == 'simulate' and \
+                    (job.get('sim_time_per_second') or 0.0) < slow_factor * median:
+                flags[job_id] = 'SLOW'
+        return flags
+
+    def render(self, stall_seconds: float, slow_factor: float) -> str:
+        """Table of running jobs (most recent first) followed by a summary of finished ones."""
+        flags = self.flags(stall_seconds, slow_factor)
+        running = [job for job in self.jobs.values() if job['event'] != 'end']
+        finished = [job for job in self.jobs.values() if job['event'] == 'end']
+        lines = [f"Run {self.run.get('run_id', '?')}: {len(running)} running, {len(finished)} finished"
+                 + (" (complete)" if self.finished else "")]
+        lines.append(f"{'Job':36} {'Phase':14} {'Elapsed':>8} {'Sim time':>14} {'Sim/s':>10} "
+                     f"{'Tx/s':>8} {'Err':>4} {'Worker':20} Flag")
+        for job in sorted(running, key=lambda job: -(job.get('elapsed') or 0.0)):
+            counts = job.get('counts') or {}
+            errors = counts.get('UVM_ERROR', 0) + counts.get('UVM_FATAL', 0)
+            sim_time = f"{job['sim_time']}" if job.get('sim_time') is not None else '-'
+            lines.append(f"{job['job']:36} {job.get('phase', 'start'):14} {job.get('elapsed') or 0.0:>7.0f}s "
+                         f"{sim_time:>14} {job.get('sim_time_per_second') or 0.0:>10.0f} "
+                         f"{job.get('tx_per_second') or 0.0:>8.1f} {errors:>4} "
+                         f"{job.get('host', '')}:{job.get('pid', '')!s:14} {flags.get(job['job'], '')}")
+
+        statuses: Dict[str, int] = {}
+        for job in finished:
+            statuses[job.get('status')] = statuses.get(job.get('status'), 0) + 1
+        if statuses:
+            lines.append("Finished: " + "  ".join(f"{status}: {count}" for status, count in sorted(statuses.items())))
+        return '\n'.join(lines)
+
+    def kill(self, job_id: str) -> str:
+        """Kill a running job's simulation (on this host only); returns what was done."""
+        job = self.jobs.get(job_id)
+        if job is None or job['event'] == 'end':
+            raise ValueError(f"{job_id} is not running")
+        if job.get('host') != socket.gethostname():
+            raise ValueError(f"{job_id} runs on {job.get('host')}; run --kill there")
+        # Each simulation leads its own process group (the runner starts it in a new session)
+        if os.name == 'nt':
+            os.kill(job['pid'], signal.SIGTERM)
+        else:
+            os.killpg(job['pid'], signal.SIGTERM)
+        return f"Sent SIGTERM to {job_id} (pid {job['pid']})"
+
+
+def main():
+    """Main function with command line argument parsing."""
+    parser = argparse.ArgumentParser(description="Live progress view of a running regression")
+    parser.add_argument("source", help="Regression run directory or a progress .jsonl stream")
+    parser.add_argument("-i", "--interval", type=float, default=2.0, help="Refresh interval in seconds (default: 2)")
+    parser.add_argument("--once", action="store_true", help="Print the current state once and exit")
+    parser.add_argument("--stall", type=float, default=60.0,
+                       help="Flag jobs whose simulated time has not advanced for this many seconds (default: 60)")
+    parser.add_argument("--slow", type=float, default=0.5,
+                       help="Flag jobs simulating slower than this fraction of the median rate (default: 0.5)")
+    parser.add_argument("--kill", metavar="JOB", action="append", default=[],
+                       help="Kill a running job by ID (repeatable); the runner then records it as failed")
+
+    args = parser.parse_args()
+
+    reader = ProgressReader(args.source)
+    if not reader.streams() or not any(path.exists() for path in reader.streams()):
+        print(f"ERROR: No progress stream in {args.source}")
+        sys.exit(1)
+    reader.poll()
+
+    if args.kill:
+        failed = 0
+        for job_id in args.kill:
+            try:
+                print(reader.kill(job_id))
+            except (OSError, ValueError) as e:
+                failed += 1
+                print(f"ERROR: {e}")
+        sys.exit(1 if failed else 0)
+
+    clear = sys.stdout.isatty() and not args.once
+    try:
+        while True:
+            if clear:
+                print('\033[2J\033[H', end='')
+            print(reader.render(args.stall, args.slow))
+            if args.once or reader.finished:
+                break
+            time.sleep(args.interval)
+            reader.poll()
+            if not clear:
+                print()
+    except KeyboardInterrupt:
+        pass
+
+    sys.exit(0)
+
+if __name__ == "__main__":
+    main()
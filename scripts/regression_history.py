@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+UVM Regression History
+SQLite store of per-test/seed regression results used by the regression
+runner to estimate job runtimes and peak memory for scheduling.
+
+Author: UVM Base Generator
+Date: 2025-07-27
+"""
+
+import heapq
+import sqlite3
+import statistics
+from pathlib import Path
+from datetime import datetime
+from typing import Dict, Any, List, Optional
+
+
+class RegressionHistory:
+    """Per-job runtime history with optional fallback to the UVMDashboard database."""
+
+    # Recent runs considered for a runtime estimate
+    RECENT_RUNS = 20
+
+    def __init__(self, db_path: str, dashboard_db: Optional[str] = None):
+        """Open (or create) the history database."""
+        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(db_path)
+        self.dashboard_db = dashboard_db if dashboard_db and Path(dashboard_db).exists() else None
+        self.init_database()
+
+    def init_database(self):
+        """Create the job history table."""
+        cursor = self.conn.cursor()
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS job_history (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
+                run_id TEXT,
+                test TEXT,
+                seed INTEGER,
+                profile TEXT,
+                status TEXT,
+                runtime_seconds REAL,
+                peak_memory_mb REAL
+            )
+        ''')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_job_history_test ON job_history (test, profile)')
+
+        # Databases created before memory tracking lack the peak memory column
+        columns = [row[1] for row in cursor.execute('PRAGMA table_info(job_history)')]
+        if 'peak_memory_mb' not in columns:
+            cursor.execute('ALTER TABLE job_history ADD COLUMN peak_memory_mb REAL')
+        self.conn.commit()
+
+    def record(self, run_id: str, job: Dict[str, Any]):
+        """Store the outcome of a finished job (reruns and launch errors are not stored)."""
+        if job.get('is_rerun') or job['status'] == 'ERROR':
+            return
+
+        self.conn.execute('''
+            INSERT INTO job_history (timestamp, run_id, test, seed, profile, status, runtime_seconds, peak_memory_mb)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        ''', (datetime.now().isoformat(timespec='seconds'), run_id, job['test'], job['seed'],
+              job['profile'], job['status'], job['runtime_seconds'], job.get('peak_memory_mb')))
+        self.conn.commit()
+
+    def estimate(self, test: str, seed: int, profile: str) -> Optional[float]:
+        """Expected runtime of a job in seconds, or None without history.
+
+        Uses the last run of the same test/seed/profile, then the median of recent
+        runs of the test with the profile, then with any profile, then the
+        dashboard's average per-test runtime for a suite of the same name.
+        Timed-out runs count with the time they were killed at, a lower bound.
+        """
+        cursor = self.conn.cursor()
+        cursor.execute('''
+            SELECT runtime_seconds FROM job_history
+            WHERE test = ? AND seed = ? AND profile = ?
+            ORDER BY id DESC LIMIT 1
+        ''', (test, seed, profile))
+        row = cursor.fetchone()
+        if row:
+            return row[0]
+
+        for profile_filter in (profile, None):
+            cursor.execute('''
+                SELECT runtime_seconds FROM job_history
+                WHERE test = ? AND (? IS NULL OR profile = ?)
+                ORDER BY id DESC LIMIT ?
+            ''', (test, profile_filter, profile_filter, self.RECENT_RUNS))
+            runtimes = [r[0] for r in cursor.fetchall()]
+            if runtimes:
+                return statistics.median(runtimes)
+
+        return self.dashboard_estimate(test)
+
+    def estimate_memory(self, test: str, profile: str) -> Optional[float]:
+        """Expected peak memory of a test in MB: the largest recent peak, or None without history."""
+        cursor = self.conn.cursor()
+        for profile_filter in (profile, None):
+            cursor.execute('''
+                SELECT MAX(peak_memory_mb) FROM (
+                    SELECT peak_memory_mb FROM job_history
+                    WHERE test = ? AND (? IS NULL OR profile = ?) AND peak_memory_mb IS NOT NULL
+                    ORDER BY id DESC LIMIT ?
+                )
+            ''', (test, profile_filter, profile_filter, self.RECENT_RUNS))
+            row = cursor.fetchone()
+            if row and row[0] is not None:
+                return row[0]
+        return None
+
+    def dashboard_estimate(self, test: str) -> Optional[float]:
+        """Average runtime per test from UVMDashboard test_runs rows for this suite."""
+        if not self.dashboard_db:
+            return None
+
+        try:
+            conn = sqlite3.connect(self.dashboard_db)
+            try:
+                row = conn.execute('''
+                    SELECT AVG(CAST(runtime_seconds AS REAL) / MAX(total_tests, 1)) FROM test_runs
+                    WHERE test_suite = ? AND runtime_seconds IS NOT NULL
+                ''', (test,)).fetchone()
+            finally:
+                conn.close()
+        except sqlite3.Error:
+            return None
+
+        return row[0] if row and row[0] is not None else None
+
+    def is_stable(self, test: str, min_runs: int) -> bool:
+        """True when the test has at least min_runs recorded runs and the last min_runs all passed."""
+        cursor = self.conn.cursor()
+        cursor.execute('''
+            SELECT status FROM job_history WHERE test = ?
+            ORDER BY id DESC LIMIT ?
+        ''', (test, min_runs))
+        statuses = [r[0] for r in cursor.fetchall()]
+        return len(statuses) >= min_runs and all(status == 'PASS' for status in statuses)
+
+    def close(self):
+        """Close the history database."""
+        self.conn.close()
+
+
+def estimate_makespan(runtimes: List[float], workers: int) -> float:
+    """Wall time of running jobs in the given order on a pool of identical workers."""
+    finish_times = [0.0] * max(1, workers)
+    for runtime in runtimes:
+        earliest = heapq.heappop(finish_times)
+        heapq.heappush(finish_times, earliest + runtime)
+    return max(finish_times)
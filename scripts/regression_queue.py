@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""
+UVM Regression Work Queue
+SQLite-backed job queue on a shared filesystem that lets one regression be
+spread across worker processes on any number of hosts. Workers claim jobs
+with time-limited leases and renew them with heartbeats; jobs whose lease
+expires (dead or unreachable worker) are requeued.
+
+Author: UVM Base Generator
+Date: 2025-07-27
+"""
+
+import json
+import time
+import sqlite3
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Tuple
+
+# Job states in the queue
+QUEUED = 'queued'
+LEASED = 'leased'
+DONE = 'done'
+
+
+class RegressionQueue:
+    """Shared work queue: coordinators enqueue runs, workers lease and complete jobs."""
+
+    def __init__(self, db_path: str, lease_seconds: float = 120.0):
+        """Open (or create) the queue database.
+
+        The default rollback journal is kept on purpose: WAL needs shared memory
+        and does not work across hosts on a network filesystem.
+        """
+        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        # Autocommit mode; claims and requeues take the write lock explicitly
+        self.conn = sqlite3.connect(db_path, timeout=60.0, isolation_level=None)
+        self.lease_seconds = lease_seconds
+        self.init_database()
+
+    def init_database(self):
+        """Create the run and job tables."""
+        self.conn.execute('''
+            CREATE TABLE IF NOT EXISTS queue_runs (
+                run_id TEXT PRIMARY KEY,
+                run_dir TEXT,
+                created REAL,
+                open INTEGER DEFAULT 1
+            )
+        ''')
+        self.conn.execute('''
+            CREATE TABLE IF NOT EXISTS queue_jobs (
+                run_id TEXT,
+                job_id TEXT,
+                priority INTEGER,
+                state TEXT,
+                worker TEXT,
+                lease_expires REAL,
+                attempts INTEGER DEFAULT 0,
+                collected INTEGER DEFAULT 0,
+                payload TEXT,
+                result TEXT,
+                PRIMARY KEY (run_id, job_id)
+            )
+        ''')
+        self.conn.execute('CREATE INDEX IF NOT EXISTS idx_queue_jobs_state ON queue_jobs (state, priority)')
+
+    def create_run(self, run_id: str, run_dir: str):
+        """Register a regression run whose jobs write below run_dir."""
+        self.conn.execute('INSERT OR REPLACE INTO queue_runs (run_id, run_dir, created, open) VALUES (?, ?, ?, 1)',
+                          (run_id, run_dir, time.time()))
+
+    def enqueue(self, run_id: str, jobs: List[Tuple[int, Dict[str, Any]]]):
+        """Add (priority, job) pairs to a run; lower priorities are claimed first."""
+        self.conn.execute('BEGIN IMMEDIATE')
+        try:
+            self.conn.executemany('''
+                INSERT OR REPLACE INTO queue_jobs (run_id, job_id, priority, state, attempts, payload)
+                VALUES (?, ?, ?, ?, 0, ?)
+            ''', [(run_id, job['id'], priority, QUEUED, json.dumps(job)) for priority, job in jobs])
+            self.conn.execute('COMMIT')
+        except sqlite3.Error:
+            self.conn.execute('ROLLBACK')
+            raise
+
+    def claim(self, worker: str, memory_budget_mb: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """Lease the highest-priority queued job of any open run, or None when there is none.
+
+        With a memory budget, only a job whose estimated_memory_mb fits next to
+        the jobs leased by every worker on the same host ("<host>:<pid>") is
+        taken, first fit in priority order; a host with nothing leased takes
+        any job. Check and lease are one transaction, so the workers of a host
+        cannot overcommit it between them.
+        """
+        self.conn.execute('BEGIN IMMEDIATE')
+        try:
+            free = None
+            if memory_budget_mb is not None:
+                host = worker.rsplit(':', 1)[0] + ':'
+                leased, committed = self.conn.execute('''
+                    SELECT COUNT(*), COALESCE(SUM(json_extract(payload, '$.estimated_memory_mb')), 0)
+                    FROM queue_jobs WHERE state = ? AND substr(worker, 1, ?) = ?
+                ''', (LEASED, len(host), host)).fetchone()
+                if leased:
+                    free = memory_budget_mb - committed
+
+            row = self.conn.execute('''
+                SELECT j.run_id, j.job_id, j.attempts, j.payload, r.run_dir FROM queue_jobs j
+                JOIN queue_runs r ON r.run_id = j.run_id
+                WHERE j.state = ? AND r.open = 1
+                  AND (? IS NULL OR COALESCE(json_extract(j.payload, '$.estimated_memory_mb'), 0) <= ?)
+                ORDER BY r.created, j.priority LIMIT 1
+            ''', (QUEUED, free, free)).fetchone()
+            if row is None:
+                self.conn.execute('COMMIT')
+                return None
+
+            run_id, job_id, attempts, payload, run_dir = row
+            self.conn.execute('''
+                UPDATE queue_jobs SET state = ?, worker = ?, lease_expires = ?, attempts = ?
+                WHERE run_id = ? AND job_id = ?
+            ''', (LEASED, worker, time.time() + self.lease_seconds, attempts + 1, run_id, job_id))
+            self.conn.execute('COMMIT')
+        except sqlite3.Error:
+            self.conn.execute('ROLLBACK')
+            raise
+
+        return {'run_id': run_id, 'run_dir': run_dir, 'attempt': attempts + 1, 'job': json.loads(payload)}
+
+    def heartbeat(self, worker: str, leases: List[Tuple[str, str]]) -> List[Tuple[str, str]]:
+        """Renew the worker's leases; returns the (run_id, job_id) leases it has lost."""
+        lost = []
+        expires = time.time() + self.lease_seconds
+        for run_id, job_id in leases:
+            updated = self.conn.execute('''
+                UPDATE queue_jobs SET lease_expires = ?
+                WHERE run_id = ? AND job_id = ? AND state = ? AND worker = ?
+                  AND run_id IN (SELECT run_id FROM queue_runs WHERE open = 1)
+            ''', (expires, run_id, job_id, LEASED, worker)).rowcount
+            if not updated:
+                lost.append((run_id, job_id))
+        return lost
+
+    def complete(self, worker: str, run_id: str, job_id: str, result: Dict[str, Any]) -> bool:
+        """Store a job result; ignored (False) when the lease was lost to another worker."""
+        return self.conn.execute('''
+            UPDATE queue_jobs SET state = ?, result = ?, lease_expires = NULL
+            WHERE run_id = ? AND job_id = ? AND state = ? AND worker = ?
+        ''', (DONE, json.dumps(result), run_id, job_id, LEASED, worker)).rowcount == 1
+
+    def release(self, worker: str, leases: List[Tuple[str, str]]):
+        """Give leased jobs back to the queue (worker shutting down)."""
+        for run_id, job_id in leases:
+            self.conn.execute('''
+                UPDATE queue_jobs SET state = ?, worker = NULL, lease_expires = NULL, attempts = attempts - 1
+                WHERE run_id = ? AND job_id = ? AND state = ? AND worker = ?
+            ''', (QUEUED, run_id, job_id, LEASED, worker))
+
+    def requeue_expired(self, run_id: str, max_attempts: int) -> List[Dict[str, Any]]:
+        """Requeue jobs whose lease expired; jobs out of attempts are completed as ERROR.
+
+        Returns one entry per expired lease with the job ID, the worker that held
+        it and whether it was requeued.
+        """
+        self.conn.execute('BEGIN IMMEDIATE')
+        try:
+            rows = self.conn.execute('''
+                SELECT job_id, worker, attempts FROM queue_jobs
+                WHERE run_id = ? AND state = ? AND lease_expires < ?
+            ''', (run_id, LEASED, time.time())).fetchall()
+
+            expired = []
+            for job_id, worker, attempts in rows:
+                if attempts < max_attempts:
+                    self.conn.execute('''
+                        UPDATE queue_jobs SET state = ?, worker = NULL, lease_expires = NULL
+                        WHERE run_id = ? AND job_id = ?
+                    ''', (QUEUED, run_id, job_id))
+                else:
+                    result = {'status': 'ERROR', 'exit_code': None, 'runtime_seconds': None, 'worker': worker,
+                              'error': f"lease expired on {attempts} worker(s), last {worker}"}
+                    self.conn.execute('''
+                        UPDATE queue_jobs SET state = ?, result = ?, lease_expires = NULL
+                        WHERE run_id = ? AND job_id = ?
+                    ''', (DONE, json.dumps(result), run_id, job_id))
+                expired.append({'id': job_id, 'worker': worker, 'requeued': attempts < max_attempts})
+            self.conn.execute('COMMIT')
+        except sqlite3.Error:
+            self.conn.execute('ROLLBACK')
+            raise
+
+        return expired
+
+    def collect(self, run_id: str) -> List[Tuple[str, Dict[str, Any]]]:
+        """Results of the run's jobs completed since the last call."""
+        self.conn.execute('BEGIN IMMEDIATE')
+        try:
+            rows = self.conn.execute('''
+                SELECT job_id, result FROM queue_jobs WHERE run_id = ? AND state = ? AND collected = 0
+            ''', (run_id, DONE)).fetchall()
+            self.conn.execute('UPDATE queue_jobs SET collected = 1 WHERE run_id = ? AND state = ? AND collected = 0',
+                              (run_id, DONE))
+            self.conn.execute('COMMIT')
+        except sqlite3.Error:
+            self.conn.execute('ROLLBACK')
+            raise
+
+        return [(job_id, json.loads(result)) for job_id, result in rows]
+
+    def counts(self, run_id: str) -> Dict[str, int]:
+        """Number of the run's jobs in each state."""
+        counts = {QUEUED: 0, LEASED: 0, DONE: 0}
+        for state, count in self.conn.execute('SELECT state, COUNT(*) FROM queue_jobs WHERE run_id = ? GROUP BY state',
+                                              (run_id,)):
+            counts[state] = count
+        return counts
+
+    def close_run(self, run_id: str):
+        """Stop handing out the run's jobs and drop those not yet started."""
+        self.conn.execute('UPDATE queue_runs SET open = 0 WHERE run_id = ?', (run_id,))
+        self.conn.execute('DELETE FROM queue_jobs WHERE run_id = ? AND state = ?', (run_id, QUEUED))
+
+    def has_open_runs(self) -> bool:
+        """True while any run still has queued or leased jobs."""
+        row = self.conn.execute('''
+            SELECT 1 FROM queue_jobs j JOIN queue_runs r ON r.run_id = j.run_id
+            WHERE r.open = 1 AND j.state IN (?, ?) LIMIT 1
+        ''', (QUEUED, LEASED)).fetchone()
+        return row is not None
+
+    def close(self):
+        """Close the queue database."""
+        self.conn.close()
@@ -0,0 +1,1056 @@
+#!/usr/bin/env python3
+"""
+UVM Regression Runner
+Runs the tests listed in test_config.cfg with DSIM, expanding seed sweeps and
+running jobs concurrently, then writes a machine-readable results JSON.
+
+Author: UVM Base Generator
+Date: 2025-07-27
+"""
+
+import os
+import sys
+import json
+import time
+import shutil
+import random
+import signal
+import fnmatch
+import math
+import hashlib
+import socket
+import statistics
+import argparse
+import subprocess
+from pathlib import Path
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, Future
+from typing import Dict, Any, List, Optional
+
+import yaml
+
+from generate_uvm_organized import UVMGenerator
+from regression_history import RegressionHistory, estimate_makespan
+from result_cache import ResultCache, SourceHasher
+from regression_queue import RegressionQueue
+from log_parser import parse_log_file, classify_log, PhaseTracker
+from log_archive import LogArchiver
+from progress_stream import ProgressTracker, ProgressStream
+
+# Failed statuses that are rerun automatically with debug visibility
+RERUN_STATUSES = ('FAIL', 'HANG', 'TIMEOUT')
+
+# Job result fields reused from the result cache
+CACHED_KEYS = ('status', 'exit_code', 'runtime_seconds', 'uvm_counts', 'log', 'peak_memory_mb', 'rerun')
+UVM_INCDIRS = ['base', 'transactions', 'sequences', 'agents', 'env', 'tests']
+
+# Job fields a queue worker reports back to the coordinator
+WORKER_RESULT_KEYS = ('status', 'exit_code', 'runtime_seconds', 'uvm_counts', 'log', 'command',
+                      'peak_memory_mb', 'phases', 'error', 'timed_out', 'stalled', 'worker', 'attempt')
+
+
+class RegressionRunner:
+    """Parallel DSIM regression runner driven by test_config.cfg."""
+
+    def __init__(self, config_file: str = "config.yaml", dsim: Optional[str] = None):
+        """Initialize the runner with the generator configuration file."""
+        self.config_file = config_file
+        self.config = {}
+        self.base_dir = Path.cwd()
+        self.dsim = dsim
+        self.exec_dir = None
+        self.tests: List[Dict[str, str]] = []
+        self.profiles: Dict[str, Dict[str, Any]] = {}
+        self.rerun_profile: Optional[str] = None
+        self.rerun_limit = 0
+        self.rerun_timeout: Optional[float] = None
+        self.run_id = ''
+        self.history: Optional[RegressionHistory] = None
+        self.memory_budget_mb: Optional[float] = None
+        self.cache: Optional[ResultCache] = None
+        self.admission_wait = 300.0
+        self.archive_frame_bytes = 1 << 20
+        self.progress_seconds = 0.0
+        self.stall_seconds: Optional[float] = None
+        self.progress_streams: Dict[str, ProgressStream] = {}
+
+    def load_config(self) -> bool:
+        """Load YAML configuration file and locate the execution directory."""
+        try:
+            config_path = self.base_dir / self.config_file
+            if not config_path.exists():
+                print(f"ERROR: Configuration file '{self.config_file}' not found!")
+                return False
+
+            with open(config_path, 'r', encoding='utf-8') as f:
+                self.config = yaml.safe_load(f)
+
+            self.exec_dir = self.base_dir / self.config['directories']['sim_exec']
+
+            generator = UVMGenerator(self.config_file)
+            generator.config = self.config
+            self.profiles = generator.get_run_profiles()
+            return True
+
+        except Exception as e:
+            print(f"ERROR loading configuration: {e}")
+            return False
+
+    def find_dsim(self) -> Optional[str]:
+        """Locate the dsim executable (--dsim, $DSIM_HOME/bin, then PATH)."""
+        if self.dsim:
+            return self.dsim
+
+        dsim_home = os.environ.get('DSIM_HOME')
+        if dsim_home:
+            for name in ('dsim', 'dsim.exe'):
+                candidate = Path(dsim_home) / 'bin' / name
+                if candidate.exists():
+                    return str(candidate)
+
+        return shutil.which('dsim')
+
+    def load_tests(self, test_config: str = "test_config.cfg") -> bool:
+        """Parse test_config.cfg (test_name|description|filelist|test_class|wave_file|verbosity)."""
+        try:
+            config_path = self.exec_dir / test_config
+            with open(config_path, 'r', encoding='utf-8') as f:
+                for line_number, line in enumerate(f, 1):
+                    line = line.strip()
+                    if not line or line.startswith('#'):
+                        continue
+
+                    fields = [field.strip() for field in line.split('|')]
+                    if len(fields) != 6:
+                        print(f"ERROR: {config_path}:{line_number}: expected 6 '|' separated fields")
+                        return False
+
+                    name, description, filelist, test_class, wave_file, verbosity = fields
+                    self.tests.append({
+                        'name': name,
+                        'description': description,
+                        'filelist': filelist,
+                        'test_class': test_class,
+                        'wave_file': wave_file,
+                        'verbosity': verbosity,
+                    })
+            return True
+
+        except Exception as e:
+            print(f"ERROR loading test configuration: {e}")
+            return False
+
+    def select_tests(self, patterns: List[str]) -> List[Dict[str, str]]:
+        """Tests whose names match any of the glob patterns (all tests when none given)."""
+        if not patterns:
+            return list(self.tests)
+        return [t for t in self.tests if any(fnmatch.fnmatch(t['name'], p) for p in patterns)]
+
+    def expand_jobs(self, tests: List[Dict[str, str]], seeds: List[int], num_seeds: int,
+                    base_seed: Optional[int], profile: str, plusargs: List[str]) -> List[Dict[str, Any]]:
+        """Expand every selected test into one job per seed, all using the given run profile.
+
+        Without explicit seeds or a base seed, each test's seeds are derived
+        from its name, so an unchanged tree gets the same jobs (and result
+        cache hits) on every run.
+        """
+        rng = random.Random(base_seed) if base_seed is not None else None
+        jobs = []
+
+        for test in tests:
+            if seeds:
+                test_seeds = seeds
+            elif rng:
+                test_seeds = [rng.randrange(1, 2 ** 31) for _ in range(num_seeds)]
+            else:
+                test_seeds = [self.default_seed(test['name'], index) for index in range(num_seeds)]
+            for seed in test_seeds:
+                jobs.append({
+                    'id': f"{test['name']}_s{seed}",
+                    'test': test['name'],
+                    'test_class': test['test_class'],
+                    'filelist': test['filelist'],
+                    'wave_file': test['wave_file'],
+                    'verbosity': test['verbosity'],
+                    'seed': seed,
+                    'profile': profile,
+                    'plusargs': list(plusargs),
+                })
+
+        return jobs
+
+    @staticmethod
+    def default_seed(test_name: str, index: int) -> int:
+        """Seed number index of a test when no seeds are given (fixed per test name)."""
+        digest = hashlib.sha256(f'{test_name}:{index}'.encode()).digest()
+        return int.from_bytes(digest[:4], 'big') % (2 ** 31 - 1) + 1
+
+    def build_command(self, dsim: str, job: Dict[str, Any], job_dir: Path) -> List[str]:
+        """DSIM command line for a job (same options as the generated run.bat)."""
+        module_name = self.config['dut']['module_name']
+        profile = self.profiles[job['profile']]
+        verbosity = profile['verbosity'] or job['verbosity']
+
+        command = [dsim, '-uvm', '1.2']
+        command += profile['access'].split()
+        command += [f'+incdir+../uvm/{d}' for d in UVM_INCDIRS]
+        command += [
+            '+define+UVM_NO_DEPRECATED',
+            '-f', job['filelist'],
+            f"+UVM_TESTNAME={job['test_class']}",
+            f"+UVM_VERBOSITY={verbosity}",
+            '-sv_seed', str(job['seed']),
+            '-work', str(job_dir / 'dsim_work'),
+            '-l', str(job_dir / 'dsim.log'),
+        ]
+        if profile['waves']:
+            wave_file = str(job_dir / job['wave_file'])
+            command += ['-waves', wave_file, f'+WAVE_FILE={wave_file}']
+        else:
+            command += ['+NO_WAVES']
+        command += profile['plusargs']
+        command += job['plusargs']
+        command += ['-top', f'{module_name}_tb']
+        return command
+
+    def input_hash(self, job: Dict[str, Any], dsim: Optional[str], hasher: SourceHasher) -> Optional[str]:
+        """Content hash of everything that determines a job's result.
+
+        Covers the sources reached from the filelist, the full DSIM option list
+        (test, seed, verbosity, run profile, plusargs) and the simulator binary.
+        Per-job output paths are left out so identical jobs hash the same.
+        """
+        try:
+            sources = hasher.digest(job['filelist'])
+        except OSError:
+            return None
+
+        command = self.build_command('dsim', job, Path('JOB_DIR'))
+        simulator = ''
+        if dsim and Path(dsim).exists():
+            stat = Path(dsim).resolve().stat()
+            simulator = f'{Path(dsim).resolve()}:{stat.st_size}:{stat.st_mtime_ns}'
+
+        digest = hashlib.sha256()
+        for part in (sources, json.dumps(command[1:]), simulator):
+            digest.update(part.encode())
+            digest.update(b'\0')
+        return digest.hexdigest()
+
+    def reuse_cached(self, jobs: List[Dict[str, Any]], dsim: Optional[str]) -> List[Dict[str, Any]]:
+        """Fill in results of jobs whose input hash is cached; returns the cached jobs."""
+        hasher = SourceHasher(self.exec_dir, [f'../uvm/{d}' for d in UVM_INCDIRS])
+        cached = []
+        for job in jobs:
+            job['input_hash'] = self.input_hash(job, dsim, hasher)
+            hit = self.cache.lookup(job['input_hash']) if job['input_hash'] else None
+            if hit:
+                job.update(hit)
+                job['cached'] = True
+                cached.append(job)
+                print(f"[CACHED ] {job['id']} {job['status']} (from {job['cached_from']})")
+        return cached
+
+    def classify(self, job: Dict[str, Any]) -> str:
+        """PASS, FAIL, HANG, TIMEOUT or ERROR for a finished job (log rules in log_parser.classify_log)."""
+        if job.get('timed_out'):
+            return 'TIMEOUT'
+        if job.get('stalled'):
+            return 'HANG'
+        if job['exit_code'] is None:
+            return 'ERROR'
+
+        log = parse_log_file(job['log'], max_messages=1)
+        job['uvm_counts'] = log['uvm_counts']
+        return classify_log(log, job['exit_code'])
+
+    def make_rerun(self, job: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Debug rerun of a failed job: same test, seed and plusargs with the rerun profile."""
+        if not self.rerun_profile or job.get('is_rerun') or job['status'] not in RERUN_STATUSES:
+            return None
+        if self.rerun_limit <= 0:
+            return None
+
+        self.rerun_limit -= 1
+        rerun = {key: value for key, value in job.items()
+                 if key in ('test', 'test_class', 'filelist', 'wave_file', 'verbosity', 'seed', 'plusargs')}
+        rerun['id'] = f"{job['id']}_rerun"
+        rerun['profile'] = self.rerun_profile
+        rerun['is_rerun'] = True
+        rerun['rerun_of'] = job
+        return rerun
+
+    def attach_rerun(self, rerun: Dict[str, Any]):
+        """Record a finished rerun and its artifacts on the original job."""
+        original = rerun.pop('rerun_of')
+        original_cached = original.get('input_hash') is not None
+        job_dir = Path(rerun['log']).parent if rerun.get('log') else None
+        original['rerun'] = {
+            'status': rerun['status'],
+            'reproduced': rerun['status'] != 'PASS',
+            'profile': rerun['profile'],
+            'runtime_seconds': rerun['runtime_seconds'],
+            'log': rerun.get('log'),
+            'dsim_log': str(job_dir / 'dsim.log') if job_dir else None,
+            'waves': str(job_dir / rerun['wave_file']) if job_dir and self.profiles[rerun['profile']]['waves'] else None,
+            'command': rerun.get('command'),
+            'error': rerun.get('error'),
+        }
+        if self.cache and original_cached:
+            # Keep the cached entry's rerun artifacts in step with the original
+            self.cache.store(self.run_id, original, CACHED_KEYS)
+
+    def start_job(self, dsim: str, job: Dict[str, Any], run_dir: Path) -> Optional[subprocess.Popen]:
+        """Launch one simulation in its own job directory; output goes to run.log."""
+        job_dir = run_dir / job['id']
+        job_dir.mkdir(parents=True, exist_ok=True)
+        job['command'] = self.build_command(dsim, job, job_dir)
+        job['log'] = str(job_dir / 'run.log')
+        job['start'] = time.time()
+        # The progress tracker also times the build phases, reading the log only once
+        tracker = ProgressTracker if self.progress_seconds or self.stall_limit(job) else PhaseTracker
+        job['log_tracker'] = tracker(job['log'], job['start'])
+
+        try:
+            with open(job['log'], 'w', encoding='utf-8') as log:
+                # New process group/session so a timeout can kill the whole simulator tree
+                if os.name == 'nt':
+                    kwargs = {'creationflags': subprocess.CREATE_NEW_PROCESS_GROUP}
+                else:
+                    kwargs = {'start_new_session': True}
+                    if job.get('is_rerun'):
+                        # Debug reruns yield the CPU to the regression itself
+                        kwargs['preexec_fn'] = lambda: os.nice(10)
+                return subprocess.Popen(job['command'], cwd=self.exec_dir, stdout=log,
+                                        stderr=subprocess.STDOUT, **kwargs)
+        except OSError as e:
+            job['exit_code'] = None
+            job['error'] = str(e)
+            return None
+
+    @staticmethod
+    def kill_job(process: subprocess.Popen):
+        """Terminate a job and everything it started."""
+        try:
+            if os.name == 'nt':
+                process.kill()
+            else:
+                os.killpg(process.pid, signal.SIGKILL)
+        except OSError:
+            pass
+        process.wait()
+
+    def finish_job(self, job: Dict[str, Any], exit_code: Optional[int]):
+        """Record the outcome of a completed job."""
+        job['exit_code'] = exit_code
+        job['runtime_seconds'] = round(job.get('end', time.time()) - job['start'], 3)
+        self.close_phases(job)
+        job['status'] = self.classify(job)
+        self.emit_progress('end', job, status=job['status'], exit_code=exit_code,
+                           runtime_seconds=job['runtime_seconds'])
+        self.record_result(job)
+
+    def track_logs(self, running: Dict[int, tuple]):
+        """Follow the logs of running jobs: build phase times, and progress events when enabled."""
+        now = time.time()
+        for pid, (_, job) in running.items():
+            tracker = job['log_tracker']
+            tracker.poll(now)
+            if self.progress_seconds and tracker.snapshot_due(now, self.progress_seconds):
+                self.emit_progress('progress', job, pid=pid, **tracker.snapshot(now))
+
+    def stall_limit(self, job: Dict[str, Any]) -> Optional[float]:
+        """Seconds without simulated time advancing after which a job is killed (None: never)."""
+        return job['stall_seconds'] if 'stall_seconds' in job else self.stall_seconds
+
+    def is_stalled(self, job: Dict[str, Any]) -> bool:
+        """True when a running job's simulated time has not advanced for its stall limit."""
+        limit = self.stall_limit(job)
+        tracker = job.get('log_tracker')
+        return bool(limit) and isinstance(tracker, ProgressTracker) and tracker.stalled_for(time.time()) >= limit
+
+    def emit_progress(self, event: str, job: Dict[str, Any], **fields):
+        """Append an event about a job to its run's progress stream, if there is one."""
+        stream = self.progress_streams.get(job.get('run_id') or self.run_id)
+        if stream:
+            stream.emit(event, run_id=job.get('run_id') or self.run_id, job=job['id'], test=job['test'],
+                        seed=job['seed'], host=socket.gethostname(), **fields)
+
+    def emit_run_event(self, event: str, **fields):
+        """Append a run-level event to this run's progress stream, if there is one."""
+        stream = self.progress_streams.get(self.run_id)
+        if stream:
+            stream.emit(event, run_id=self.run_id, **fields)
+
+    @staticmethod
+    def close_phases(job: Dict[str, Any]):
+        """Turn a finished job's phase timestamps into per-phase seconds."""
+        tracker = job.pop('log_tracker', None)
+        if tracker:
+            job['phases'] = tracker.durations(job.get('end', time.time()))
+
+    def start_archiver(self, disabled: bool = False) -> Optional[ThreadPoolExecutor]:
+        """Background compression of finished job logs, unless disabled or off in config.yaml."""
+        regression = self.config.get('regression', {})
+        if disabled or not regression.get('archive_logs', False):
+            return None
+        self.archive_frame_bytes = regression.get('archive_frame_kb', 1024) * 1024
+        return ThreadPoolExecutor(max_workers=regression.get('archive_workers', 2))
+
+    def archive_logs(self, job: Dict[str, Any]):
+        """Compress a finished job's logs (runs in an archiver thread); job['log'] then names the archive."""
+        archiver = LogArchiver(self.archive_frame_bytes)
+        job_dir = Path(job['log']).parent
+        for name in ('dsim.log', 'run.log'):
+            log = job_dir / name
+            if not log.exists():
+                continue
+            try:
+                archiver.archive(str(log))
+            except OSError as e:
+                print(f"WARNING: {log} left uncompressed: {e}")
+                continue
+            if name == 'run.log':
+                job['log'] = str(log) + archiver.suffix()
+
+    def record_result(self, job: Dict[str, Any]):
+        """Report a finished job and store it in the history and result cache."""
+        runtime = f"{job['runtime_seconds']:.1f}s" if job.get('runtime_seconds') is not None else '-'
+        worker = f" on {job['worker']}" if job.get('worker') else ''
+        print(f"[{job['status']:7}] {job['id']} ({runtime}){worker}")
+        if job.get('rerun_of'):
+            self.attach_rerun(job)
+            return
+        if self.history:
+            self.history.record(self.run_id, job)
+        if self.cache and job.get('input_hash'):
+            self.cache.store(self.run_id, job, CACHED_KEYS)
+
+    def run_jobs(self, jobs: List[Dict[str, Any]], max_jobs: int, timeout: Optional[float],
+                 run_dir: Path, archiver: Optional[ThreadPoolExecutor] = None) -> List[Dict[str, Any]]:
+        """Run jobs with at most max_jobs concurrent simulations.
+
+        Failed jobs are queued for a debug rerun; the rerun queue is low priority
+        and only gets a slot when no regular job is waiting. With a memory budget,
+        jobs are also only started while their expected memory fits. With an
+        archiver, the logs of finished jobs (not debug reruns) are compressed in
+        the background and the job is classified from the archive.
+        """
+        regression = self.config.get('regression', {})
+        sample_interval = regression.get('memory_sample_seconds', 1.0)
+        can_sample = os.path.isdir('/proc')
+        last_sample = 0.0
+
+        dsim = self.find_dsim()
+        pending = list(jobs)
+        reruns: List[Dict[str, Any]] = []
+        running: Dict[int, tuple] = {}
+        archiving: Dict[Future, tuple] = {}
+
+        while pending or reruns or running or archiving:
+            # Start jobs while there are free slots and memory
+            while (pending or reruns) and len(running) < max_jobs:
+                job = self.admit(pending if pending else reruns, running)
+                if job is None:
+                    break
+                if dsim is None:
+                    job['start'] = time.time()
+                    job['error'] = "dsim not found (set DSIM_HOME, add it to PATH or pass --dsim)"
+                    self.finish_job(job, None)
+                    continue
+
+                process = self.start_job(dsim, job, run_dir)
+                if process is None:
+                    self.finish_job(job, None)
+                else:
+                    running[process.pid] = (process, job)
+                    self.emit_progress('start', job, pid=process.pid, log=job['log'])
+
+            # Track the resident memory of every running simulation
+            if can_sample and running and time.time() - last_sample >= sample_interval:
+                last_sample = time.time()
+                self.update_memory(running)
+
+            self.track_logs(running)
+
+            # Reap finished jobs and enforce the per-job timeout and stall limit
+            ended = []
+            for pid, (process, job) in list(running.items()):
+                exit_code = process.poll()
+                job_timeout = self.rerun_timeout if job.get('rerun_of') else timeout
+                if exit_code is None and job_timeout and time.time() - job['start'] > job_timeout:
+                    job['timed_out'] = True
+                    self.kill_job(process)
+                    exit_code = process.returncode
+                elif exit_code is None and self.is_stalled(job):
+                    job['stalled'] = True
+                    job['error'] = f"simulated time stalled for {self.stall_limit(job)}s, killed"
+                    print(f"[STALLED] {job['id']} simulated time stopped advancing, killing")
+                    self.kill_job(process)
+                    exit_code = process.returncode
+
+                if exit_code is not None:
+                    del running[pid]
+                    job['end'] = time.time()
+                    if archiver and not job.get('rerun_of'):
+                        archiving[archiver.submit(self.archive_logs, job)] = (job, exit_code)
+                    else:
+                        ended.append((job, exit_code))
+
+            # Classify jobs once their logs are final
+            ended += [archiving.pop(future) for future in list(archiving) if future.done()]
+            for job, exit_code in ended:
+                self.finish_job(job, exit_code)
+                rerun = self.make_rerun(job)
+                if rerun:
+                    rerun['estimated_memory_mb'] = max(job['estimated_memory_mb'], job.get('peak_memory_mb', 0.0))
+                    reruns.append(rerun)
+
+            if running or archiving:
+                time.sleep(0.1)
+
+        return jobs
+
+    def write_results(self, jobs: List[Dict[str, Any]], run_dir: Path, started: float,
+                      output: Optional[str] = None, extra: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Write the results JSON for the regression."""
+        statuses = [job['status'] for job in jobs]
+        results = {
+            'run_id': run_dir.name,
+            'started': datetime.fromtimestamp(started).isoformat(timespec='seconds'),
+            'wall_seconds': round(time.time() - started, 3),
+            'summary': {status: statuses.count(status) for status in
+                        ('PASS', 'FAIL', 'HANG', 'TIMEOUT', 'ERROR')},
+            'total': len(jobs),
+            'jobs': [{key: job.get(key) for key in
+                      ('id', 'test', 'test_class', 'seed', 'profile', 'status', 'exit_code', 'runtime_seconds',
+                       'estimated_seconds', 'estimated_memory_mb', 'peak_memory_mb', 'phases',
+                       'uvm_counts', 'log', 'command', 'plusargs', 'error', 'rerun',
+                       'input_hash', 'cached', 'cached_from', 'worker', 'attempt')}
+                     for job in jobs],
+        }
+        results.update(extra or {})
+
+        for path in filter(None, [run_dir / 'results.json', output]):
+            Path(path).write_text(json.dumps(results, indent=2), encoding='utf-8')
+        return results
+
+    def memory_budget(self, args: argparse.Namespace) -> Optional[float]:
+        """Memory budget in MB of this host (--memory-budget, memory_budget_gb or a share of RAM), None for none."""
+        regression = self.config.get('regression', {})
+        budget_gb = args.memory_budget if args.memory_budget is not None else regression.get('memory_budget_gb')
+        if budget_gb is None:
+            host_mb = self.host_memory_mb()
+            return host_mb * regression.get('memory_budget_fraction', 0.8) if host_mb else None
+        return budget_gb * 1024 if budget_gb else None
+
+    @staticmethod
+    def host_memory_mb() -> Optional[float]:
+        """Physical memory of the host from /proc/meminfo (None where unavailable)."""
+        try:
+            with open('/proc/meminfo', 'r', encoding='ascii') as f:
+                for line in f:
+                    if line.startswith('MemTotal:'):
+                        return int(line.split()[1]) / 1024
+        except OSError:
+            pass
+        return None
+
+    @staticmethod
+    def sample_memory(process_groups: List[int]) -> Dict[int, float]:
+        """Resident memory in MB of each process group, summed over its processes (Linux /proc)."""
+        usage = {pgid: 0.0 for pgid in process_groups}
+        page_mb = os.sysconf('SC_PAGE_SIZE') / (1024 * 1024)
+
+        for entry in os.scandir('/proc'):
+            if not entry.name.isdigit():
+                continue
+            try:
+                with open(f'/proc/{entry.name}/stat', 'r', encoding='ascii', errors='replace') as f:
+                    stat = f.read()
+            except OSError:
+                continue
+
+            # Fields after the parenthesized command name: state ppid pgrp ... rss (24th overall)
+            fields = stat[stat.rfind(')') + 2:].split()
+            pgid = int(fields[2])
+            if pgid in usage:
+                usage[pgid] += int(fields[21]) * page_mb
+
+        return usage
+
+    def update_memory(self, running: Dict[int, tuple]):
+        """Record current and peak resident memory of running jobs (keyed by process group)."""
+        for pid, memory_mb in self.sample_memory(list(running)).items():
+            job = running[pid][1]
+            job['memory_mb'] = memory_mb
+            job['peak_memory_mb'] = round(max(job.get('peak_memory_mb', 0.0), memory_mb), 1)
+
+    def estimate_memory(self, jobs: List[Dict[str, Any]]):
+        """Attach an expected peak memory (MB) from history to every job."""
+        regression = self.config.get('regression', {})
+        for job in jobs:
+            job['estimated_memory_mb'] = self.history.estimate_memory(job['test'], job['profile'])
+        known = [job['estimated_memory_mb'] for job in jobs if job['estimated_memory_mb'] is not None]
+        fallback = max(known) if known else regression.get('default_memory_gb', 2.0) * 1024
+        for job in jobs:
+            if job['estimated_memory_mb'] is None:
+                job['estimated_memory_mb'] = fallback
+
+    def admit(self, queue: List[Dict[str, Any]], running: Dict[int, tuple]) -> Optional[Dict[str, Any]]:
+        """Take the next job that fits into the free memory budget (first fit in queue order).
+
+        A running job counts with the larger of its estimated and its measured memory.
+        A job bigger than the whole budget starts alone. Once the head of the queue has
+        waited admission_wait seconds, smaller jobs stop being backfilled around it.
+        """
+        if self.memory_budget_mb is None:
+            return queue.pop(0)
+        if not running:
+            queue[0].pop('blocked_since', None)
+            return queue.pop(0)
+
+        committed = sum(max(job['estimated_memory_mb'], job.get('memory_mb', 0.0)) for _, job in running.values())
+        free = self.memory_budget_mb - committed
+
+        head = queue[0]
+        if head['estimated_memory_mb'] <= free:
+            head.pop('blocked_since', None)
+            return queue.pop(0)
+
+        head.setdefault('blocked_since', time.time())
+        if time.time() - head['blocked_since'] > self.admission_wait:
+            return None
+
+        for index, job in enumerate(queue[1:], 1):
+            if job['estimated_memory_mb'] <= free:
+                return queue.pop(index)
+        return None
+
+    def schedule_jobs(self, jobs: List[Dict[str, Any]], max_jobs: int,
+                      stable_policy: str) -> tuple:
+        """Order jobs longest-processing-time first from runtime history.
+
+        Returns (scheduled jobs, skipped jobs, estimated wall time). Jobs without
+        history are assumed to take the average of the known estimates. Tests that
+        have passed their last stable_runs runs and cost at least the median
+        estimate are moved to the end ('deprioritize') or run on only a sample of
+        their seeds ('sample').
+        """
+        regression = self.config.get('regression', {})
+
+        for job in jobs:
+            job['estimated_seconds'] = self.history.estimate(job['test'], job['seed'], job['profile'])
+        known = [job['estimated_seconds'] for job in jobs if job['estimated_seconds'] is not None]
+        fallback = sum(known) / len(known) if known else regression.get('default_runtime_seconds', 60)
+        for job in jobs:
+            job['estimate_known'] = job['estimated_seconds'] is not None
+            if not job['estimate_known']:
+                job['estimated_seconds'] = fallback
+
+        skipped = []
+        if stable_policy != 'none' and known:
+            stable_runs = regression.get('stable_runs', 20)
+            expensive = statistics.median(known)
+            stable_tests = {job['test'] for job in jobs
+                            if job['estimated_seconds'] >= expensive and self.history.is_stable(job['test'], stable_runs)}
+
+            if stable_policy == 'sample':
+                rate = regression.get('stable_sample_rate', 0.25)
+                kept = []
+                for test in dict.fromkeys(job['test'] for job in jobs):
+                    test_jobs = [job for job in jobs if job['test'] == test]
+                    keep = max(1, math.ceil(len(test_jobs) * rate)) if test in stable_tests else len(test_jobs)
+                    kept += test_jobs[:keep]
+                    skipped += test_jobs[keep:]
+                jobs = kept
+            else:
+                for job in jobs:
+                    job['deprioritized'] = job['test'] in stable_tests
+
+        jobs = sorted(jobs, key=lambda job: (job.get('deprioritized', False), -job['estimated_seconds']))
+        return jobs, skipped, estimate_makespan([job['estimated_seconds'] for job in jobs], max_jobs)
+
+    def start_local_workers(self, count: int, queue_db: str, run_dir: Path) -> List[subprocess.Popen]:
+        """Start queue workers on this host (one simulation each), logging to run_dir/worker<N>.log."""
+        command = [sys.executable, str(Path(__file__).resolve()), '--worker', '--queue', queue_db,
+                   '-c', self.config_file, '-j', '1']
+        if self.dsim:
+            command += ['--dsim', self.dsim]
+
+        workers = []
+        for index in range(count):
+            with open(run_dir / f'worker{index}.log', 'w', encoding='utf-8') as log:
+                workers.append(subprocess.Popen(command, cwd=self.base_dir, stdout=log, stderr=subprocess.STDOUT))
+        return workers
+
+    def run_distributed(self, jobs: List[Dict[str, Any]], timeout: Optional[float], run_dir: Path,
+                        queue_db: str, workers: List[subprocess.Popen]) -> List[Dict[str, Any]]:
+        """Coordinate a regression through the shared work queue.
+
+        Jobs are enqueued in scheduling order. Results are collected as workers
+        complete them; failures get their debug rerun enqueued behind all regular
+        jobs, and jobs whose worker stopped heartbeating are requeued.
+        """
+        regression = self.config.get('regression', {})
+        queue = RegressionQueue(queue_db, regression.get('lease_seconds', 120))
+        max_attempts = regression.get('max_attempts', 3)
+
+        queue.create_run(self.run_id, str(run_dir.resolve()))
+        queue.enqueue(self.run_id, [(priority, dict(job, timeout=timeout, stall_seconds=self.stall_seconds))
+                                     for priority, job in enumerate(jobs)])
+        outstanding = {job['id']: job for job in jobs}
+        next_priority = len(jobs)
+
+        try:
+            while outstanding:
+                for lease in queue.requeue_expired(self.run_id, max_attempts):
+                    action = 'requeued' if lease['requeued'] else 'abandoned'
+                    print(f"[LEASE  ] {lease['id']} lease of {lease['worker']} expired, {action}")
+
+                for job_id, result in queue.collect(self.run_id):
+                    job = outstanding.pop(job_id)
+                    job.update(result)
+                    self.record_result(job)
+                    rerun = self.make_rerun(job)
+                    if rerun:
+                        payload = {key: value for key, value in rerun.items() if key != 'rerun_of'}
+                        payload['estimated_memory_mb'] = max(job['estimated_memory_mb'], job.get('peak_memory_mb') or 0.0)
+                        payload['timeout'] = self.rerun_timeout
+                        payload['stall_seconds'] = self.stall_seconds
+                        queue.enqueue(self.run_id, [(next_priority, payload)])
+                        outstanding[rerun['id']] = rerun
+                        next_priority += 1
+
+                if workers and outstanding and all(worker.poll() is not None for worker in workers):
+                    print("ERROR: All local workers exited with jobs outstanding")
+                    break
+                if outstanding:
+                    time.sleep(1.0)
+        finally:
+            queue.close_run(self.run_id)
+            queue.close()
+
+        for job in outstanding.values():
+            if job.get('is_rerun'):
+                continue
+            job.update({'status': 'ERROR', 'exit_code': None, 'error': 'not completed by any worker'})
+        return jobs
+
+    def run_worker(self, args: argparse.Namespace) -> bool:
+        """Serve the shared work queue until it has been idle for idle_exit seconds.
+
+        Each claimed job runs in the run directory registered by its coordinator
+        (retries of a lost job in attempt<N>/ below it, so a stray simulation cannot
+        clobber them). Leases are renewed every heartbeat_seconds; a job whose
+        lease was lost (requeued or run cancelled) is killed. Jobs are only
+        claimed while their expected memory fits the host's memory budget,
+        counting the jobs of all workers on the host.
+        """
+        if not self.load_config():
+            return False
+
+        regression = self.config.get('regression', {})
+        queue = RegressionQueue(args.queue, regression.get('lease_seconds', 120))
+        heartbeat = regression.get('heartbeat_seconds', 15)
+        self.progress_seconds = regression.get('progress_seconds', 0.0)
+        self.stall_seconds = regression.get('stall_seconds')
+        idle_exit = args.idle_exit if args.idle_exit is not None else regression.get('worker_idle_exit_seconds', 60)
+        max_jobs = args.jobs or 1
+        self.memory_budget_mb = self.memory_budget(args)
+        worker = f"{socket.gethostname()}:{os.getpid()}"
+        dsim = self.find_dsim()
+        can_sample = os.path.isdir('/proc')
+        archiver = self.start_archiver(args.no_archive)
+
+        running: Dict[int, tuple] = {}
+        archiving: Dict[Future, tuple] = {}
+        idle_since = time.time()
+        last_heartbeat = time.time()
+        budget = f", {self.memory_budget_mb / 1024:.1f} GB memory budget" if self.memory_budget_mb else ''
+        print(f"Worker {worker} serving {args.queue} ({max_jobs} slot(s){budget})")
+
+        if os.name != 'nt':
+            # Let the finally block release leases when the worker is terminated
+            signal.signal(signal.SIGTERM, lambda *_: sys.exit(1))
+
+        try:
+            while True:
+                while len(running) < max_jobs:
+                    claim = queue.claim(worker, self.memory_budget_mb)
+                    if claim is None:
+                        break
+                    job = claim['job']
+                    job.update({'run_id': claim['run_id'], 'worker': worker, 'attempt': claim['attempt']})
+                    run_dir = Path(claim['run_dir'])
+                    if self.progress_seconds and claim['run_id'] not in self.progress_streams:
+                        stream = run_dir / f"progress-{worker.replace(':', '-')}.jsonl"
+                        self.progress_streams[claim['run_id']] = ProgressStream(str(stream))
+                    if claim['attempt'] > 1:
+                        run_dir = run_dir / f"attempt{claim['attempt']}"
+                    print(f"[START  ] {job['id']} ({claim['run_id']}, attempt {claim['attempt']})")
+
+                    if dsim is None:
+                        job['start'] = time.time()
+                        job['error'] = f"dsim not found on {socket.gethostname()}"
+                        job.update(exit_code=None, runtime_seconds=0.0, status='ERROR')
+                        queue.complete(worker, job['run_id'], job['id'], {k: job.get(k) for k in WORKER_RESULT_KEYS})
+                        continue
+
+                    process = self.start_job(dsim, job, run_dir)
+                    if process is None:
+                        job.update(runtime_seconds=0.0, status='ERROR')
+                        queue.complete(worker, job['run_id'], job['id'], {k: job.get(k) for k in WORKER_RESULT_KEYS})
+                    else:
+                        running[process.pid] = (process, job)
+                        self.emit_progress('start', job, pid=process.pid, log=job['log'], worker=worker)
+
+                if running or archiving:
+                    idle_since = time.time()
+                elif idle_exit and time.time() - idle_since > idle_exit and not queue.has_open_runs():
+                    break
+
+                if (running or archiving) and time.time() - last_heartbeat >= heartbeat:
+                    last_heartbeat = time.time()
+                    if can_sample:
+                        self.update_memory(running)
+                    leases = [(job['run_id'], job['id']) for _, job in running.values()]
+                    leases += [(job['run_id'], job['id']) for job, _ in archiving.values()]
+                    lost = set(queue.heartbeat(worker, leases))
+                    for pid, (process, job) in list(running.items()):
+                        if (job['run_id'], job['id']) in lost:
+                            print(f"[LOST   ] {job['id']} lease lost, killing simulation")
+                            self.kill_job(process)
+                            del running[pid]
+
+                self.track_logs(running)
+                ended = []
+                for pid, (process, job) in list(running.items()):
+                    exit_code = process.poll()
+                    if exit_code is None and job.get('timeout') and time.time() - job['start'] > job['timeout']:
+                        job['timed_out'] = True
+                        self.kill_job(process)
+                        exit_code = process.returncode
+                    elif exit_code is None and self.is_stalled(job):
+                        job['stalled'] = True
+                        job['error'] = f"simulated time stalled for {self.stall_limit(job)}s, killed"
+                        print(f"[STALLED] {job['id']} simulated time stopped advancing, killing")
+                        self.kill_job(process)
+                        exit_code = process.returncode
+
+                    if exit_code is not None:
+                        del running[pid]
+                        job['end'] = time.time()
+                        if archiver:
+                            archiving[archiver.submit(self.archive_logs, job)] = (job, exit_code)
+                        else:
+                            ended.append((job, exit_code))
+
+                # Report jobs once their logs are final
+                ended += [archiving.pop(future) for future in list(archiving) if future.done()]
+                for job, exit_code in ended:
+                    job['exit_code'] = exit_code
+                    job['runtime_seconds'] = round(job['end'] - job['start'], 3)
+                    self.close_phases(job)
+                    job['status'] = self.classify(job)
+                    self.emit_progress('end', job, status=job['status'], exit_code=exit_code,
+                                       runtime_seconds=job['runtime_seconds'])
+                    print(f"[{job['status']:7}] {job['id']} ({job['runtime_seconds']:.1f}s)")
+                    queue.complete(worker, job['run_id'], job['id'], {k: job.get(k) for k in WORKER_RESULT_KEYS})
+
+                time.sleep(0.1 if running or archiving else 1.0)
+        except KeyboardInterrupt:
+            print(f"Worker {worker} interrupted")
+        finally:
+            for process, _ in running.values():
+                self.kill_job(process)
+            if archiver:
+                archiver.shutdown(cancel_futures=True)
+            queue.release(worker, [(job['run_id'], job['id']) for _, job in running.values()] +
+                          [(job['run_id'], job['id']) for job, _ in archiving.values()])
+            queue.close()
+            for stream in self.progress_streams.values():
+                stream.close()
+
+        return True
+
+    def run(self, args: argparse.Namespace) -> bool:
+        """Main execution function. Returns True when every job passed."""
+        if not self.load_config() or not self.load_tests():
+            return False
+
+        regression = self.config.get('regression', {})
+        max_jobs = args.jobs or regression.get('jobs') or os.cpu_count() or 1
+        queue_db = args.queue or regression.get('queue_db')
+        # Queue workers admit jobs against the memory budget of their own hosts
+        self.memory_budget_mb = None if queue_db else self.memory_budget(args)
+        self.admission_wait = regression.get('admission_wait_seconds', 300)
+        timeout = args.timeout if args.timeout is not None else regression.get('timeout_seconds')
+        profile = args.profile or regression.get('profile', 'regression')
+        stable_policy = args.stable_policy or regression.get('stable_policy', 'none')
+        self.rerun_profile = None if args.no_rerun else regression.get('rerun_profile', 'rerun')
+        self.rerun_limit = regression.get('rerun_limit', 10)
+        self.rerun_timeout = regression.get('rerun_timeout_seconds', timeout)
+        self.progress_seconds = regression.get('progress_seconds', 0.0)
+        self.stall_seconds = args.stall if args.stall is not None else regression.get('stall_seconds')
+        for name in filter(None, [profile, self.rerun_profile]):
+            if name not in self.profiles:
+                print(f"ERROR: Run profile '{name}' not found (available: {', '.join(self.profiles)})")
+                return False
+
+        tests = self.select_tests(args.tests)
+        if not tests:
+            print(f"ERROR: No tests match {' '.join(args.tests)}")
+            return False
+
+        output_dir = self.base_dir / regression.get('output_dir', 'sim/exec/regression')
+        run_dir = output_dir / datetime.now().strftime('%Y%m%d_%H%M%S')
+        run_dir.mkdir(parents=True, exist_ok=True)
+        self.run_id = run_dir.name
+        history_db = args.history_db or self.base_dir / regression.get('history_db', output_dir / 'history.db')
+        self.history = RegressionHistory(str(history_db), regression.get('dashboard_db'))
+
+        cache_db = args.cache_db or self.base_dir / regression.get('cache_db', output_dir / 'result_cache.db')
+        self.cache = ResultCache(str(cache_db))
+        evicted = self.cache.evict(regression.get('cache_max_age_days'), regression.get('cache_max_entries'))
+
+        all_jobs = self.expand_jobs(tests, args.seed, args.seeds, args.base_seed, profile, args.plusarg)
+        cached = [] if args.force else self.reuse_cached(all_jobs, self.find_dsim())
+        jobs = [job for job in all_jobs if not job.get('cached')]
+        self.estimate_memory(jobs)
+        skipped = []
+        estimate = None
+        if args.schedule == 'lpt':
+            jobs, skipped, estimate = self.schedule_jobs(jobs, max_jobs, stable_policy)
+
+        print("=== UVM Regression ===")
+        print(f"Tests: {len(tests)}  Jobs: {len(jobs)}  Parallel: {max_jobs}  "
+              f"Timeout: {f'{timeout}s' if timeout else 'none'}  Profile: {profile}")
+        if estimate is not None:
+            with_history = sum(1 for job in jobs if job['estimate_known'])
+            print(f"Estimated wall time: {estimate:.0f}s ({with_history} of {len(jobs)} jobs with history, "
+                  f"longest first)")
+        if skipped:
+            print(f"Skipped {len(skipped)} job(s) of stable expensive tests (sampling)")
+        if cached:
+            print(f"Reused {len(cached)} cached result(s) (--force to rerun)")
+        if evicted:
+            print(f"Evicted {evicted} expired result cache entries")
+        if self.memory_budget_mb:
+            print(f"Memory budget: {self.memory_budget_mb / 1024:.1f} GB")
+        if self.rerun_profile:
+            print(f"Failures rerun with profile '{self.rerun_profile}' (up to {self.rerun_limit})")
+        if self.stall_seconds:
+            print(f"Jobs whose simulated time stalls for {self.stall_seconds}s are killed")
+        if queue_db:
+            print(f"Queue: {queue_db}" + (f" ({args.local_workers} local workers)" if args.local_workers else ''))
+        print(f"Output: {run_dir}")
+        if self.progress_seconds:
+            self.progress_streams[self.run_id] = ProgressStream(str(run_dir / 'progress.jsonl'))
+            self.emit_run_event('run_start', jobs=len(jobs), parallel=max_jobs)
+            print(f"Progress: python scripts/progress_stream.py {run_dir}")
+        print()
+
+        started = time.time()
+        workers = self.start_local_workers(args.local_workers, str(queue_db), run_dir) if queue_db else []
+        # Queue workers compress the logs of the jobs they run
+        archiver = None if queue_db else self.start_archiver(args.no_archive)
+        try:
+            if queue_db:
+                self.run_distributed(jobs, timeout, run_dir, str(queue_db), workers)
+            else:
+                self.run_jobs(jobs, max_jobs, timeout, run_dir, archiver)
+        finally:
+            for worker in workers:
+                worker.terminate()
+                worker.wait()
+            if archiver:
+                archiver.shutdown(cancel_futures=True)
+            self.history.close()
+            self.cache.close()
+            self.emit_run_event('run_end')
+            for stream in self.progress_streams.values():
+                stream.close()
+        results = self.write_results(cached + jobs, run_dir, started, args.output, {
+            'estimated_wall_seconds': estimate,
+            'skipped': [job['id'] for job in skipped],
+            'memory_budget_gb': round(self.memory_budget_mb / 1024, 2) if self.memory_budget_mb else None,
+            'memory_usage_gb': round(max([job.get('peak_memory_mb') or 0.0 for job in jobs] or [0.0]) / 1024, 3),
+        })
+
+        print()
+        print("=== Regression Complete ===")
+        print("  ".join(f"{status}: {count}" for status, count in results['summary'].items()))
+        for job in cached + jobs:
+            if job.get('rerun'):
+                print(f"  {job['id']}: rerun {job['rerun']['status']} -> {Path(job['rerun']['log']).parent}")
+        print(f"Wall time: {results['wall_seconds']:.1f}s")
+        print(f"Results: {run_dir / 'results.json'}")
+
+        return results['summary']['PASS'] == results['total']
+
+def main():
+    """Main function with command line argument parsing."""
+    parser = argparse.ArgumentParser(description="Parallel UVM regression runner for DSIM")
+    parser.add_argument("tests", nargs="*",
+                       help="Test names or glob patterns from test_config.cfg (default: all)")
+    parser.add_argument("-c", "--config", default="config.yaml",
+                       help="Configuration file path (default: config.yaml)")
+    parser.add_argument("-j", "--jobs", type=int, default=None,
+                       help="Concurrent simulations (default: regression.jobs or CPU count)")
+    parser.add_argument("-n", "--seeds", type=int, default=1,
+                       help="Seeds per test (default: 1); without --base-seed they are derived from the test name, "
+                            "so rerunning an unchanged tree reuses cached results")
+    parser.add_argument("-s", "--seed", type=int, action="append", default=[],
+                       help="Explicit seed; repeat for a sweep (overrides --seeds)")
+    parser.add_argument("--base-seed", type=int, default=None,
+                       help="Seed for generating a different (reproducible) seed sweep, e.g. a date for new seeds nightly")
+    parser.add_argument("-t", "--timeout", type=float, default=None,
+                       help="Per-job timeout in seconds (default: regression.timeout_seconds)")
+    parser.add_argument("-o", "--output", default=None,
+                       help="Also write the results JSON to this path")
+    parser.add_argument("-p", "--profile", default=None,
+                       help="Run profile from run_profiles in config.yaml (default: regression.profile)")
+    parser.add_argument("-a", "--plusarg", action="append", default=[],
+                       help="Extra plusarg for every job, kept for reruns (repeatable)")
+    parser.add_argument("--no-rerun", action="store_true",
+                       help="Do not rerun failures with the rerun profile")
+    parser.add_argument("--schedule", choices=["lpt", "file"], default="lpt",
+                       help="Job order: longest first from history (lpt) or test_config.cfg order (file)")
+    parser.add_argument("--stable-policy", choices=["none", "deprioritize", "sample"], default=None,
+                       help="Handling of stable expensive tests (default: regression.stable_policy)")
+    parser.add_argument("--history-db", default=None,
+                       help="Runtime history database (default: regression.history_db)")
+    parser.add_argument("-m", "--memory-budget", type=float, default=None,
+                       help="Memory budget in GB for concurrent jobs, 0 disables (default: regression.memory_budget_gb)")
+    parser.add_argument("-f", "--force", action="store_true",
+                       help="Simulate every job even when a cached result for the same inputs exists")
+    parser.add_argument("--cache-db", default=None,
+                       help="Result cache database (default: regression.cache_db)")
+    parser.add_argument("--stall", type=float, default=None,
+                       help="Kill jobs whose simulated time has not advanced for this many seconds (default: regression.stall_seconds)")
+    parser.add_argument("--no-archive", action="store_true",
+                       help="Keep job logs uncompressed (default: regression.archive_logs)")
+    parser.add_argument("--queue", default=None,
+                       help="Shared queue database: coordinate the regression through queue workers (default: regression.queue_db)")
+    parser.add_argument("-w", "--local-workers", type=int, default=0,
+                       help="With --queue, also start this many workers on this host")
+    parser.add_argument("--worker", action="store_true",
+                       help="Run as a queue worker for --queue; -j sets concurrent simulations (default: 1)")
+    parser.add_argument("--idle-exit", type=float, default=None,
+                       help="Worker exits after this many idle seconds, 0 never (default: regression.worker_idle_exit_seconds)")
+    parser.add_argument("--dsim", default=None,
+                       help="dsim executable (default: $DSIM_HOME/bin/dsim or PATH)")
+
+    args = parser.parse_args()
+
+    if args.worker and not args.queue:
+        parser.error("--worker requires --queue")
+
+    runner = RegressionRunner(args.config, args.dsim)
+    success = runner.run_worker(args) if args.worker else runner.run(args)
+
+    sys.exit(0 if success else 1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+UVM Regression Result Cache
+Memoizes regression job results keyed on a content hash of every simulation
+input: the sources reached from the filelist (including `include files), the
+filelist itself, and the DSIM command line options.
+
+Author: UVM Base Generator
+Date: 2025-07-27
+"""
+
+import os
+import re
+import json
+import sqlite3
+import hashlib
+from pathlib import Path
+from datetime import datetime, timedelta
+from typing import Dict, Any, List, Optional
+
+INCLUDE_PATTERN = re.compile(rb'`include\s+"([^"]+)"')
+
+# Deterministic outcomes that may be reused; timeouts and launch errors are not
+CACHEABLE_STATUSES = ('PASS', 'FAIL', 'HANG')
+
+
+def file_digest(path: Path) -> str:
+    """SHA-256 of a file's contents."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class SourceHasher:
+    """Content hash of the sources a filelist pulls into a simulation."""
+
+    def __init__(self, exec_dir: Path, incdirs: List[str]):
+        """Paths in filelists and incdirs are relative to the simulation directory."""
+        self.exec_dir = exec_dir
+        self.incdirs = [self.resolve(d, exec_dir) for d in incdirs]
+        self._digests: Dict[str, str] = {}
+
+    @staticmethod
+    def resolve(name: str, base: Path) -> Path:
+        """Resolve a filelist path (either slash style) against a directory."""
+        path = Path(name.replace('\\', '/'))
+        return path if path.is_absolute() else (base / path)
+
+    def filelist_entries(self, filelist: Path, incdirs: List[Path], seen: set) -> List[Path]:
+        """Source files named by a filelist, following nested -f files."""
+        sources = [filelist]
+        tokens = []
+        with open(filelist, 'r', encoding='utf-8', errors='replace') as f:
+            for line in f:
+                line = line.split('//', 1)[0].split('#', 1)[0].strip()
+                tokens.extend(line.split())
+
+        index = 0
+        while index < len(tokens):
+            token = tokens[index]
+            if token == '-f' and index + 1 < len(tokens):
+                nested = self.resolve(tokens[index + 1], self.exec_dir)
+                if nested not in seen:
+                    seen.add(nested)
+                    sources += self.filelist_entries(nested, incdirs, seen)
+                index += 2
+                continue
+            if token.startswith('+incdir+'):
+                incdirs += [self.resolve(d, self.exec_dir) for d in token[len('+incdir+'):].split('+') if d]
+            elif not token.startswith(('-', '+')):
+                sources.append(self.resolve(token, self.exec_dir))
+            index += 1
+
+        return sources
+
+    def digest(self, filelist: str) -> str:
+        """Combined hash of a filelist, its sources and their `include files (memoized per filelist)."""
+        if filelist in self._digests:
+            return self._digests[filelist]
+
+        incdirs = list(self.incdirs)
+        top = self.resolve(filelist, self.exec_dir)
+        pending = self.filelist_entries(top, incdirs, {top})
+        hashed = set()
+        digest = hashlib.sha256()
+
+        while pending:
+            path = pending.pop(0)
+            key = os.path.normpath(str(path))
+            if key in hashed:
+                continue
+            hashed.add(key)
+
+            if not path.exists():
+                # Missing inputs (e.g. simulator-provided uvm_macros.svh) still contribute their name
+                digest.update(f'missing:{key}\n'.encode())
+                continue
+
+            digest.update(f'{key}:{file_digest(path)}\n'.encode())
+            if path.suffix in ('.sv', '.svh', '.v', '.vh'):
+                for name in INCLUDE_PATTERN.findall(path.read_bytes()):
+                    name = name.decode(errors='replace')
+                    candidates = [path.parent / name] + [d / name for d in incdirs]
+                    pending.append(next((c for c in candidates if c.exists()), Path(name)))
+
+        self._digests[filelist] = digest.hexdigest()
+        return self._digests[filelist]
+
+
+class ResultCache:
+    """SQLite store of job results keyed on input hash."""
+
+    def __init__(self, db_path: str):
+        """Open (or create) the cache database."""
+        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(db_path)
+        self.init_database()
+
+    def init_database(self):
+        """Create the result cache table."""
+        self.conn.execute('''
+            CREATE TABLE IF NOT EXISTS result_cache (
+                input_hash TEXT PRIMARY KEY,
+                timestamp DATETIME,
+                run_id TEXT,
+                job_id TEXT,
+                status TEXT,
+                result TEXT
+            )
+        ''')
+        self.conn.commit()
+
+    def lookup(self, input_hash: str) -> Optional[Dict[str, Any]]:
+        """Cached result for an input hash, with the run it came from."""
+        row = self.conn.execute('SELECT run_id, result FROM result_cache WHERE input_hash = ?',
+                                (input_hash,)).fetchone()
+        if not row:
+            return None
+        result = json.loads(row[1])
+        result['cached_from'] = row[0]
+        return result
+
+    def store(self, run_id: str, job: Dict[str, Any], keys: List[str]):
+        """Remember a deterministic job result."""
+        if job['status'] not in CACHEABLE_STATUSES or job.get('timed_out') or job.get('stalled'):
+            return
+        result = {key: job.get(key) for key in keys}
+        self.conn.execute('''
+            INSERT OR REPLACE INTO result_cache (input_hash, timestamp, run_id, job_id, status, result)
+            VALUES (?, ?, ?, ?, ?, ?)
+        ''', (job['input_hash'], datetime.now().isoformat(timespec='seconds'), run_id, job['id'],
+              job['status'], json.dumps(result)))
+        self.conn.commit()
+
+    def evict(self, max_age_days: Optional[float], max_entries: Optional[int]) -> int:
+        """Drop entries older than max_age_days, then the oldest beyond max_entries."""
+        removed = 0
+        if max_age_days:
+            cutoff = (datetime.now() - timedelta(days=max_age_days)).isoformat(timespec='seconds')
+            removed += self.conn.execute('DELETE FROM result_cache WHERE timestamp < ?', (cutoff,)).rowcount
+        if max_entries:
+            removed += self.conn.execute('''
+                DELETE FROM result_cache WHERE input_hash NOT IN (
+                    SELECT input_hash FROM result_cache ORDER BY timestamp DESC LIMIT ?
+                )
+            ''', (max_entries,)).rowcount
+        self.conn.commit()
+        return removed
+
+    def close(self):
+        """Close the cache database."""
+        self.conn.close()
@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+"""
+UVM Transaction Trace Analysis
+Re-grades binary transaction traces offline: functional coverage with the
+coverpoint rules from config.yaml and the register file reference check from
+the generated scoreboard, vectorized with NumPy and run in parallel across traces.
+
+Author: UVM Base Generator
+Date: 2025-07-27
+"""
+
+import sys
+import glob
+import json
+import argparse
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Any, List, Tuple
+
+import yaml
+import numpy as np
+
+from trace_reader import TraceReader
+from generate_uvm_organized import UVMGenerator
+
+
+class CoverageModel:
+    """Coverpoints and crosses built from transaction.fields, mirroring the generated covergroup."""
+
+    def __init__(self, config: Dict[str, Any]):
+        """Derive coverpoint bins from the configuration."""
+        generator = UVMGenerator()
+        generator.config = config
+        coverage = config.get('coverage', {})
+        max_value_bins = coverage.get('max_value_bins', 16)
+
+        self.coverpoints: Dict[str, Dict[str, Any]] = {}
+        enum_fields = []
+        value_fields = []
+
+        for field in config.get('transaction', {}).get('fields', []):
+            if not field.get('coverage', True):
+                continue
+
+            name = field['name']
+            width = generator.get_field_width(field['type'])
+
+            if width == 0:
+                # Enumerated type: bins come from the encodings in the trace header
+                self.coverpoints[name] = {'kind': 'enum'}
+                enum_fields.append(name)
+            elif width == 1 or (1 << width) <= max_value_bins:
+                self.coverpoints[name] = {'kind': 'values', 'bins': [str(v) for v in range(1 << width)]}
+                if width > 1:
+                    value_fields.append(name)
+            else:
+                self.coverpoints[name] = {'kind': 'ranges', 'width': width,
+                                          'bins': ['zero', 'all_ones', 'low', 'high']}
+
+        crosses = coverage.get('crosses')
+        if crosses is None:
+            crosses = [[e, v] for e in enum_fields for v in value_fields]
+        self.crosses = [list(cross) for cross in crosses]
+
+    def bin_names(self, name: str, reader: TraceReader) -> List[str]:
+        """Bin names of a coverpoint (enum bins depend on the trace)."""
+        coverpoint = self.coverpoints[name]
+        if coverpoint['kind'] == 'enum':
+            return [reader.enums[name][value] for value in sorted(reader.enums[name])]
+        return coverpoint['bins']
+
+    def bin_index(self, name: str, values: np.ndarray, reader: TraceReader) -> np.ndarray:
+        """Map field values to bin indexes (-1 for values outside every bin)."""
+        coverpoint = self.coverpoints[name]
+        values = values.astype(np.int64)
+
+        if coverpoint['kind'] == 'enum':
+            encodings = np.array(sorted(reader.enums[name]), dtype=np.int64)
+            index = np.searchsorted(encodings, values)
+            index = np.minimum(index, len(encodings) - 1)
+            return np.where(encodings[index] == values, index, -1)
+
+        if coverpoint['kind'] == 'values':
+            return np.where(values < len(coverpoint['bins']), values, -1)
+
+        width = coverpoint['width']
+        values = values.astype(np.uint64)
+        all_ones = np.uint64((1 << width) - 1)
+        split = np.uint64(1 << (width // 2))
+        return np.select([values == 0, values == all_ones, values < split], [0, 1, 2], default=3)
+
+    def sample(self, reader: TraceReader) -> Dict[str, List[int]]:
+        """Hit counts per bin for every coverpoint and cross of one trace."""
+        records = reader.records
+        hits = {}
+        indexes = {}
+
+        for name in self.coverpoints:
+            bins = self.bin_names(name, reader)
+            index = self.bin_index(name, records[name], reader)
+            indexes[name] = (index, len(bins))
+            hits[name] = np.bincount(index[index >= 0], minlength=len(bins)).tolist()
+
+        for cross in self.crosses:
+            combined = np.zeros(len(records), dtype=np.int64)
+            valid = np.ones(len(records), dtype=bool)
+            size = 1
+            for name in cross:
+                index, count = indexes[name]
+                combined = combined * count + index
+                valid &= index >= 0
+                size *= count
+            hits['_x_'.join(cross)] = np.bincount(combined[valid], minlength=size).tolist()
+
+        return hits
+
+    @staticmethod
+    def percent(hits: Dict[str, List[int]]) -> Tuple[float, Dict[str, float]]:
+        """Covergroup coverage: the average of coverpoint and cross coverage."""
+        per_item = {name: 100.0 * sum(1 for h in counts if h > 0) / len(counts)
+                    for name, counts in hits.items() if counts}
+        if not per_item:
+            return 0.0, per_item
+        return sum(per_item.values()) / len(per_item), per_item
+
+
+def check_trace(reader: TraceReader, reset_value: int = 0) -> Dict[str, Any]:
+    """Replay the scoreboard reference check: every read returns the last write to its address."""
+    records = reader.records
+    count = len(records)
+    write_value = reader.enum_value('operation', 'WRITE')
+
+    # Group by address while keeping time order within each address
+    position = np.arange(count)
+    order = np.lexsort((position, records['address']))
+    address = records['address'][order]
+    data = records['data'][order].astype(np.uint64)
+    is_write = records['operation'][order] == write_value
+
+    # Position of the most recent write at or before each record, limited to its address group
+    last_write = np.maximum.accumulate(np.where(is_write, position, -1))
+    group_start = np.ones(count, dtype=bool)
+    group_start[1:] = address[1:] != address[:-1]
+    first_in_group = np.maximum.accumulate(np.where(group_start, position, 0))
+    has_write = last_write >= first_in_group
+
+    expected = np.where(has_write, data[np.maximum(last_write, 0)], np.uint64(reset_value))
+    mismatch = ~is_write & (data != expected)
+
+    result = {
+        'writes': int(is_write.sum()),
+        'reads': int(count - is_write.sum()),
+        'mismatches': int(mismatch.sum()),
+    }
+
+    if result['mismatches']:
+        # Earliest mismatch in trace order
+        sorted_index = np.flatnonzero(mismatch)
+        earliest = sorted_index[np.argmin(order[sorted_index])]
+        record = records[order[earliest]]
+        result['first_mismatch'] = {
+            'time': int(record['time']),
+            'address': int(record['address']),
+            'data': int(record['data']),
+            'expected': int(expected[earliest]),
+        }
+
+    return result
+
+
+def analyze_trace(trace_file: str, config: Dict[str, Any]) -> Dict[str, Any]:
+    """Coverage and reference check for one trace (runs in a worker process)."""
+    try:
+        reader = TraceReader(trace_file)
+        hits = CoverageModel(config).sample(reader)
+        result = {'trace': trace_file, 'records': len(reader), 'coverage_hits': hits}
+        result['coverage'], _ = CoverageModel.percent(hits)
+        result.update(check_trace(reader))
+        return result
+    except (OSError, ValueError, KeyError) as e:
+        return {'trace': trace_file, 'error': str(e)}
+
+
+class TraceAnalyzer:
+    """Grades many traces in parallel and merges their coverage."""
+
+    def __init__(self, config_file: str = "config.yaml", jobs: int = None):
+        """Load the coverage definitions from the configuration file."""
+        with open(config_file, 'r', encoding='utf-8') as f:
+            self.config = yaml.safe_load(f)
+        self.jobs = jobs
+
+    def analyze(self, trace_files: List[str]) -> Dict[str, Any]:
+        """Analyze all traces and return per-trace and merged results."""
+        with ProcessPoolExecutor(max_workers=self.jobs) as pool:
+            results = list(pool.map(analyze_trace, trace_files, [self.config] * len(trace_files),
+                                    chunksize=max(1, len(trace_files) // 64)))
+
+        merged_hits: Dict[str, List[int]] = {}
+        for result in results:
+            for name, counts in result.get('coverage_hits', {}).items():
+                if name not in merged_hits:
+                    merged_hits[name] = list(counts)
+                else:
+                    merged_hits[name] = [a + b for a, b in zip(merged_hits[name], counts)]
+
+        merged_coverage, per_item = CoverageModel.percent(merged_hits)
+        graded = [r for r in results if 'error' not in r]
+
+        return {
+            'traces': len(results),
+            'errors': len(results) - len(graded),
+            'records': sum(r['records'] for r in graded),
+            'mismatches': sum(r['mismatches'] for r in graded),
+            'failing_traces': [r['trace'] for r in graded if r['mismatches']],
+            'merged_coverage': merged_coverage,
+            'coverpoint_coverage': per_item,
+            'results': results,
+        }
+
+
+def main():
+    """Main function with command line argument parsing."""
+    parser = argparse.ArgumentParser(description="Offline coverage and reference check over transaction traces")
+    parser.add_argument("traces", nargs="+", help="Trace files or glob patterns")
+    parser.add_argument("-c", "--config", default="config.yaml",
+                       help="Configuration file with the coverage definitions (default: config.yaml)")
+    parser.add_argument("-j", "--jobs", type=int, default=None,
+                       help="Worker processes (default: CPU count)")
+    parser.add_argument("-o", "--output", help="Write the full results as JSON")
+
+    args = parser.parse_args()
+
+    trace_files = []
+    for pattern in args.traces:
+        trace_files.extend(sorted(glob.glob(pattern)) or [pattern])
+
+    summary = TraceAnalyzer(args.config, args.jobs).analyze(trace_files)
+
+    print(f"Traces:          {summary['traces']} ({summary['errors']} unreadable)")
+    print(f"Transactions:    {summary['records']}")
+    print(f"Mismatches:      {summary['mismatches']} in {len(summary['failing_traces'])} trace(s)")
+    print(f"Merged coverage: {summary['merged_coverage']:.2f}%")
+    for name, percent in summary['coverpoint_coverage'].items():
+        print(f"  {name}: {percent:.2f}%")
+    for result in summary['results']:
+        if 'error' in result:
+            print(f"ERROR: {result['trace']}: {result['error']}")
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(summary, indent=2), encoding='utf-8')
+        print(f"Results written to {args.output}")
+
+    sys.exit(0 if summary['errors'] == 0 and summary['mismatches'] == 0 else 1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+UVM Transaction Trace Reader
+Memory-maps binary transaction traces written by the generated monitors
+(+TRACE_FILE=<path>) as NumPy structured arrays.
+
+Author: UVM Base Generator
+Date: 2025-07-27
+"""
+
+import sys
+import struct
+import argparse
+from pathlib import Path
+from typing import Dict, Any, Tuple
+
+import numpy as np
+
+# "UVMT" magic word written by the trace writer in the simulator's byte order
+TRACE_MAGIC = 0x55564D54
+TRACE_VERSION = 1
+FIXED_HEADER_BYTES = 16
+
+
+class TraceReader:
+    """Reader for fixed-record binary transaction traces."""
+
+    def __init__(self, trace_file: str):
+        """Parse the trace header and build the record dtype."""
+        self.trace_file = Path(trace_file)
+        self.byte_order = '<'
+        self.version = 0
+        self.header_bytes = 0
+        self.record_bytes = 0
+        self.time_unit = ''
+        self.enums: Dict[str, Dict[int, str]] = {}
+        self.dtype = None
+        self.file_dtype = None
+        self._records = None
+
+        self._read_header()
+
+    def _read_header(self):
+        """Read the fixed header and the layout text that follows it."""
+        with open(self.trace_file, 'rb') as f:
+            fixed = f.read(FIXED_HEADER_BYTES)
+            if len(fixed) < FIXED_HEADER_BYTES:
+                raise ValueError(f"{self.trace_file}: truncated trace header")
+
+            for byte_order in ('<', '>'):
+                magic, version, header_bytes, record_bytes = struct.unpack(f'{byte_order}4I', fixed)
+                if magic == TRACE_MAGIC:
+                    break
+            else:
+                raise ValueError(f"{self.trace_file}: not a transaction trace (bad magic)")
+
+            if version != TRACE_VERSION:
+                raise ValueError(f"{self.trace_file}: unsupported trace version {version}")
+
+            layout = f.read(header_bytes - FIXED_HEADER_BYTES).decode('ascii').strip()
+
+        self.byte_order = byte_order
+        self.version = version
+        self.header_bytes = header_bytes
+        self.record_bytes = record_bytes
+        self.dtype, self.file_dtype = self._parse_layout(layout)
+
+        if self.file_dtype.itemsize != record_bytes:
+            raise ValueError(f"{self.trace_file}: layout describes {self.file_dtype.itemsize} byte records, "
+                             f"header says {record_bytes}")
+
+    def _parse_layout(self, layout: str) -> Tuple[np.dtype, np.dtype]:
+        """Build the record dtype and its on-disk dtype from 'timeunit=1ns;time:u8;name:u4;enum.name=A:0,B:1'.
+
+        64-bit values are written as two 32-bit words, least significant
+        first, so they only match a native u8 in a little-endian file. In a
+        big-endian file they are read as two u4 words and combined in records.
+        """
+        fields = []
+        file_fields = []
+
+        for entry in filter(None, layout.split(';')):
+            if entry.startswith('timeunit='):
+                self.time_unit = entry.split('=', 1)[1]
+            elif entry.startswith('enum.'):
+                name, encodings = entry[len('enum.'):].split('=', 1)
+                self.enums[name] = {}
+                for encoding in filter(None, encodings.split(',')):
+                    label, value = encoding.rsplit(':', 1)
+                    self.enums[name][int(value)] = label
+            else:
+                name, field_type = entry.split(':', 1)
+                if field_type.startswith('V'):
+                    fields.append((name, field_type))
+                    file_fields.append((name, field_type))
+                elif field_type[1:] == '8' and self.byte_order == '>':
+                    fields.append((name, self.byte_order + field_type))
+                    file_fields.append((name, self.byte_order + 'u4', (2,)))
+                else:
+                    fields.append((name, self.byte_order + field_type))
+                    file_fields.append((name, self.byte_order + field_type))
+
+        return np.dtype(fields), np.dtype(file_fields)
+
+    @property
+    def records(self) -> np.ndarray:
+        """All records as a structured array.
+
+        Memory-mapped read-only, except for big-endian files with 64-bit
+        fields, whose records are copied to combine the word pairs.
+        """
+        if self._records is None:
+            count = (self.trace_file.stat().st_size - self.header_bytes) // self.record_bytes
+            if count == 0:
+                self._records = np.zeros(0, dtype=self.dtype)
+            else:
+                records = np.memmap(self.trace_file, dtype=self.file_dtype, mode='r',
+                                    offset=self.header_bytes, shape=(count,))
+                self._records = records if self.file_dtype == self.dtype else self._combine_words(records)
+        return self._records
+
+    def _combine_words(self, raw: np.ndarray) -> np.ndarray:
+        """Records with each (low word, high word) pair of raw turned into one 64-bit value."""
+        records = np.empty(len(raw), dtype=self.dtype)
+        for name in self.dtype.names:
+            if raw.dtype[name].shape == (2,):
+                words = raw[name].astype(np.uint64)
+                records[name] = ((words[:, 1] << np.uint64(32)) | words[:, 0]).astype(self.dtype[name])
+            else:
+                records[name] = raw[name]
+        return records
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def enum_value(self, field: str, label: str) -> int:
+        """Return the encoding of an enumerated field label (e.g. operation WRITE)."""
+        for value, name in self.enums.get(field, {}).items():
+            if name == label:
+                return value
+        raise KeyError(f"{field} has no value '{label}'")
+
+    def summary(self) -> Dict[str, Any]:
+        """Summarize record count, time range and enumerated field histograms."""
+        records = self.records
+        summary = {
+            'file': str(self.trace_file),
+            'records': len(records),
+            'record_bytes': self.record_bytes,
+            'fields': list(self.dtype.names),
+            'time_unit': self.time_unit,
+        }
+
+        if len(records) > 0:
+            summary['first_time'] = int(records['time'][0])
+            summary['last_time'] = int(records['time'][-1])
+
+        for field, labels in self.enums.items():
+            values, counts = np.unique(records[field], return_counts=True)
+            summary[field] = {labels.get(int(v), str(int(v))): int(c) for v, c in zip(values, counts)}
+
+        return summary
+
+
+def main():
+    """Main function with command line argument parsing."""
+    parser = argparse.ArgumentParser(description="Inspect binary UVM transaction traces")
+    parser.add_argument("traces", nargs="+", help="Trace files written with +TRACE_FILE=<path>")
+    parser.add_argument("-n", "--head", type=int, default=0,
+                       help="Print the first N records of each trace")
+
+    args = parser.parse_args()
+
+    status = 0
+    for trace_file in args.traces:
+        try:
+            reader = TraceReader(trace_file)
+        except (OSError, ValueError) as e:
+            print(f"ERROR: {e}")
+            status = 1
+            continue
+
+        for key, value in reader.summary().items():
+            print(f"{key}: {value}")
+        for record in reader.records[:args.head]:
+            print(record)
+        print()
+
+    sys.exit(status)
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,8 @@
 @echo off
 REM Unified Test Execution Script for register_file
 REM Generated by UVM Base Generator - Based on DSIMtuto best practices
-REM Usage: run.bat [test_name]
+REM Usage: run.bat [test_name] [profile]
+REM Profiles (run_profiles in config.yaml): debug, regression, perf, rerun - default debug
 
 setlocal enabledelayedexpansion
 
@@ -15,7 +16,8 @@ if "%1"=="" (
     echo   REGISTER_FILE Test Runner
     echo ================================
     echo.
-    echo Usage: run.bat [test_name]
+    echo Usage: run.bat [test_name] [profile]
+    echo Profiles: debug, regression, perf, rerun ^(default debug^)
     echo.
     echo Available tests:
     echo ----------------
@@ -47,6 +49,48 @@ if %FOUND%==0 (
     exit /b 1
 )
 
+REM Select run profile
+set PROFILE=%2
+if "%PROFILE%"=="" set PROFILE=debug
+set PROFILE_FOUND=0
+set PROFILE_VERBOSITY=
+if /i "%PROFILE%"=="debug" (
+    set PROFILE_FOUND=1
+    set ACCESS_OPTS=+acc+b
+    set WAVE_OPTS=-waves waves\%WAVE_FILE% +WAVE_FILE=waves\%WAVE_FILE%
+    set PROFILE_VERBOSITY=
+    set EXTRA_OPTS=
+)
+if /i "%PROFILE%"=="regression" (
+    set PROFILE_FOUND=1
+    set ACCESS_OPTS=
+    set WAVE_OPTS=+NO_WAVES
+    set PROFILE_VERBOSITY=UVM_LOW
+    set EXTRA_OPTS=+UVM_NO_RELNOTES
+)
+if /i "%PROFILE%"=="perf" (
+    set PROFILE_FOUND=1
+    set ACCESS_OPTS=
+    set WAVE_OPTS=+NO_WAVES
+    set PROFILE_VERBOSITY=UVM_NONE
+    set EXTRA_OPTS=+UVM_NO_RELNOTES +WATCHDOG_DISABLE
+)
+if /i "%PROFILE%"=="rerun" (
+    set PROFILE_FOUND=1
+    set ACCESS_OPTS=+acc+rwb
+    set WAVE_OPTS=-waves waves\%WAVE_FILE% +WAVE_FILE=waves\%WAVE_FILE%
+    set PROFILE_VERBOSITY=UVM_HIGH
+    set EXTRA_OPTS=
+)
+
+if %PROFILE_FOUND%==0 (
+    echo ERROR: Run profile '%PROFILE%' not found
+    echo Available profiles: debug, regression, perf, rerun
+    exit /b 1
+)
+
+if defined PROFILE_VERBOSITY set VERBOSITY=%PROFILE_VERBOSITY%
+
 REM Check DSIM environment
 if not defined DSIM_HOME (
     echo ERROR: DSIM_HOME environment variable not set
@@ -81,6 +125,7 @@ echo Filelist: %FILELIST%
 echo Test Class: %TEST_CLASS%
 echo Wave File: %WAVE_FILE%
 echo Verbosity: %VERBOSITY%
+echo Profile: %PROFILE%
 echo DSIM_HOME: %DSIM_HOME%
 echo ================================================================================
 echo.
@@ -92,13 +137,14 @@ REM Execute DSIM simulation with organized include paths
 echo Starting DSIM simulation...
 dsim ^
     -uvm 1.2 ^
-    +acc+b ^
+    %ACCESS_OPTS% ^
     +incdir+../uvm/base +incdir+../uvm/transactions +incdir+../uvm/sequences +incdir+../uvm/agents +incdir+../uvm/env +incdir+../uvm/tests ^
     +define+UVM_NO_DEPRECATED ^
     -f %FILELIST% ^
     +UVM_TESTNAME=%TEST_CLASS% ^
     +UVM_VERBOSITY=%VERBOSITY% ^
-    -waves waves\%WAVE_FILE% ^
+    %WAVE_OPTS% ^
+    %EXTRA_OPTS% ^
     -top register_file_tb
 
 set DSIM_EXIT_CODE=%ERRORLEVEL%
@@ -107,7 +153,7 @@ echo.
 if %DSIM_EXIT_CODE%==0 (
     echo ================================================================================
     echo Test '%TEST_NAME%' completed successfully!
-    echo Waveform saved to: waves\%WAVE_FILE%
+    if not "%WAVE_OPTS%"=="+NO_WAVES" echo Waveform saved to: waves\%WAVE_FILE%
     echo ================================================================================
 ) else (
     echo ================================================================================
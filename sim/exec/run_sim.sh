@@ -0,0 +1,8 @@
+#!/bin/bash
+# Regression runner for register_file
+# Generated by UVM Base Generator
+# Usage: ./run_sim.sh [test_name|pattern ...] [--jobs N] [--seeds N] [--timeout SEC] [--profile NAME]
+# Runs the tests in test_config.cfg through scripts/regression_runner.py
+
+cd "$(dirname "$0")/../.." || exit 1
+exec python3 scripts/regression_runner.py "$@"
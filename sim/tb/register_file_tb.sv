@@ -37,12 +37,17 @@ module register_file_tb;
     
     // UVM testbench initialization
     initial begin
+        string wave_file = "register_file_tb.mxd";
+        
         // Set interface in config DB for UVM components
         uvm_config_db#(virtual register_file_if)::set(null, "*", "vif", vif);
         
-        // Enable wave dumping (MXD format for DSIM)
-        $dumpfile("register_file_tb.mxd");
-        $dumpvars(0, register_file_tb);
+        // Enable wave dumping (MXD format for DSIM) unless the run profile disables it
+        if (!$test$plusargs("NO_WAVES")) begin
+            void'($value$plusargs("WAVE_FILE=%s", wave_file));
+            $dumpfile(wave_file);
+            $dumpvars(0, register_file_tb);
+        end
         
         // Run the test
         run_test();
@@ -54,6 +54,24 @@ class register_file_agent extends uvm_agent;
         end
     endfunction
     
+    // Total activity seen by this agent (driven plus observed transactions)
+    virtual function int unsigned get_activity_count();
+        int unsigned count = monitor.num_observed;
+        
+        if (is_active) begin
+            count += driver.num_driven;
+        end
+        return count;
+    endfunction
+    
+    // One-line status used in watchdog diagnostics
+    virtual function string get_status();
+        return $sformatf("%s: driver=%s driven=%0d observed=%0d idle_cycles=%0d",
+                         get_full_name(), is_active ? driver.state : "PASSIVE",
+                         is_active ? driver.num_driven : 0,
+                         monitor.num_observed, monitor.idle_cycles);
+    endfunction
+    
     // Set virtual interface for all components
     virtual function void set_interface(virtual register_file_if vif);
         uvm_config_db#(virtual register_file_if)::set(this, "monitor", "vif", vif);
@@ -12,6 +12,13 @@ class register_file_monitor extends uvm_monitor;
     // Analysis port for sending transactions to scoreboard
     uvm_analysis_port #(register_file_transaction) ap;
     
+    // Optional binary transaction trace (+TRACE_FILE=<path>)
+    register_file_trace_writer trace;
+    
+    // Activity tracking (used for end-of-test detection)
+    int unsigned num_observed = 0;  // Transactions observed on the interface
+    int unsigned idle_cycles = 0;   // Consecutive cycles without read/write activity
+    
     // Constructor
     function new(string name = "register_file_monitor", uvm_component parent = null);
         super.new(name, parent);
@@ -19,6 +26,8 @@ class register_file_monitor extends uvm_monitor;
     
     // Build phase
     virtual function void build_phase(uvm_phase phase);
+        string trace_file;
+        
         super.build_phase(phase);
         
         // Get virtual interface from config DB
@@ -28,6 +37,14 @@ class register_file_monitor extends uvm_monitor;
         
         // Create analysis port
         ap = new("ap", this);
+        
+        // Open the transaction trace when requested
+        if ($value$plusargs("TRACE_FILE=%s", trace_file)) begin
+            trace = register_file_trace_writer::type_id::create("trace");
+            if (!trace.open(trace_file)) begin
+                trace = null;
+            end
+        end
     endfunction
     
     // Run phase - main monitoring functionality
@@ -45,23 +62,62 @@ class register_file_monitor extends uvm_monitor;
             // Wait for activity on interface
             @(vif.monitor_cb);
             
+            // Track bus idle time for end-of-test detection
+            if (vif.monitor_cb.write_enable || vif.monitor_cb.read_enable) begin
+                idle_cycles = 0;
+            end else begin
+                idle_cycles++;
+            end
+            
             // Check for read or write operations
             if (vif.monitor_cb.ready) begin
                 if (vif.monitor_cb.write_enable) begin
                     trans = monitor_write();
                     if (trans != null) begin
-                        ap.write(trans);
+                        publish(trans);
                     end
                 end else if (vif.monitor_cb.read_enable) begin
                     trans = monitor_read();
                     if (trans != null) begin
-                        ap.write(trans);
+                        publish(trans);
                     end
                 end
             end
         end
     endtask
     
+    // Count, trace and broadcast an observed transaction
+    virtual function void publish(register_file_transaction trans);
+        num_observed++;
+        if (trace != null) begin
+            trace.write(trans);
+        end
+        ap.write(trans);
+    endfunction
+    
+    // Close the trace at the end of simulation
+    virtual function void final_phase(uvm_phase phase);
+        super.final_phase(phase);
+        if (trace != null) begin
+            trace.close();
+        end
+    endfunction
+    
+    // Keep buffered trace records when the run is aborted (e.g. by the hang watchdog)
+    virtual function void pre_abort();
+        super.pre_abort();
+        if (trace != null) begin
+            trace.close();
+        end
+    endfunction
+    
+    // Block until the interface has been idle for the given number of cycles
+    virtual task wait_for_idle(int unsigned cycles);
+        do begin
+            @(vif.monitor_cb);
+        end while (idle_cycles < cycles);
+    endtask
+    
     // Monitor write operation
     virtual function register_file_transaction monitor_write();
         register_file_transaction trans;
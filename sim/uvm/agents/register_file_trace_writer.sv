@@ -0,0 +1,143 @@
+`timescale 1ns / 1ps
+
+// Register File Transaction Trace Writer
+// Streams observed transactions into a compact fixed-record binary file
+// through a word buffer. Read traces back with scripts/trace_reader.py.
+//
+// File layout (all values are 32-bit words in the simulator's byte order;
+// 64-bit values are written least significant word first):
+//   magic, version, header_bytes, record_bytes  - 16 byte fixed header
+//   layout text, space padded to header_bytes    - "timeunit=..;name:type;..."
+//   records, record_bytes each                   - time followed by transaction.fields
+class register_file_trace_writer extends uvm_object;
+    
+    `uvm_object_utils(register_file_trace_writer)
+    
+    // "UVMT" - readers use it to detect the byte order of the file
+    localparam bit [31:0] MAGIC = 32'h55564D54;
+    localparam int unsigned VERSION = 1;
+    
+    // Record layout (from transaction.fields in config.yaml)
+    localparam int unsigned RECORD_WORDS = 6;
+    localparam string LAYOUT = "timeunit=1ns;time:u8;operation:u4;address:u4;data:u4;ready:u4";
+    
+    // Records buffered before a write to the file
+    int unsigned buffer_records = 256;
+    
+    // Buffered words written per $fwrite call
+    localparam int unsigned WRITE_WORDS = 64;
+    
+    string file_name;
+    int unsigned num_records = 0;
+    
+    protected int fd = 0;
+    protected bit [31:0] buffer[$];
+    
+    // Constructor
+    function new(string name = "register_file_trace_writer");
+        super.new(name);
+    endfunction
+    
+    // Open the trace file and write the header
+    virtual function bit open(string file_name);
+        string layout = {LAYOUT, get_enum_layout()};
+        
+        this.file_name = file_name;
+        void'($value$plusargs("TRACE_BUFFER=%d", buffer_records));
+        
+        fd = $fopen(file_name, "wb");
+        if (fd == 0) begin
+            `uvm_error(get_type_name(), $sformatf("Cannot open trace file %s", file_name))
+            return 0;
+        end
+        
+        // Pad the header so records start on an 8 byte boundary
+        while ((16 + layout.len()) % 8 != 0) begin
+            layout = {layout, " "};
+        end
+        
+        $fwrite(fd, "%u%u%u%u", MAGIC, 32'(VERSION), 32'(16 + layout.len()), 32'(RECORD_WORDS * 4));
+        $fwrite(fd, "%s", layout);
+        
+        `uvm_info(get_type_name(), $sformatf("Tracing transactions to %s (%0d bytes/record)",
+                                             file_name, RECORD_WORDS * 4), UVM_LOW)
+        return 1;
+    endfunction
+    
+    // Enumerated field encodings, appended to the layout text
+    virtual function string get_enum_layout();
+        string layout = "";
+        begin
+            register_file_transaction::operation_t value;
+            value = value.first();
+            layout = {layout, ";enum.operation="};
+            repeat (value.num()) begin
+                layout = {layout, $sformatf("%s:%0d,", value.name(), value)};
+                value = value.next();
+            end
+        end
+        return layout;
+    endfunction
+    
+    // Append one transaction record
+    virtual function void write(register_file_transaction trans);
+        if (fd == 0) begin
+            return;
+        end
+        
+        push_u64($time);
+        push_u32(32'(trans.operation));
+        push_u32(32'(trans.address));
+        push_u32(32'(trans.data));
+        push_u32(32'(trans.ready));
+        num_records++;
+        
+        if (buffer.size() >= buffer_records * RECORD_WORDS) begin
+            flush();
+        end
+    endfunction
+    
+    // Write buffered records to the file, WRITE_WORDS words per $fwrite call
+    virtual function void flush();
+        int unsigned i = 0;
+        
+        for (; i + WRITE_WORDS <= buffer.size(); i += WRITE_WORDS) begin
+            $fwrite(fd, "%u%u%u%u%u%u%u%u%u%u%u%u%u%u%u%u%u%u%u%u%u%u%u%u%u%u%u%u%u%u%u%u%u%u%u%u%u%u%u%u%u%u%u%u%u%u%u%u%u%u%u%u%u%u%u%u%u%u%u%u%u%u%u%u",
+                    buffer[i + 0], buffer[i + 1], buffer[i + 2], buffer[i + 3], buffer[i + 4], buffer[i + 5], buffer[i + 6], buffer[i + 7],
+                    buffer[i + 8], buffer[i + 9], buffer[i + 10], buffer[i + 11], buffer[i + 12], buffer[i + 13], buffer[i + 14], buffer[i + 15],
+                    buffer[i + 16], buffer[i + 17], buffer[i + 18], buffer[i + 19], buffer[i + 20], buffer[i + 21], buffer[i + 22], buffer[i + 23],
+                    buffer[i + 24], buffer[i + 25], buffer[i + 26], buffer[i + 27], buffer[i + 28], buffer[i + 29], buffer[i + 30], buffer[i + 31],
+                    buffer[i + 32], buffer[i + 33], buffer[i + 34], buffer[i + 35], buffer[i + 36], buffer[i + 37], buffer[i + 38], buffer[i + 39],
+                    buffer[i + 40], buffer[i + 41], buffer[i + 42], buffer[i + 43], buffer[i + 44], buffer[i + 45], buffer[i + 46], buffer[i + 47],
+                    buffer[i + 48], buffer[i + 49], buffer[i + 50], buffer[i + 51], buffer[i + 52], buffer[i + 53], buffer[i + 54], buffer[i + 55],
+                    buffer[i + 56], buffer[i + 57], buffer[i + 58], buffer[i + 59], buffer[i + 60], buffer[i + 61], buffer[i + 62], buffer[i + 63]);
+        end
+        for (; i < buffer.size(); i++) begin
+            $fwrite(fd, "%u", buffer[i]);
+        end
+        buffer.delete();
+    endfunction
+    
+    // Flush and close the trace file
+    virtual function void close();
+        if (fd == 0) begin
+            return;
+        end
+        
+        flush();
+        $fclose(fd);
+        fd = 0;
+        
+        `uvm_info(get_type_name(), $sformatf("Wrote %0d trace records to %s", num_records, file_name), UVM_LOW)
+    endfunction
+    
+    protected function void push_u32(bit [31:0] value);
+        buffer.push_back(value);
+    endfunction
+    
+    protected function void push_u64(bit [63:0] value);
+        buffer.push_back(value[31:0]);
+        buffer.push_back(value[63:32]);
+    endfunction
+
+endclass
@@ -9,11 +9,19 @@ package register_file_pkg;
     
     // Include all UVM components with organized directory structure
     `include "../transactions/register_file_transaction.sv"
+    `include "../env/register_file_coverage.sv"
     `include "../sequences/register_file_sequence.sv"
     `include "../agents/register_file_driver.sv"
+    `include "../agents/register_file_trace_writer.sv"
     `include "../agents/register_file_monitor.sv"
     `include "../agents/register_file_agent.sv"
+    `include "../reg/register_file_reg_model.sv"
+    `include "../reg/register_file_reg_adapter.sv"
     `include "../env/register_file_scoreboard.sv"
+`ifdef REGISTER_FILE_DPI_MODEL
+    `include "../env/register_file_dpi_scoreboard.sv"
+`endif
+    `include "../env/register_file_watchdog.sv"
     `include "../env/register_file_env.sv"
     `include "../tests/register_file_test.sv"
     
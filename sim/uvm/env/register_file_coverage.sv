@@ -0,0 +1,57 @@
+`timescale 1ns / 1ps
+
+// register_file Functional Coverage
+// Covergroup derived from transaction.fields in config.yaml
+class register_file_coverage extends uvm_subscriber #(register_file_transaction);
+    
+    `uvm_component_utils(register_file_coverage)
+    
+    // Transaction being sampled
+    register_file_transaction trans;
+    
+    // Number of sampled transactions
+    int unsigned sample_count = 0;
+    
+    // Transaction covergroup (coverpoints generated from config.yaml)
+    covergroup trans_cg;
+        option.per_instance = 1;
+        operation_cp: coverpoint trans.operation;
+        address_cp: coverpoint trans.address {
+            bins values[] = {[0:3]};
+        }
+        data_cp: coverpoint trans.data {
+            bins zero     = {0};
+            bins all_ones = {32'hFFFFFFFF};
+            bins low      = {[1:32'hFFFF]};
+            bins high     = {[32'h10000:32'hFFFFFFFE]};
+        }
+        operation_x_address_cross: cross operation_cp, address_cp;
+    endgroup
+    
+    // Constructor
+    function new(string name = "register_file_coverage", uvm_component parent = null);
+        super.new(name, parent);
+        trans_cg = new();
+    endfunction
+    
+    // Sample every transaction observed by the monitor
+    virtual function void write(register_file_transaction t);
+        trans = t;
+        trans_cg.sample();
+        sample_count++;
+    endfunction
+    
+    // Current functional coverage in percent
+    virtual function real get_coverage();
+        return trans_cg.get_inst_coverage();
+    endfunction
+    
+    // Report phase
+    virtual function void report_phase(uvm_phase phase);
+        super.report_phase(phase);
+        
+        `uvm_info(get_type_name(), $sformatf("Functional coverage: %0.2f%% (%0d transactions sampled)",
+                                             get_coverage(), sample_count), UVM_LOW)
+    endfunction
+    
+endclass
@@ -1,16 +1,36 @@
 `timescale 1ns / 1ps
 
+// Analysis import for request-side (expected) transactions
+`uvm_analysis_imp_decl(_expected)
+
 // register_file Scoreboard
-// Simple scoreboard for checking DUT behavior with reference model
+// Checks DUT behavior against a sparse reference model. Completed transactions
+// arrive on ap; protocols with multiple outstanding requests can also publish
+// request-side transactions on expected_export, which are matched to their
+// completions by key (address by default) instead of in arrival order.
 class register_file_scoreboard extends uvm_scoreboard;
     
     `uvm_component_utils(register_file_scoreboard)
     
-    // Analysis import for receiving transactions from monitor
+    // Field types (from transaction.fields in config.yaml)
+    typedef bit [1:0] addr_t;
+    typedef bit [31:0] data_t;
+    typedef bit [63:0] key_t;
+    
+    // Analysis import for receiving completed transactions from monitor
     uvm_analysis_imp #(register_file_transaction, register_file_scoreboard) ap;
     
-    // Reference model - simple register array
-    bit [31:0] ref_registers [0:3];
+    // Analysis import for request-side transactions (optional)
+    uvm_analysis_imp_expected #(register_file_transaction, register_file_scoreboard) expected_export;
+    
+    // Reference model - sparse storage, only written addresses use memory
+    data_t ref_registers [addr_t];
+    data_t reset_value = '0;
+    
+    // Expected transactions waiting for completion, matched by key
+    register_file_transaction expected_q [key_t][$];
+    int unsigned max_outstanding = 1024;
+    int unsigned max_leak_report = 10;
     
     // Statistics
     int write_count = 0;
@@ -18,6 +38,10 @@ class register_file_scoreboard extends uvm_scoreboard;
     int pass_count = 0;
     int fail_count = 0;
     
+    // Transactions received but not yet checked (reported for end-of-test)
+    int unsigned outstanding = 0;
+    int unsigned peak_outstanding = 0;
+    
     // Constructor
     function new(string name = "register_file_scoreboard", uvm_component parent = null);
         super.new(name, parent);
@@ -28,25 +52,114 @@ class register_file_scoreboard extends uvm_scoreboard;
         super.build_phase(phase);
         
         ap = new("ap", this);
+        expected_export = new("expected_export", this);
         
-        // Initialize reference model
-        for (int i = 0; i < 4; i++) begin
-            ref_registers[i] = 32'h0;
-        end
+        void'($value$plusargs("SB_MAX_OUTSTANDING=%d", max_outstanding));
         
         `uvm_info(get_type_name(), "Scoreboard initialized", UVM_MEDIUM)
     endfunction
     
+    // Number of transactions still waiting to be checked
+    virtual function int unsigned get_outstanding();
+        return outstanding;
+    endfunction
+    
+    // Block until every received transaction has been checked
+    virtual task wait_for_drain();
+        wait (outstanding == 0);
+    endtask
+    
+    // Keep run_phase alive while transactions are still outstanding
+    virtual function void phase_ready_to_end(uvm_phase phase);
+        super.phase_ready_to_end(phase);
+        
+        if (phase.get_name() != "run" || get_outstanding() == 0) begin
+            return;
+        end
+        
+        phase.raise_objection(this, "Waiting for outstanding transactions");
+        fork
+            begin
+                wait_for_drain();
+                phase.drop_objection(this, "Outstanding transactions drained");
+            end
+        join_none
+    endfunction
+    
+    // Key used to match a completion with its request.
+    // Override for protocols that carry a transaction ID.
+    virtual function key_t get_match_key(register_file_transaction trans);
+        return key_t'(trans.address);
+    endfunction
+    
+    // Reference model read; unwritten addresses return the reset value
+    virtual function data_t read_model(addr_t addr);
+        if (ref_registers.exists(addr)) begin
+            return ref_registers[addr];
+        end
+        return reset_value;
+    endfunction
+    
+    // Store a value written outside the bus (e.g. a backdoor poke) in the reference model
+    virtual function void predict_write(addr_t addr, data_t data);
+        ref_registers[addr] = data;
+    endfunction
+    
+    // Request-side transaction: predict the result and queue it for matching
+    virtual function void write_expected(register_file_transaction trans);
+        register_file_transaction exp;
+        key_t key = get_match_key(trans);
+        
+        if (outstanding >= max_outstanding) begin
+            `uvm_error(get_type_name(), $sformatf("Expected queue overflow (%0d outstanding), dropping: %s",
+                                                  outstanding, trans.convert2string()))
+            return;
+        end
+        
+        $cast(exp, trans.clone());
+        if (exp.operation == register_file_transaction::READ) begin
+            exp.data = read_model(exp.address);
+        end else begin
+            ref_registers[exp.address] = exp.data;
+        end
+        
+        expected_q[key].push_back(exp);
+        outstanding++;
+        if (outstanding > peak_outstanding) begin
+            peak_outstanding = outstanding;
+        end
+    endfunction
+    
     // Write function called by analysis port
     virtual function void write(register_file_transaction trans);
+        register_file_transaction exp;
+        key_t key = get_match_key(trans);
+        
         `uvm_info(get_type_name(), $sformatf("Received transaction: %s", trans.convert2string()), UVM_HIGH)
         
+        // Match against a queued request when one exists for this key
+        if (expected_q.exists(key)) begin
+            exp = expected_q[key].pop_front();
+            if (expected_q[key].size() == 0) begin
+                expected_q.delete(key);
+            end
+            outstanding--;
+            
+            // A completion must be of the kind that was requested under its key
+            if (exp.operation != trans.operation) begin
+                `uvm_error(get_type_name(), $sformatf("%s completion matched %s request at addr=0x%0h - FAIL",
+                                                      trans.operation.name(), exp.operation.name(), trans.address))
+                fail_count++;
+                return;
+            end
+        end
+        
         case (trans.operation)
             register_file_transaction::WRITE: begin
-                check_write(trans);
+                check_write(trans, exp);
             end
             register_file_transaction::READ: begin
-                check_read(trans);
+                check_read(trans, exp);
             end
             default: begin
                 `uvm_error(get_type_name(), $sformatf("Unknown operation: %s", trans.operation.name()))
@@ -55,38 +168,62 @@ class register_file_scoreboard extends uvm_scoreboard;
     endfunction
     
     // Check write operation
-    virtual function void check_write(register_file_transaction trans);
+    virtual function void check_write(register_file_transaction trans, register_file_transaction exp = null);
         write_count++;
         
-        // Update reference model
-        ref_registers[trans.address] = trans.data;
+        // Update reference model (already updated at request time when matched)
+        if (exp == null) begin
+            ref_registers[trans.address] = trans.data;
+        end
         
-        `uvm_info(get_type_name(), 
-                 $sformatf("WRITE: addr=0x%0h, data=0x%0h - PASS", 
+        `uvm_info(get_type_name(),
+                 $sformatf("WRITE: addr=0x%0h, data=0x%0h - PASS",
                           trans.address, trans.data), UVM_MEDIUM)
         pass_count++;
     endfunction
     
     // Check read operation
-    virtual function void check_read(register_file_transaction trans);
-        bit [31:0] expected_data;
+    virtual function void check_read(register_file_transaction trans, register_file_transaction exp = null);
+        data_t expected_data;
         
         read_count++;
-        expected_data = ref_registers[trans.address];
+        expected_data = (exp != null) ? exp.data : read_model(trans.address);
         
         if (trans.data == expected_data) begin
-            `uvm_info(get_type_name(), 
-                     $sformatf("READ: addr=0x%0h, data=0x%0h, expected=0x%0h - PASS", 
+            `uvm_info(get_type_name(),
+                     $sformatf("READ: addr=0x%0h, data=0x%0h, expected=0x%0h - PASS",
                               trans.address, trans.data, expected_data), UVM_MEDIUM)
             pass_count++;
         end else begin
-            `uvm_error(get_type_name(), 
-                      $sformatf("READ: addr=0x%0h, data=0x%0h, expected=0x%0h - FAIL", 
+            `uvm_error(get_type_name(),
+                      $sformatf("READ: addr=0x%0h, data=0x%0h, expected=0x%0h - FAIL",
                                trans.address, trans.data, expected_data))
             fail_count++;
         end
     endfunction
     
+    // Check phase - report requests that never completed
+    virtual function void check_phase(uvm_phase phase);
+        int unsigned reported = 0;
+        
+        super.check_phase(phase);
+        
+        if (outstanding == 0) begin
+            return;
+        end
+        
+        `uvm_error(get_type_name(), $sformatf("%0d expected transaction(s) never completed", outstanding))
+        foreach (expected_q[key]) begin
+            foreach (expected_q[key][i]) begin
+                if (reported == max_leak_report) begin
+                    return;
+                end
+                `uvm_info(get_type_name(), $sformatf("  Leaked (key=0x%0h): %s", key, expected_q[key][i].convert2string()), UVM_NONE)
+                reported++;
+            end
+        end
+    endfunction
+    
     // Report phase
     virtual function void report_phase(uvm_phase phase);
         super.report_phase(phase);
@@ -96,12 +233,14 @@ class register_file_scoreboard extends uvm_scoreboard;
         `uvm_info(get_type_name(), $sformatf("Total Reads:  %0d", read_count), UVM_LOW)
         `uvm_info(get_type_name(), $sformatf("PASS Count:   %0d", pass_count), UVM_LOW)
         `uvm_info(get_type_name(), $sformatf("FAIL Count:   %0d", fail_count), UVM_LOW)
+        `uvm_info(get_type_name(), $sformatf("Addresses Tracked: %0d", ref_registers.num()), UVM_LOW)
+        `uvm_info(get_type_name(), $sformatf("Peak Outstanding:  %0d", peak_outstanding), UVM_LOW)
         
-        if (fail_count == 0) begin
+        if (fail_count == 0 && outstanding == 0) begin
             `uvm_info(get_type_name(), "*** TEST PASSED ***", UVM_LOW)
         end else begin
             `uvm_error(get_type_name(), "*** TEST FAILED ***")
         end
     endfunction
-    
+
 endclass
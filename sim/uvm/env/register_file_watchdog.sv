@@ -0,0 +1,104 @@
+`timescale 1ns / 1ps
+
+// register_file Watchdog
+// Emits a periodic heartbeat and ends the simulation when no agent makes progress
+class register_file_watchdog extends uvm_component;
+    
+    `uvm_component_utils(register_file_watchdog)
+    
+    // Agents whose activity counters are monitored
+    register_file_agent agents[$];
+    
+    // Settings (defaults from config.yaml, overridable by plusargs)
+    int unsigned heartbeat_interval_ns = 10000;
+    int unsigned hang_timeout_ns = 100000;
+    uvm_verbosity heartbeat_verbosity = UVM_LOW;
+    
+    // Constructor
+    function new(string name = "register_file_watchdog", uvm_component parent = null);
+        super.new(name, parent);
+    endfunction
+    
+    // Build phase
+    virtual function void build_phase(uvm_phase phase);
+        string verbosity_name;
+        
+        super.build_phase(phase);
+        
+        void'($value$plusargs("WATCHDOG_HEARTBEAT_NS=%d", heartbeat_interval_ns));
+        void'($value$plusargs("WATCHDOG_TIMEOUT_NS=%d", hang_timeout_ns));
+        
+        if ($value$plusargs("WATCHDOG_HEARTBEAT_VERBOSITY=%s", verbosity_name) &&
+            !uvm_enum_wrapper#(uvm_verbosity)::from_name(verbosity_name, heartbeat_verbosity)) begin
+            `uvm_fatal(get_type_name(), $sformatf("Unknown heartbeat verbosity %s", verbosity_name))
+        end
+        
+        if (heartbeat_interval_ns == 0) begin
+            `uvm_fatal(get_type_name(), "Heartbeat interval must be non-zero")
+        end
+        
+        `uvm_info(get_type_name(), $sformatf("Watchdog armed: heartbeat=%0dns, hang timeout=%0dns",
+                                             heartbeat_interval_ns, hang_timeout_ns), UVM_MEDIUM)
+    endfunction
+    
+    // Register an agent whose activity counts as progress
+    virtual function void add_agent(register_file_agent agent);
+        agents.push_back(agent);
+    endfunction
+    
+    // Run phase - sample activity counters once per heartbeat
+    virtual task run_phase(uvm_phase phase);
+        int unsigned last_counts[$];
+        int unsigned total;
+        time last_progress;
+        bit progress;
+        
+        foreach (agents[i]) begin
+            last_counts.push_back(0);
+        end
+        last_progress = $time;
+        
+        forever begin
+            #(heartbeat_interval_ns * 1ns);
+            
+            progress = 0;
+            total = 0;
+            foreach (agents[i]) begin
+                int unsigned count = agents[i].get_activity_count();
+                
+                if (count != last_counts[i]) begin
+                    progress = 1;
+                    last_counts[i] = count;
+                end
+                total += count;
+            end
+            
+            if (progress) begin
+                last_progress = $time;
+            end
+            
+            `uvm_info("HEARTBEAT", $sformatf("activity=%0d idle_for=%0t", total, $time - last_progress),
+                      heartbeat_verbosity)
+            
+            if (hang_timeout_ns != 0 && ($time - last_progress) >= hang_timeout_ns * 1ns) begin
+                dump_diagnostics(phase);
+                `uvm_fatal("WATCHDOG_HANG", $sformatf("No agent activity for %0t, ending simulation",
+                                                       $time - last_progress))
+            end
+        end
+    endtask
+    
+    // Print a short summary of where the testbench is stuck
+    virtual function void dump_diagnostics(uvm_phase phase);
+        uvm_objection objection = phase.get_objection();
+        
+        `uvm_info(get_type_name(), "=== WATCHDOG DIAGNOSTICS ===", UVM_NONE)
+        foreach (agents[i]) begin
+            `uvm_info(get_type_name(), agents[i].get_status(), UVM_NONE)
+        end
+        if (objection != null) begin
+            objection.display_objections(null, 1);
+        end
+    endfunction
+    
+endclass
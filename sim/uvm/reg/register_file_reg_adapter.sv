@@ -0,0 +1,44 @@
+`timescale 1ns / 1ps
+
+// register_file Register Adapter
+// Converts register model operations to bus transactions and back
+class register_file_reg_adapter extends uvm_reg_adapter;
+    
+    `uvm_object_utils(register_file_reg_adapter)
+    
+    // Constructor
+    function new(string name = "register_file_reg_adapter");
+        super.new(name);
+        
+        // The driver returns read data in the request item
+        supports_byte_enable = 0;
+        provides_responses = 0;
+    endfunction
+    
+    // Register operation -> bus transaction
+    virtual function uvm_sequence_item reg2bus(const ref uvm_reg_bus_op rw);
+        register_file_transaction trans;
+        
+        trans = register_file_transaction::type_id::create("reg_trans");
+        trans.operation = (rw.kind == UVM_READ) ? register_file_transaction::READ : register_file_transaction::WRITE;
+        trans.address = rw.addr;
+        trans.data = rw.data;
+        
+        return trans;
+    endfunction
+    
+    // Bus transaction -> register operation (used by frontdoor access and the predictor)
+    virtual function void bus2reg(uvm_sequence_item bus_item, ref uvm_reg_bus_op rw);
+        register_file_transaction trans;
+        
+        if (!$cast(trans, bus_item)) begin
+            `uvm_fatal(get_type_name(), "bus2reg: item is not a register_file_transaction")
+        end
+        
+        rw.kind = (trans.operation == register_file_transaction::READ) ? UVM_READ : UVM_WRITE;
+        rw.addr = trans.address;
+        rw.data = trans.data;
+        rw.status = UVM_IS_OK;
+    endfunction
+    
+endclass
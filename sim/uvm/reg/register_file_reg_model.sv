@@ -0,0 +1,72 @@
+`timescale 1ns / 1ps
+
+// register_file Register Model
+// Generated by UVM Base Generator on 2026-10-19 06:55:38
+// 4 registers, 1 register layouts
+
+// Register layout: value[31:0] RW
+class register_file_reg_type_0 extends uvm_reg;
+    
+    `uvm_object_utils(register_file_reg_type_0)
+    
+    rand uvm_reg_field value;
+    
+    function new(string name = "register_file_reg_type_0");
+        super.new(name, 32, UVM_NO_COVERAGE);
+    endfunction
+    
+    virtual function void build();
+        value = uvm_reg_field::type_id::create("value");
+        value.configure(this, 32, 0, "RW", 0, 0, 1, 1, 0);
+    endfunction
+    
+endclass
+
+// Register block
+class register_file_reg_block extends uvm_reg_block;
+    
+    `uvm_object_utils(register_file_reg_block)
+    
+    rand register_file_reg_type_0 REG0;
+    rand register_file_reg_type_0 REG1;
+    rand register_file_reg_type_0 REG2;
+    rand register_file_reg_type_0 REG3;
+    
+    function new(string name = "register_file_reg_block");
+        super.new(name, UVM_NO_COVERAGE);
+    endfunction
+    
+    virtual function void build();
+        // Word addressing: offsets match the DUT address bus
+        default_map = create_map("default_map", 0, 4, UVM_LITTLE_ENDIAN, 0);
+        add_hdl_path("register_file_tb.dut");
+        
+        build_registers_0();
+        
+        lock_model();
+    endfunction
+    
+    virtual function void build_registers_0();
+        REG0 = register_file_reg_type_0::type_id::create("REG0");
+        REG0.configure(this, null, "");
+        REG0.build();
+        REG0.add_hdl_path_slice("registers[0]", 0, 32);
+        default_map.add_reg(REG0, 'h0, "RW");
+        REG1 = register_file_reg_type_0::type_id::create("REG1");
+        REG1.configure(this, null, "");
+        REG1.build();
+        REG1.add_hdl_path_slice("registers[1]", 0, 32);
+        default_map.add_reg(REG1, 'h1, "RW");
+        REG2 = register_file_reg_type_0::type_id::create("REG2");
+        REG2.configure(this, null, "");
+        REG2.build();
+        REG2.add_hdl_path_slice("registers[2]", 0, 32);
+        default_map.add_reg(REG2, 'h2, "RW");
+        REG3 = register_file_reg_type_0::type_id::create("REG3");
+        REG3.configure(this, null, "");
+        REG3.build();
+        REG3.add_hdl_path_slice("registers[3]", 0, 32);
+        default_map.add_reg(REG3, 'h3, "RW");
+    endfunction
+    
+endclass
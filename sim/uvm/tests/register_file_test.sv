@@ -9,6 +9,10 @@ class register_file_base_test extends uvm_test;
     // Test environment
     register_file_env env;
     
+    // End-of-test settings (defaults from config.yaml, overridable by plusargs)
+    int unsigned eot_drain_time_ns = 20;
+    int unsigned eot_idle_cycles = 4;
+    
     // Constructor
     function new(string name = "register_file_base_test", uvm_component parent = null);
         super.new(name, parent);
@@ -21,6 +25,9 @@ class register_file_base_test extends uvm_test;
         // Create environment
         env = register_file_env::type_id::create("env", this);
         
+        void'($value$plusargs("EOT_DRAIN_NS=%d", eot_drain_time_ns));
+        void'($value$plusargs("EOT_IDLE_CYCLES=%d", eot_idle_cycles));
+        
         `uvm_info(get_type_name(), "Base test build completed", UVM_MEDIUM)
     endfunction
     
@@ -29,6 +36,36 @@ class register_file_base_test extends uvm_test;
         super.end_of_elaboration_phase(phase);
         uvm_top.print_topology();
     endfunction
+    
+    // Wait until the interface is quiescent instead of a fixed delay.
+    // The drain time covers checks still in flight after the objection drops;
+    // the scoreboard extends the phase itself while transactions are outstanding.
+    virtual task wait_for_end_of_test(uvm_phase phase);
+        uvm_objection objection = phase.get_objection();
+        
+        objection.set_drain_time(this, eot_drain_time_ns * 1ns);
+        env.agent.monitor.wait_for_idle(eot_idle_cycles);
+        
+        `uvm_info(get_type_name(), $sformatf("Interface idle for %0d cycles, ending test", eot_idle_cycles), UVM_MEDIUM)
+    endtask
+    
+    // Mask of a register's implemented bits
+    virtual function uvm_reg_data_t reg_mask(uvm_reg rg);
+        return (uvm_reg_data_t'(1) << rg.get_n_bits()) - 1;
+    endfunction
+    
+    // Preload a register through the HDL backdoor in zero simulated time
+    // and keep the scoreboard reference model in sync
+    virtual task backdoor_write(uvm_reg rg, uvm_reg_data_t value);
+        uvm_status_e status;
+        
+        value &= reg_mask(rg);
+        rg.poke(status, value);
+        if (status != UVM_IS_OK) begin
+            `uvm_error(get_type_name(), $sformatf("Backdoor write to %s failed", rg.get_full_name()))
+        end
+        env.scoreboard.predict_write(rg.get_address(), value);
+    endtask
 
 endclass
 
@@ -58,9 +95,6 @@ class register_file_basic_test extends register_file_base_test;
             write_seq.start(env.agent.sequencer);
         end
         
-        // Small delay
-        #100ns;
-        
         // Read from all registers
         for (int i = 0; i < 4; i++) begin
             read_seq = register_file_read_sequence::type_id::create("read_seq");
@@ -68,7 +102,7 @@ class register_file_basic_test extends register_file_base_test;
             read_seq.start(env.agent.sequencer);
         end
         
-        #100ns;
+        wait_for_end_of_test(phase);
         
         `uvm_info(get_type_name(), "Basic test completed", UVM_LOW)
         phase.drop_objection(this);
@@ -93,17 +127,80 @@ class register_file_random_test extends register_file_base_test;
         
         `uvm_info(get_type_name(), "Starting random test", UVM_LOW)
         
-        // Run random sequence
+        // Run random sequence until the coverage goal or budget is reached
         rand_seq = register_file_random_sequence::type_id::create("rand_seq");
-        if (!rand_seq.randomize() with { num_transactions == 20; }) begin
+        if (!rand_seq.randomize()) begin
             `uvm_fatal(get_type_name(), "Random sequence randomization failed")
         end
+        rand_seq.cov = env.coverage;
+        void'($value$plusargs("COV_GOAL=%f", rand_seq.coverage_goal));
+        void'($value$plusargs("COV_MAX_TRANS=%d", rand_seq.max_transactions));
+        void'($value$plusargs("COV_STALL_WINDOW=%d", rand_seq.stall_window));
         rand_seq.start(env.agent.sequencer);
         
-        #1000ns;
+        wait_for_end_of_test(phase);
         
         `uvm_info(get_type_name(), "Random test completed", UVM_LOW)
         phase.drop_objection(this);
     endtask
 
 endclass
+
+// Register Model Test
+// Preloads registers through the backdoor, then checks them with frontdoor
+// reads and verifies frontdoor writes with backdoor peeks
+class register_file_reg_test extends register_file_base_test;
+    
+    `uvm_component_utils(register_file_reg_test)
+    
+    function new(string name = "register_file_reg_test", uvm_component parent = null);
+        super.new(name, parent);
+    endfunction
+    
+    virtual task run_phase(uvm_phase phase);
+        uvm_reg regs[$];
+        uvm_reg_data_t written[$];
+        uvm_reg_data_t value;
+        uvm_status_e status;
+        
+        phase.raise_objection(this);
+        
+        `uvm_info(get_type_name(), "Starting register model test", UVM_LOW)
+        
+        env.reg_model.get_registers(regs);
+        
+        // Wait until the driver has taken the DUT out of reset
+        wait (env.agent.driver.state == "WAIT_ITEM");
+        
+        // Preload every register in zero simulated time
+        foreach (regs[i]) begin
+            backdoor_write(regs[i], {$urandom, $urandom} & reg_mask(regs[i]));
+        end
+        
+        // Frontdoor reads must return the preloaded values
+        foreach (regs[i]) begin
+            regs[i].mirror(status, UVM_CHECK, UVM_FRONTDOOR);
+        end
+        
+        // Frontdoor writes must be visible through the backdoor
+        foreach (regs[i]) begin
+            value = ~regs[i].get_mirrored_value() & reg_mask(regs[i]);
+            regs[i].write(status, value, UVM_FRONTDOOR);
+            written.push_back(value);
+        end
+        env.agent.monitor.wait_for_idle(1);
+        foreach (regs[i]) begin
+            regs[i].peek(status, value);
+            if (value != written[i]) begin
+                `uvm_error(get_type_name(), $sformatf("%s: backdoor=0x%0h, written=0x%0h",
+                                                      regs[i].get_name(), value, written[i]))
+            end
+        end
+        
+        wait_for_end_of_test(phase);
+        
+        `uvm_info(get_type_name(), "Register model test completed", UVM_LOW)
+        phase.drop_objection(this);
+    endtask
+
+endclass
@@ -30,8 +30,9 @@ class register_file_transaction extends uvm_sequence_item;
         address inside {[0:3]};
     }
     
+    // Bias towards corner values so data coverage bins are reachable
     constraint data_constraint {
-        data inside {[0:32'hFFFFFFFF]};
+        data dist {32'h0 := 1, 32'hFFFFFFFF := 1, [32'h1:32'hFFFF] :/ 4, [32'h10000:32'hFFFFFFFE] :/ 4};
     }
     
     // Convert to string for debugging
@@ -0,0 +1,47 @@
+`timescale 1ns / 1ps
+
+// {module_name} Functional Coverage
+// Covergroup derived from transaction.fields in config.yaml
+class {module_name}_coverage extends uvm_subscriber #({module_name}_transaction);
+    
+    `uvm_component_utils({module_name}_coverage)
+    
+    // Transaction being sampled
+    {module_name}_transaction trans;
+    
+    // Number of sampled transactions
+    int unsigned sample_count = 0;
+    
+    // Transaction covergroup (coverpoints generated from config.yaml)
+    covergroup trans_cg;
+        option.per_instance = 1;
+{coverpoints}
+    endgroup
+    
+    // Constructor
+    function new(string name = "{module_name}_coverage", uvm_component parent = null);
+        super.new(name, parent);
+        trans_cg = new();
+    endfunction
+    
+    // Sample every transaction observed by the monitor
+    virtual function void write({module_name}_transaction t);
+        trans = t;
+        trans_cg.sample();
+        sample_count++;
+    endfunction
+    
+    // Current functional coverage in percent
+    virtual function real get_coverage();
+        return trans_cg.get_inst_coverage();
+    endfunction
+    
+    // Report phase
+    virtual function void report_phase(uvm_phase phase);
+        super.report_phase(phase);
+        
+        `uvm_info(get_type_name(), $sformatf("Functional coverage: %0.2f%% (%0d transactions sampled)",
+                                             get_coverage(), sample_count), UVM_LOW)
+    endfunction
+    
+endclass
@@ -0,0 +1,146 @@
+/*
+ * {module_name} DPI-C Reference Model
+ * Generated by UVM Base Generator on {timestamp}
+ *
+ * Skeleton reference model called from {module_name}_dpi_scoreboard.
+ * The scoreboard passes completed transactions in batches; the model
+ * predicts each one, fills expected[] and returns the number of mismatches.
+ * Values written outside the bus (backdoor pokes) arrive through model_write.
+ * Replace the prediction logic in predict() with the real model.
+ */
+
+#include <stdint.h>
+#include <stdlib.h>
+#include <string.h>
+#include "svdpi.h"
+
+/* Operation encoding (matches {module_name}_transaction::operation_t) */
+#define OP_READ  0u
+#define OP_WRITE 1u
+
+typedef {dpi_addr_c} addr_t;
+typedef {dpi_data_c} data_t;
+
+/* Sparse register storage: open-addressing hash table, address -> data */
+typedef struct {
+    addr_t addr;
+    data_t data;
+    uint8_t used;
+} entry_t;
+
+static entry_t *table = NULL;
+static size_t table_size = 0;
+static size_t table_used = 0;
+static const data_t RESET_VALUE = 0;
+
+static size_t slot_of(addr_t addr, size_t size)
+{
+    uint64_t h = (uint64_t)addr * 0x9E3779B97F4A7C15ull;
+    return (size_t)(h >> 32) & (size - 1);
+}
+
+static entry_t *lookup(addr_t addr)
+{
+    size_t i;
+
+    if (table_size == 0) {
+        return NULL;
+    }
+    for (i = slot_of(addr, table_size); table[i].used; i = (i + 1) & (table_size - 1)) {
+        if (table[i].addr == addr) {
+            return &table[i];
+        }
+    }
+    return NULL;
+}
+
+static void grow(void)
+{
+    entry_t *old = table;
+    size_t old_size = table_size;
+    size_t i;
+
+    table_size = old_size ? old_size * 2 : 1024;
+    table = (entry_t *)calloc(table_size, sizeof(entry_t));
+    table_used = 0;
+    for (i = 0; i < old_size; i++) {
+        if (old[i].used) {
+            size_t j = slot_of(old[i].addr, table_size);
+            while (table[j].used) {
+                j = (j + 1) & (table_size - 1);
+            }
+            table[j] = old[i];
+            table_used++;
+        }
+    }
+    free(old);
+}
+
+static void store(addr_t addr, data_t data)
+{
+    entry_t *e = lookup(addr);
+    size_t i;
+
+    if (e != NULL) {
+        e->data = data;
+        return;
+    }
+    if ((table_used + 1) * 4 > table_size * 3) {
+        grow();
+    }
+    for (i = slot_of(addr, table_size); table[i].used; i = (i + 1) & (table_size - 1)) {
+    }
+    table[i].addr = addr;
+    table[i].data = data;
+    table[i].used = 1;
+    table_used++;
+}
+
+/* Predict one transaction: writes update the model, reads return the stored value */
+static data_t predict(uint32_t op, addr_t addr, data_t data)
+{
+    entry_t *e;
+
+    if (op == OP_WRITE) {
+        store(addr, data);
+        return data;
+    }
+    e = lookup(addr);
+    return e ? e->data : RESET_VALUE;
+}
+
+void {module_name}_model_reset(void)
+{
+    free(table);
+    table = NULL;
+    table_size = 0;
+    table_used = 0;
+}
+
+void {module_name}_model_write({dpi_addr_c} addr, {dpi_data_c} data)
+{
+    store(addr, data);
+}
+
+int {module_name}_model_check_batch(const svOpenArrayHandle op,
+                                    const svOpenArrayHandle addr,
+                                    const svOpenArrayHandle data,
+                                    const svOpenArrayHandle expected,
+                                    int count)
+{
+    int i;
+    int mismatches = 0;
+
+    for (i = 0; i < count; i++) {
+        uint32_t o = *(const uint32_t *)svGetArrElemPtr1(op, i);
+        addr_t a = *(const addr_t *)svGetArrElemPtr1(addr, i);
+        data_t d = *(const data_t *)svGetArrElemPtr1(data, i);
+        data_t e = predict(o, a, d);
+
+        *(data_t *)svGetArrElemPtr1(expected, i) = e;
+        if (o == OP_READ && d != e) {
+            mismatches++;
+        }
+    }
+    return mismatches;
+}
@@ -0,0 +1,133 @@
+`timescale 1ns / 1ps
+
+// {module_name} DPI-C Reference Model Interface
+// Batched predict/compare API implemented in sim/dpi/{module_name}_ref_model.c
+import "DPI-C" function void {module_name}_model_reset();
+import "DPI-C" function void {module_name}_model_write(input {dpi_addr_sv} addr, input {dpi_data_sv} data);
+import "DPI-C" function int {module_name}_model_check_batch(input int unsigned op[],
+                                                            input {dpi_addr_sv} addr[],
+                                                            input {dpi_data_sv} data[],
+                                                            output {dpi_data_sv} expected[],
+                                                            input int count);
+
+// {module_name} DPI Scoreboard
+// Replaces the SystemVerilog reference model with the C model. Completed
+// transactions are buffered and checked batch_size at a time so the cost of
+// crossing the DPI boundary is amortized over the whole batch.
+class {module_name}_dpi_scoreboard extends {module_name}_scoreboard;
+    
+    `uvm_component_utils({module_name}_dpi_scoreboard)
+    
+    // Batch settings
+    int unsigned batch_size = {dpi_batch_size};
+    {module_name}_transaction batch[$];
+    
+    // Batch buffers passed to the C model
+    int unsigned op_buf[];
+    {dpi_addr_sv} addr_buf[];
+    {dpi_data_sv} data_buf[];
+    {dpi_data_sv} expected_buf[];
+    
+    // Constructor
+    function new(string name = "{module_name}_dpi_scoreboard", uvm_component parent = null);
+        super.new(name, parent);
+    endfunction
+    
+    // Build phase
+    virtual function void build_phase(uvm_phase phase);
+        super.build_phase(phase);
+        
+        void'($value$plusargs("DPI_BATCH_SIZE=%d", batch_size));
+        if (batch_size == 0) begin
+            batch_size = 1;
+        end
+        
+        op_buf = new[batch_size];
+        addr_buf = new[batch_size];
+        data_buf = new[batch_size];
+        expected_buf = new[batch_size];
+        
+        {module_name}_model_reset();
+        `uvm_info(get_type_name(), $sformatf("Using DPI-C reference model, batch size %0d", batch_size), UVM_MEDIUM)
+    endfunction
+    
+    // Buffer completed transactions; check them once a batch is full
+    virtual function void write({module_name}_transaction trans);
+        `uvm_info(get_type_name(), $sformatf("Received transaction: %s", trans.convert2string()), UVM_HIGH)
+        
+        if (trans.operation == {module_name}_transaction::WRITE) begin
+            write_count++;
+        end else begin
+            read_count++;
+        end
+        
+        batch.push_back(trans);
+        outstanding++;
+        if (batch.size() >= batch_size) begin
+            flush_batch();
+        end
+    endfunction
+    
+    // Store a value written outside the bus in the C model, after the
+    // buffered transactions that preceded it
+    virtual function void predict_write(addr_t addr, data_t data);
+        flush_batch();
+        {module_name}_model_write(addr, data);
+    endfunction
+    
+    // Check all buffered transactions with a single DPI call
+    virtual function void flush_batch();
+        int count = batch.size();
+        int mismatches;
+        
+        if (count == 0) begin
+            return;
+        end
+        
+        if (count > op_buf.size()) begin
+            op_buf = new[count];
+            addr_buf = new[count];
+            data_buf = new[count];
+            expected_buf = new[count];
+        end
+        
+        foreach (batch[i]) begin
+            op_buf[i] = batch[i].operation;
+            addr_buf[i] = batch[i].address;
+            data_buf[i] = batch[i].data;
+        end
+        
+        mismatches = {module_name}_model_check_batch(op_buf, addr_buf, data_buf, expected_buf, count);
+        pass_count += count - mismatches;
+        fail_count += mismatches;
+        
+        // Only walk the batch for reporting when the model found mismatches
+        if (mismatches != 0) begin
+            foreach (batch[i]) begin
+                if (batch[i].operation == {module_name}_transaction::READ && batch[i].data != expected_buf[i]) begin
+                    `uvm_error(get_type_name(),
+                              $sformatf("READ: addr=0x%0h, data=0x%0h, expected=0x%0h - FAIL",
+                                       batch[i].address, batch[i].data, expected_buf[i]))
+                end
+            end
+        end
+        
+        outstanding -= count;
+        batch.delete();
+    endfunction
+    
+    // Check the partial batch before the run phase ends
+    virtual function void phase_ready_to_end(uvm_phase phase);
+        if (phase.get_name() == "run") begin
+            flush_batch();
+        end
+        super.phase_ready_to_end(phase);
+    endfunction
+    
+    // Check phase - make sure nothing is left unchecked
+    virtual function void check_phase(uvm_phase phase);
+        flush_batch();
+        super.check_phase(phase);
+    endfunction
+    
+endclass
@@ -9,6 +9,10 @@ class register_file_driver extends uvm_driver #(register_file_transaction);
     // Virtual interface handle
     virtual register_file_if vif;
     
+    // Progress tracking (reported by the watchdog on a hang)
+    int unsigned num_driven = 0;    // Transactions completed
+    string state = "INIT";          // Current driver activity
+    
     // Constructor
     function new(string name = "register_file_driver", uvm_component parent = null);
         super.new(name, parent);
@@ -36,12 +40,15 @@ class register_file_driver extends uvm_driver #(register_file_transaction);
         // Main driver loop
         forever begin
             // Get next transaction from sequencer
+            state = "WAIT_ITEM";
             seq_item_port.get_next_item(req);
             
             `uvm_info(get_type_name(), $sformatf("Driving transaction: %s", req.convert2string()), UVM_HIGH)
             
             // Drive the transaction
+            state = "DRIVE";
             drive_transaction(req);
+            num_driven++;
             
             // Signal completion to sequencer
             seq_item_port.item_done();
@@ -64,10 +71,12 @@ class register_file_driver extends uvm_driver #(register_file_transaction);
         `uvm_info(get_type_name(), "Waiting for reset deassertion...", UVM_MEDIUM)
         
         // Apply reset for a few cycles
+        state = "RESET";
         repeat (5) @(vif.driver_cb);
         vif.driver_cb.reset <= 1'b0;
         
         // Wait for ready signal
+        state = "WAIT_READY";
         wait (vif.driver_cb.ready == 1'b1);
         `uvm_info(get_type_name(), "Reset deasserted and DUT ready", UVM_MEDIUM)
     endtask
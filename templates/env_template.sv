@@ -9,6 +9,17 @@ class register_file_env extends uvm_env;
     // Environment components
     register_file_agent agent;
     register_file_scoreboard scoreboard;
+    register_file_watchdog watchdog;
+    register_file_coverage coverage;
+    
+    // Register model with frontdoor adapter, bus predictor and HDL backdoor
+    register_file_reg_block reg_model;
+    register_file_reg_adapter reg_adapter;
+    uvm_reg_predictor #(register_file_transaction) reg_predictor;
+    
+    // Configuration
+    bit watchdog_enable = {watchdog_enabled};
+    bit coverage_enable = {coverage_enabled};
     
     // Constructor
     function new(string name = "register_file_env", uvm_component parent = null);
@@ -22,9 +33,37 @@ class register_file_env extends uvm_env;
         // Create agent
         agent = register_file_agent::type_id::create("agent", this);
         
+`ifdef {module_upper}_DPI_MODEL
+        // Check against the DPI-C reference model
+        set_type_override_by_type(register_file_scoreboard::get_type(), register_file_dpi_scoreboard::get_type());
+`endif
+        
         // Create scoreboard
         scoreboard = register_file_scoreboard::type_id::create("scoreboard", this);
         
+        // Create register model (a test may provide its own through the config DB)
+        if (!uvm_config_db#(register_file_reg_block)::get(this, "", "reg_model", reg_model)) begin
+            reg_model = register_file_reg_block::type_id::create("reg_model");
+            reg_model.build();
+        end
+        reg_adapter = register_file_reg_adapter::type_id::create("reg_adapter");
+        reg_predictor = uvm_reg_predictor#(register_file_transaction)::type_id::create("reg_predictor", this);
+        
+        // Create functional coverage collector unless disabled
+        void'(uvm_config_db#(bit)::get(this, "", "coverage_enable", coverage_enable));
+        if (coverage_enable) begin
+            coverage = register_file_coverage::type_id::create("coverage", this);
+        end
+        
+        // Create hang watchdog unless disabled
+        void'(uvm_config_db#(bit)::get(this, "", "watchdog_enable", watchdog_enable));
+        if ($test$plusargs("WATCHDOG_DISABLE")) begin
+            watchdog_enable = 0;
+        end
+        if (watchdog_enable) begin
+            watchdog = register_file_watchdog::type_id::create("watchdog", this);
+        end
+        
         `uvm_info(get_type_name(), "Environment components created", UVM_MEDIUM)
     endfunction
     
@@ -35,6 +74,25 @@ class register_file_env extends uvm_env;
         // Connect agent monitor to scoreboard
         agent.ap.connect(scoreboard.ap);
         
+        // Frontdoor access goes through the agent; the mirror is updated from observed bus traffic
+        if (agent.is_active) begin
+            reg_model.default_map.set_sequencer(agent.sequencer, reg_adapter);
+        end
+        reg_model.default_map.set_auto_predict(0);
+        reg_predictor.map = reg_model.default_map;
+        reg_predictor.adapter = reg_adapter;
+        agent.ap.connect(reg_predictor.bus_in);
+        
+        // Connect agent monitor to coverage collector
+        if (coverage != null) begin
+            agent.ap.connect(coverage.analysis_export);
+        end
+        
+        // Register agent activity counters with the watchdog
+        if (watchdog != null) begin
+            watchdog.add_agent(agent);
+        end
+        
         `uvm_info(get_type_name(), "Environment connections completed", UVM_MEDIUM)
     endfunction
 
@@ -9,11 +9,19 @@ package {module_name}_pkg;
     
     // Include all UVM components with organized directory structure
     `include "../transactions/{module_name}_transaction.sv"
+    `include "../env/{module_name}_coverage.sv"
     `include "../sequences/{module_name}_sequence.sv"
     `include "../agents/{module_name}_driver.sv"
+    `include "../agents/{module_name}_trace_writer.sv"
     `include "../agents/{module_name}_monitor.sv"
     `include "../agents/{module_name}_agent.sv"
+    `include "../reg/{module_name}_reg_model.sv"
+    `include "../reg/{module_name}_reg_adapter.sv"
     `include "../env/{module_name}_scoreboard.sv"
+`ifdef {module_upper}_DPI_MODEL
+    `include "../env/{module_name}_dpi_scoreboard.sv"
+`endif
+    `include "../env/{module_name}_watchdog.sv"
     `include "../env/{module_name}_env.sv"
     `include "../tests/{module_name}_test.sv"
     
@@ -0,0 +1,44 @@
+`timescale 1ns / 1ps
+
+// {module_name} Register Adapter
+// Converts register model operations to bus transactions and back
+class {module_name}_reg_adapter extends uvm_reg_adapter;
+    
+    `uvm_object_utils({module_name}_reg_adapter)
+    
+    // Constructor
+    function new(string name = "{module_name}_reg_adapter");
+        super.new(name);
+        
+        // The driver returns read data in the request item
+        supports_byte_enable = 0;
+        provides_responses = 0;
+    endfunction
+    
+    // Register operation -> bus transaction
+    virtual function uvm_sequence_item reg2bus(const ref uvm_reg_bus_op rw);
+        {module_name}_transaction trans;
+        
+        trans = {module_name}_transaction::type_id::create("reg_trans");
+        trans.operation = (rw.kind == UVM_READ) ? {module_name}_transaction::READ : {module_name}_transaction::WRITE;
+        trans.address = rw.addr;
+        trans.data = rw.data;
+        
+        return trans;
+    endfunction
+    
+    // Bus transaction -> register operation (used by frontdoor access and the predictor)
+    virtual function void bus2reg(uvm_sequence_item bus_item, ref uvm_reg_bus_op rw);
+        {module_name}_transaction trans;
+        
+        if (!$cast(trans, bus_item)) begin
+            `uvm_fatal(get_type_name(), "bus2reg: item is not a {module_name}_transaction")
+        end
+        
+        rw.kind = (trans.operation == {module_name}_transaction::READ) ? UVM_READ : UVM_WRITE;
+        rw.addr = trans.address;
+        rw.data = trans.data;
+        rw.status = UVM_IS_OK;
+    endfunction
+    
+endclass
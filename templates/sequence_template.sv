@@ -91,23 +91,72 @@ class register_file_random_sequence extends register_file_sequence;
     
     constraint num_trans_c { num_transactions inside {[10:50]}; }
     
+    // Coverage-driven termination (used when a coverage collector is attached)
+    register_file_coverage cov;
+    real coverage_goal = {coverage_goal};
+    int unsigned max_transactions = {coverage_max_transactions};
+    int unsigned stall_window = {coverage_stall_window};
+    
     function new(string name = "register_file_random_sequence");
         super.new(name);
     endfunction
     
     virtual task body();
-        register_file_transaction req;
+        if (cov == null) begin
+            `uvm_info(get_type_name(), $sformatf("Starting random sequence with %0d transactions", num_transactions), UVM_MEDIUM)
+            
+            for (int i = 0; i < num_transactions; i++) begin
+                send_random_item(i);
+            end
+        end else begin
+            run_until_covered();
+        end
+    endtask
+    
+    // Keep sending random items until the coverage goal is reached, coverage
+    // stops improving for stall_window items, or the budget is exhausted
+    virtual task run_until_covered();
+        int unsigned count = 0;
+        int unsigned last_gain = 0;
+        real best = cov.get_coverage();
+        real current;
         
-        `uvm_info(get_type_name(), $sformatf("Starting random sequence with %0d transactions", num_transactions), UVM_MEDIUM)
+        `uvm_info(get_type_name(), $sformatf("Starting coverage-driven sequence: goal=%0.2f%%, budget=%0d, stall window=%0d",
+                                             coverage_goal, max_transactions, stall_window), UVM_MEDIUM)
         
-        for (int i = 0; i < num_transactions; i++) begin
-            req = register_file_transaction::type_id::create($sformatf("req_%0d", i));
-            start_item(req);
-            if (!req.randomize()) begin
-                `uvm_fatal(get_type_name(), "Randomization failed")
+        while (count < max_transactions) begin
+            send_random_item(count);
+            count++;
+            
+            current = cov.get_coverage();
+            if (current >= coverage_goal) begin
+                `uvm_info(get_type_name(), $sformatf("Coverage goal reached: %0.2f%% after %0d transactions", current, count), UVM_LOW)
+                return;
             end
-            finish_item(req);
+            
+            if (current > best) begin
+                best = current;
+                last_gain = count;
+            end else if (stall_window != 0 && (count - last_gain) >= stall_window) begin
+                `uvm_info(get_type_name(), $sformatf("Coverage stalled at %0.2f%% for %0d transactions, stopping after %0d",
+                                                     current, stall_window, count), UVM_LOW)
+                return;
+            end
+        end
+        
+        `uvm_info(get_type_name(), $sformatf("Transaction budget exhausted: %0.2f%% after %0d transactions", best, count), UVM_LOW)
+    endtask
+    
+    // Randomize and send a single transaction
+    virtual task send_random_item(int unsigned index);
+        register_file_transaction req;
+        
+        req = register_file_transaction::type_id::create($sformatf("req_%0d", index));
+        start_item(req);
+        if (!req.randomize()) begin
+            `uvm_fatal(get_type_name(), "Randomization failed")
         end
+        finish_item(req);
     endtask
 
 endclass
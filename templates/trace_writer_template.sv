@@ -0,0 +1,125 @@
+`timescale 1ns / 1ps
+
+// Register File Transaction Trace Writer
+// Streams observed transactions into a compact fixed-record binary file
+// through a word buffer. Read traces back with scripts/trace_reader.py.
+//
+// File layout (all values are 32-bit words in the simulator's byte order;
+// 64-bit values are written least significant word first):
+//   magic, version, header_bytes, record_bytes  - 16 byte fixed header
+//   layout text, space padded to header_bytes    - "timeunit=..;name:type;..."
+//   records, record_bytes each                   - time followed by transaction.fields
+class register_file_trace_writer extends uvm_object;
+    
+    `uvm_object_utils(register_file_trace_writer)
+    
+    // "UVMT" - readers use it to detect the byte order of the file
+    localparam bit [31:0] MAGIC = 32'h55564D54;
+    localparam int unsigned VERSION = 1;
+    
+    // Record layout (from transaction.fields in config.yaml)
+    localparam int unsigned RECORD_WORDS = {trace_record_words};
+    localparam string LAYOUT = "{trace_layout}";
+    
+    // Records buffered before a write to the file
+    int unsigned buffer_records = {trace_buffer_records};
+    
+    // Buffered words written per $fwrite call
+    localparam int unsigned WRITE_WORDS = {trace_write_words};
+    
+    string file_name;
+    int unsigned num_records = 0;
+    
+    protected int fd = 0;
+    protected bit [31:0] buffer[$];
+    
+    // Constructor
+    function new(string name = "register_file_trace_writer");
+        super.new(name);
+    endfunction
+    
+    // Open the trace file and write the header
+    virtual function bit open(string file_name);
+        string layout = {LAYOUT, get_enum_layout()};
+        
+        this.file_name = file_name;
+        void'($value$plusargs("TRACE_BUFFER=%d", buffer_records));
+        
+        fd = $fopen(file_name, "wb");
+        if (fd == 0) begin
+            `uvm_error(get_type_name(), $sformatf("Cannot open trace file %s", file_name))
+            return 0;
+        end
+        
+        // Pad the header so records start on an 8 byte boundary
+        while ((16 + layout.len()) % 8 != 0) begin
+            layout = {layout, " "};
+        end
+        
+        $fwrite(fd, "%u%u%u%u", MAGIC, 32'(VERSION), 32'(16 + layout.len()), 32'(RECORD_WORDS * 4));
+        $fwrite(fd, "%s", layout);
+        
+        `uvm_info(get_type_name(), $sformatf("Tracing transactions to %s (%0d bytes/record)",
+                                             file_name, RECORD_WORDS * 4), UVM_LOW)
+        return 1;
+    endfunction
+    
+    // Enumerated field encodings, appended to the layout text
+    virtual function string get_enum_layout();
+        string layout = "";
+{trace_enum_layout}
+        return layout;
+    endfunction
+    
+    // Append one transaction record
+    virtual function void write(register_file_transaction trans);
+        if (fd == 0) begin
+            return;
+        end
+        
+        push_u64($time);
+{trace_pack}
+        num_records++;
+        
+        if (buffer.size() >= buffer_records * RECORD_WORDS) begin
+            flush();
+        end
+    endfunction
+    
+    // Write buffered records to the file, WRITE_WORDS words per $fwrite call
+    virtual function void flush();
+        int unsigned i = 0;
+        
+        for (; i + WRITE_WORDS <= buffer.size(); i += WRITE_WORDS) begin
+            $fwrite(fd, "{trace_write_format}",
+                    {trace_write_args});
+        end
+        for (; i < buffer.size(); i++) begin
+            $fwrite(fd, "%u", buffer[i]);
+        end
+        buffer.delete();
+    endfunction
+    
+    // Flush and close the trace file
+    virtual function void close();
+        if (fd == 0) begin
+            return;
+        end
+        
+        flush();
+        $fclose(fd);
+        fd = 0;
+        
+        `uvm_info(get_type_name(), $sformatf("Wrote %0d trace records to %s", num_records, file_name), UVM_LOW)
+    endfunction
+    
+    protected function void push_u32(bit [31:0] value);
+        buffer.push_back(value);
+    endfunction
+    
+    protected function void push_u64(bit [63:0] value);
+        buffer.push_back(value[31:0]);
+        buffer.push_back(value[63:32]);
+    endfunction
+
+endclass
@@ -0,0 +1,110 @@
+"""
+Shared fixtures: a throwaway project directory for the regression runner, a
+helper that runs the runner in it against the stub dsim, and a dashboard on a
+temporary database.
+"""
+
+import sys
+import json
+import struct
+import subprocess
+from pathlib import Path
+
+import pytest
+import yaml
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+SCRIPTS_DIR = REPO_ROOT / 'scripts'
+STUB_DSIM = Path(__file__).resolve().parent / 'stub_dsim'
+
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+from dashboard_generator import UVMDashboard  # noqa: E402
+
+# name|description|filelist|test_class|wave_file|verbosity, as in a generated test_config.cfg
+TESTS = [
+    ('stub_pass', 'Passing test', 'stub.f', 'stub_pass_test', 'stub_pass.mxd', 'UVM_MEDIUM'),
+    ('stub_fail', 'Test reporting a UVM_ERROR', 'stub.f', 'stub_fail_test', 'stub_fail.mxd', 'UVM_MEDIUM'),
+    ('stub_hang', 'Test that never finishes', 'stub.f', 'stub_hang_test', 'stub_hang.mxd', 'UVM_MEDIUM'),
+]
+
+
+# Trace layout of the register file transaction, as the generated trace writer emits it
+TRACE_LAYOUT = 'timeunit=1ns;time:u8;operation:u4;address:u4;data:u4;ready:u4;enum.operation=READ:0,WRITE:1,'
+READ, WRITE = 0, 1
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    """Project with the repository's config.yaml, a stub filelist and three stub tests."""
+    with open(REPO_ROOT / 'config.yaml', 'r', encoding='utf-8') as f:
+        config = yaml.safe_load(f)
+    config['regression']['progress_seconds'] = 0
+    (tmp_path / 'config.yaml').write_text(yaml.safe_dump(config), encoding='utf-8')
+
+    exec_dir = tmp_path / config['directories']['sim_exec']
+    exec_dir.mkdir(parents=True)
+    (exec_dir / 'stub.sv').write_text("module stub_tb; endmodule\n", encoding='utf-8')
+    (exec_dir / 'stub.f').write_text("stub.sv\n", encoding='utf-8')
+    (exec_dir / 'test_config.cfg').write_text(
+        "".join('|'.join(test) + '\n' for test in TESTS), encoding='utf-8')
+
+    monkeypatch.setenv('STUB_DSIM_CALLS', str(tmp_path / 'dsim_calls.txt'))
+    return tmp_path
+
+
+@pytest.fixture
+def run_regression(project):
+    """Run regression_runner.py in the project; returns (exit code, results JSON)."""
+    def run(*args, timeout=120):
+        output = project / f'results{len(list(project.glob("results*.json")))}.json'
+        command = [sys.executable, str(SCRIPTS_DIR / 'regression_runner.py'), '--dsim', str(STUB_DSIM),
+                   '--cache-db', str(project / 'cache.db'), '--no-archive', '-o', str(output), *args]
+        process = subprocess.run(command, cwd=project, capture_output=True, text=True, timeout=timeout)
+        assert output.exists(), process.stdout + process.stderr
+        return process.returncode, json.loads(output.read_text(encoding='utf-8'))
+    return run
+
+
+@pytest.fixture
+def dashboard_config(tmp_path):
+    """dashboard_config.yaml for a database and output directory under tmp_path."""
+    config = {'database_path': str(tmp_path / 'metrics.db'), 'output_directory': str(tmp_path / 'dashboard')}
+    config_file = tmp_path / 'dashboard_config.yaml'
+    config_file.write_text(yaml.safe_dump(config), encoding='utf-8')
+    return str(config_file)
+
+
+@pytest.fixture
+def dashboard(dashboard_config):
+    """UVMDashboard on a new, fully migrated database."""
+    dashboard = UVMDashboard(dashboard_config)
+    yield dashboard
+    dashboard.conn.close()
+
+
+def dsim_calls(project):
+    """Simulations the stub dsim has run in the project, as (test_class, seed) pairs."""
+    calls = project / 'dsim_calls.txt'
+    if not calls.exists():
+        return []
+    return [tuple(line.split()) for line in calls.read_text(encoding='utf-8').splitlines()]
+
+
+def write_trace(path, records, byte_order='<'):
+    """Write (time, operation, address, data, ready) records as the generated trace writer does.
+
+    Every value is a 32-bit word in byte_order; time is two words, least
+    significant first.
+    """
+    layout = TRACE_LAYOUT
+    while (16 + len(layout)) % 8:
+        layout += ' '
+    words = []
+    for time, operation, address, data, ready in records:
+        words += [time & 0xFFFFFFFF, time >> 32, operation, address, data, ready]
+    with open(path, 'wb') as f:
+        f.write(struct.pack(f'{byte_order}4I', 0x55564D54, 1, 16 + len(layout), 24))
+        f.write(layout.encode('ascii'))
+        f.write(struct.pack(f'{byte_order}{len(words)}I', *words))
+    return str(path)
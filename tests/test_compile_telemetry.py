@@ -0,0 +1,53 @@
+"""DSIM build phase and unit statistics parsing (compile_telemetry.py) and the compile chart data."""
+
+from datetime import datetime, timedelta, timezone
+
+from conftest import REPO_ROOT
+from compile_telemetry import parse_compile_log
+
+SAMPLE_LOG = REPO_ROOT / 'docs' / 'sample_execution_log.txt'
+
+
+def test_sample_log_units_and_phases():
+    build = parse_compile_log(str(SAMPLE_LOG))
+
+    assert build['phases_reached'] == ['analyze', 'elaborate', 'optimize', 'build_models', 'link',
+                                       'runtime_elaboration']
+    units = {(unit['kind'], unit['name']): unit for unit in build['units']}
+    assert len(units) == 9
+    assert units[('package', 'uvm_pkg')] == {'kind': 'package', 'name': 'uvm_pkg', 'submodules': 6,
+                                              'functions': 3777, 'basic_blocks': 41195}
+    assert units[('package', 'register_file_pkg')]['functions'] == 118
+    assert units[('package', 'register_file_pkg')]['basic_blocks'] == 1123
+    assert units[('CU scope', '$unit')]['basic_blocks'] == 2
+
+
+def test_parsing_stops_at_event_scheduler(tmp_path):
+    log_file = tmp_path / 'run.log'
+    log_file.write_text(
+        "Analyzing...\n"
+        "Building models...\n"
+        "  [1/2] package register_file_pkg: 118 functions, 1123 basic blocks\n"
+        "=N:Starting event scheduler...\n"
+        "  [2/2] package late_pkg: 1 functions, 1 basic blocks\n"
+        "Linking image.so...\n", encoding='utf-8')
+
+    build = parse_compile_log(str(log_file))
+
+    assert build['phases_reached'] == ['analyze', 'build_models']
+    assert [unit['name'] for unit in build['units']] == ['register_file_pkg']
+
+
+def test_compile_chart_stacks_daily_median_of_imports(dashboard, tmp_path):
+    today = datetime.now(timezone.utc).replace(hour=1, minute=0, second=0, microsecond=0)
+    for hours, elaborate in ((0, 10.0), (1, 20.0), (2, 90.0)):
+        stats = tmp_path / f'compile_stats{hours}.json'
+        stats.write_text(
+            '{"timestamp": "%s", "phase_seconds": {"elaborate": %s, "link": 1.0}}'
+            % ((today + timedelta(hours=hours)).isoformat(), elaborate), encoding='utf-8')
+        dashboard.collect_compile_metrics(str(stats))
+
+    fig = dashboard.generate_compile_metrics()
+
+    bars = {trace.name: list(trace.y) for trace in fig.data if trace.type == 'bar'}
+    assert bars == {'elaborate': [20.0], 'link': [1.0]}
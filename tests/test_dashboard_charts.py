@@ -0,0 +1,85 @@
+"""The shared chart DataFrame of a dashboard build and the charts drawn from it."""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+import yaml
+
+from dashboard_generator import UVMDashboard, CHART_COLUMNS
+
+pytest.importorskip('pandas')
+pytest.importorskip('plotly')
+
+
+def results(days_ago, passed, coverage=80.0, **fields):
+    stamp = datetime.now(timezone.utc) - timedelta(days=days_ago)
+    document = {'timestamp': stamp.isoformat(timespec='seconds'), 'total_tests': 100, 'passed_tests': passed,
+                'failed_tests': 100 - passed, 'runtime_seconds': 7200, 'simulation_speed_khz': 500.0,
+                'coverage': {'functional': coverage, 'code': coverage, 'toggle': coverage, 'fsm': coverage}}
+    document.update(fields)
+    return document
+
+
+@pytest.fixture
+def dashboard(tmp_path):
+    """UVMDashboard with the default chart targets."""
+    config = UVMDashboard.get_default_config(None)
+    config.update(database_path=str(tmp_path / 'metrics.db'), output_directory=str(tmp_path / 'dashboard'))
+    config_file = tmp_path / 'dashboard_config.yaml'
+    config_file.write_text(yaml.safe_dump(config), encoding='utf-8')
+    dashboard = UVMDashboard(str(config_file))
+    yield dashboard
+    dashboard.conn.close()
+
+
+@pytest.fixture
+def runs(dashboard):
+    dashboard.ingest([
+        results(40, 10),                                # outside the 30-day chart window
+        results(10, 70, coverage=None),                 # charted, not in the 7-day health window
+        results(1 / 24, 90),
+    ])
+    return dashboard.load_chart_data()
+
+
+def test_chart_data_is_typed_once(runs):
+    assert len(runs) == 2
+    assert str(runs['timestamp'].dtype).startswith('datetime64')
+    assert runs['timestamp'].is_monotonic_increasing
+    for column, dtype in CHART_COLUMNS.items():
+        assert runs[column].dtype == dtype, column
+    assert runs['recent'].dtype == bool
+    assert runs['recent'].tolist() == [False, True]
+    # NULL columns become NaN instead of turning the column into objects
+    assert runs['coverage_fsm'].isna().tolist() == [True, False]
+
+
+def test_health_score_uses_recent_rows_only(dashboard, runs):
+    health = dashboard.generate_project_health_score(runs)
+
+    assert health['components']['test_score'] == 36.0
+    assert health['components']['coverage_score'] == 24.0
+    assert health['components']['performance_score'] == 10.0
+    assert health['components']['trend_score'] == 5.0
+
+
+def test_charts_drawn_from_the_given_frame(dashboard, runs, monkeypatch):
+    monkeypatch.setattr(UVMDashboard, 'load_chart_data', lambda self: pytest.fail('chart data queried again'))
+
+    status = dashboard.generate_test_status_chart(runs)
+    coverage = dashboard.generate_coverage_dashboard(runs)
+    performance = dashboard.generate_performance_metrics(runs)
+    dashboard.generate_summary_dashboard(runs)
+
+    assert list(status.data[0].y) == [70.0, 90.0]
+    assert len(coverage.data) == 4
+    assert list(performance.data[0].y) == [2.0, 2.0]
+    for name in ['test_status.html', 'coverage_trends.html', 'performance_metrics.html', 'index.html']:
+        assert (dashboard.output_dir / name).exists()
+
+
+def test_empty_window_has_no_health_score(dashboard):
+    runs = dashboard.load_chart_data()
+
+    assert runs.empty
+    assert dashboard.generate_project_health_score(runs)['health_score'] == 0
@@ -0,0 +1,74 @@
+"""Schema migrations and index use of the dashboard queries on test_runs."""
+
+import pytest
+
+from dashboard_generator import UVMDashboard, INDEXED_QUERIES, CHART_QUERY, SCHEMA_MIGRATIONS
+
+
+def query_plan(dashboard, query):
+    return [row[3] for row in dashboard.conn.execute(f'EXPLAIN QUERY PLAN {query}')]
+
+
+def test_new_database_is_fully_migrated(dashboard):
+    assert dashboard.schema_version() == SCHEMA_MIGRATIONS[-1][0]
+
+
+def test_chart_query_searches_test_runs_by_index(dashboard):
+    plan = query_plan(dashboard, CHART_QUERY)
+
+    assert any(detail.startswith('SEARCH test_runs USING INDEX') for detail in plan), plan
+    assert not any(detail.startswith('SCAN') for detail in plan), plan
+
+
+@pytest.mark.parametrize('name', INDEXED_QUERIES)
+def test_indexed_queries_do_not_scan(dashboard, name):
+    plan = query_plan(dashboard, INDEXED_QUERIES[name])
+
+    assert not any(detail.startswith('SCAN') for detail in plan), plan
+
+
+def test_check_query_plans_passes_on_migrated_database(dashboard):
+    assert dashboard.check_query_plans()
+
+
+def test_check_query_plans_reports_dropped_index(dashboard):
+    dashboard.conn.execute('DROP INDEX idx_test_runs_timestamp')
+
+    assert not dashboard.check_query_plans()
+
+
+def schema_objects(dashboard):
+    return {name for (name,) in dashboard.conn.execute("SELECT name FROM sqlite_master WHERE type IN ('table', 'index')")}
+
+
+def test_version_1_database_is_upgraded(dashboard_config, dashboard):
+    # A database as version 1 left it: test_runs indexes only, ISO time stamps in compile_stats
+    conn = dashboard.conn
+    conn.execute('DROP INDEX idx_compile_stats_timestamp')
+    conn.execute('DROP INDEX idx_failure_occurrences_hash')
+    conn.execute('DROP TABLE failure_signatures')
+    conn.execute('DROP TABLE failure_occurrences')
+    conn.execute("INSERT INTO compile_stats (timestamp, kind, name, seconds) VALUES ('2025-07-27T12:00:00', 'phase', 'parse', 1.5)")
+    conn.execute('PRAGMA user_version = 1')
+    conn.commit()
+    conn.close()
+
+    upgraded = UVMDashboard(dashboard_config)
+    try:
+        assert upgraded.schema_version() == SCHEMA_MIGRATIONS[-1][0]
+        assert {'idx_test_runs_timestamp', 'idx_compile_stats_timestamp', 'idx_failure_occurrences_hash',
+                'failure_signatures', 'failure_occurrences'} <= schema_objects(upgraded)
+        assert upgraded.conn.execute('SELECT timestamp FROM compile_stats').fetchall() == [('2025-07-27 12:00:00',)]
+        assert upgraded.check_query_plans()
+    finally:
+        upgraded.conn.close()
+
+
+def test_migrations_run_once(dashboard_config, dashboard, capsys):
+    dashboard.conn.close()
+    capsys.readouterr()
+
+    reopened = UVMDashboard(dashboard_config)
+    reopened.conn.close()
+
+    assert 'migrated' not in capsys.readouterr().out
@@ -0,0 +1,93 @@
+"""In-process UVMDashboard.ingest(), bulk imports and the stored time stamps."""
+
+import json
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from dashboard_generator import UVMDashboard
+
+
+def results(**fields):
+    document = {'branch_name': 'main', 'commit_hash': 'abc123', 'test_suite': 'regression',
+                'total_tests': 10, 'passed_tests': 9, 'failed_tests': 1}
+    document.update(fields)
+    return document
+
+
+def stored_runs(dashboard):
+    return dashboard.conn.execute('''
+        SELECT timestamp, branch_name, test_suite, total_tests, passed_tests, failed_tests
+        FROM test_runs ORDER BY id
+    ''').fetchall()
+
+
+def test_ingest_one_document(dashboard):
+    assert dashboard.ingest(results(timestamp='2025-07-27T12:00:00')) == 1
+
+    assert stored_runs(dashboard) == [('2025-07-27 12:00:00', 'main', 'regression', 10, 9, 1)]
+
+
+def test_ingest_iterable(dashboard):
+    documents = (results(test_suite=f'suite{n}', passed_tests=n, timestamp=f'2025-07-2{n}T08:00:00')
+                 for n in range(3))
+
+    assert dashboard.ingest(documents) == 3
+    assert [(row[0], row[2], row[4]) for row in stored_runs(dashboard)] == [
+        ('2025-07-20 08:00:00', 'suite0', 0),
+        ('2025-07-21 08:00:00', 'suite1', 1),
+        ('2025-07-22 08:00:00', 'suite2', 2),
+    ]
+
+
+def test_ingest_without_timestamp_uses_current_utc_time(dashboard):
+    dashboard.ingest(results())
+
+    stored = datetime.strptime(stored_runs(dashboard)[0][0], '%Y-%m-%d %H:%M:%S').replace(tzinfo=timezone.utc)
+    assert abs(stored - datetime.now(timezone.utc)) < timedelta(minutes=1)
+
+
+def test_ingest_rejects_non_results_document(dashboard):
+    with pytest.raises(ValueError, match='Document 1'):
+        dashboard.ingest([results(), {'run_id': '20250727_120000', 'jobs': []}])
+
+    assert stored_runs(dashboard) == []
+
+
+@pytest.mark.parametrize('value, stored', [
+    ('2025-07-27T21:00:00+09:00', '2025-07-27 12:00:00'),
+    ('2025-07-27T08:00:00-04:00', '2025-07-27 12:00:00'),
+    ('2025-07-27T12:00:00', '2025-07-27 12:00:00'),
+    ('2025-07-27 12:00:00', '2025-07-27 12:00:00'),
+    (None, None),
+])
+def test_db_timestamp_is_utc(value, stored):
+    assert UVMDashboard.db_timestamp(value) == stored
+
+
+def test_offset_timestamp_lands_in_utc_window(dashboard):
+    # 30 minutes ago, expressed in a +09:00 zone
+    stamp = (datetime.now(timezone.utc) - timedelta(minutes=30)).astimezone(timezone(timedelta(hours=9)))
+    dashboard.ingest(results(timestamp=stamp.isoformat(timespec='seconds')))
+
+    in_window = dashboard.conn.execute(
+        "SELECT COUNT(*) FROM test_runs WHERE timestamp >= datetime('now', '-1 hours')").fetchone()[0]
+    assert in_window == 1
+
+
+def test_bulk_import_files_and_stream(dashboard, tmp_path):
+    inputs = tmp_path / 'results'
+    inputs.mkdir()
+    (inputs / 'one.json').write_text(json.dumps(results(test_suite='one')), encoding='utf-8')
+    (inputs / 'many.json').write_text(json.dumps([results(test_suite='many0'), results(test_suite='many1'),
+                                                  {'run_id': '20250727_120000', 'jobs': []}]), encoding='utf-8')
+    (inputs / 'broken.json').write_text('{"total_tests": ', encoding='utf-8')
+    stream = tmp_path / 'nightly.jsonl'
+    stream.write_text('\n'.join([json.dumps(results(test_suite='stream0')), 'not json', '',
+                                 json.dumps({'run_id': '20250728_120000'}),
+                                 json.dumps(results(test_suite='stream1'))]) + '\n', encoding='utf-8')
+
+    stats = dashboard.bulk_import([str(inputs), str(stream)], batch_size=2, jobs=2)
+
+    assert (stats['files'], stats['rows'], stats['batches'], stats['skipped'], stats['errors']) == (4, 5, 3, 1, 1)
+    assert sorted(row[2] for row in stored_runs(dashboard)) == ['many0', 'many1', 'one', 'stream0', 'stream1']
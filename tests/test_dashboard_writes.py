@@ -0,0 +1,92 @@
+"""Concurrent writers: retries under a locked database and the single-writer ingest spool."""
+
+import sqlite3
+
+import pytest
+import yaml
+
+import dashboard_generator
+from dashboard_generator import UVMDashboard
+
+
+def results(suite='regression'):
+    return {'branch_name': 'main', 'test_suite': suite, 'total_tests': 4, 'passed_tests': 4, 'failed_tests': 0}
+
+
+def make_dashboard(tmp_path, **config):
+    config.update(database_path=str(tmp_path / 'metrics.db'), output_directory=str(tmp_path / 'dashboard'))
+    config_file = tmp_path / 'dashboard_config.yaml'
+    config_file.write_text(yaml.safe_dump(config), encoding='utf-8')
+    return UVMDashboard(str(config_file))
+
+
+@pytest.fixture
+def locked(tmp_path):
+    """Second connection holding the write lock of the metrics database."""
+    make_dashboard(tmp_path).conn.close()
+    conn = sqlite3.connect(str(tmp_path / 'metrics.db'), isolation_level=None)
+    conn.execute('BEGIN IMMEDIATE')
+    yield conn
+    conn.close()
+
+
+def suites(dashboard):
+    return [row[0] for row in dashboard.conn.execute('SELECT test_suite FROM test_runs ORDER BY id')]
+
+
+def test_write_retried_until_lock_is_released(tmp_path, locked, monkeypatch):
+    dashboard = make_dashboard(tmp_path, busy_timeout_seconds=0.05, write_retries=3)
+    sleeps = []
+
+    def backoff(delay):
+        # The other writer commits while this one backs off
+        sleeps.append(delay)
+        if locked.in_transaction:
+            locked.execute('COMMIT')
+    monkeypatch.setattr(dashboard_generator.time, 'sleep', backoff)
+
+    assert dashboard.ingest(results()) == 1
+    assert len(sleeps) == 1
+    assert suites(dashboard) == ['regression']
+
+
+def test_write_gives_up_after_write_retries(tmp_path, locked, monkeypatch):
+    dashboard = make_dashboard(tmp_path, busy_timeout_seconds=0.05, write_retries=2)
+    sleeps = []
+    monkeypatch.setattr(dashboard_generator.time, 'sleep', sleeps.append)
+
+    with pytest.raises(sqlite3.OperationalError, match='locked'):
+        dashboard.ingest(results())
+    assert len(sleeps) == 2
+
+    locked.execute('ROLLBACK')
+    assert suites(dashboard) == []
+
+
+def test_non_lock_errors_are_not_retried(tmp_path, monkeypatch):
+    dashboard = make_dashboard(tmp_path, write_retries=3)
+    monkeypatch.setattr(dashboard_generator.time, 'sleep', pytest.fail)
+
+    with pytest.raises(sqlite3.OperationalError, match='no such table'):
+        dashboard.retry_write(lambda: dashboard.conn.execute('INSERT INTO missing VALUES (1)'))
+
+
+def test_spool_submissions_drained_by_ingest_server(tmp_path):
+    spool = tmp_path / 'spool'
+    dashboard = make_dashboard(tmp_path, ingest_spool=str(spool))
+
+    first = dashboard.submit(results('smoke'))
+    dashboard.submit([results('nightly0'), results('nightly1')])
+    (spool / 'broken.json').write_text('{"total_tests": ', encoding='utf-8')
+    assert first.suffix == '.json' and not list(spool.glob('*.part'))
+    assert suites(dashboard) == []
+
+    assert dashboard.serve_ingest(once=True) == 3
+    assert suites(dashboard) == ['smoke', 'nightly0', 'nightly1']
+    assert not list(spool.glob('*.json'))
+    assert [path.name for path in (spool / 'failed').iterdir()] == ['broken.json']
+
+
+def test_submit_needs_ingest_spool(dashboard):
+    with pytest.raises(ValueError, match='ingest_spool'):
+        dashboard.submit(results())
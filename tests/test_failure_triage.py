@@ -0,0 +1,39 @@
+"""Failure signatures and their history in the dashboard database."""
+
+from failure_triage import SignatureStore, normalize_message
+
+
+def bucket(signature_hash='abc123def456', count=2):
+    return {
+        'hash': signature_hash,
+        'signature': 'UVM_ERROR [SB] Mismatch addr=<value>',
+        'severity': 'UVM_ERROR',
+        'report_id': 'SB',
+        'count': count,
+        'first_test': 'register_file_random',
+        'first_seed': 7,
+        'reproducer': {'test': 'register_file_random', 'seed': 7, 'final_time': 1234, 'log': 'run.log'},
+    }
+
+
+def test_normalize_message():
+    assert normalize_message("uvm_test_top.env.sb mismatch addr=0x3 exp=32'hdeadbeef at 120 ns") == \
+        "<path> mismatch addr=<value> exp=<value> at <time>"
+
+
+def test_signature_history_without_dashboard_output(dashboard_config, tmp_path):
+    store = SignatureStore(dashboard_config)
+    try:
+        assert store.known('abc123def456') is None
+        store.record('run1', [bucket()])
+        store.record('run2', [bucket(count=3)])
+
+        history = store.known('abc123def456')
+        assert history['runs_seen'] == 2
+        assert history['total_failures'] == 5
+        assert store.conn.execute('SELECT COUNT(*) FROM failure_occurrences').fetchone()[0] == 2
+    finally:
+        store.close()
+
+    # Triage only touches the database
+    assert not (tmp_path / 'dashboard').exists()
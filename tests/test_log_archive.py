@@ -0,0 +1,75 @@
+"""Compressed log archives: frames, the marker index and random access."""
+
+import gzip
+
+import pytest
+
+from conftest import REPO_ROOT
+from log_archive import LogArchiver, LogArchive, open_log, zstandard
+from log_parser import parse_log_file
+
+FORMATS = ['gzip', pytest.param('zstd', marks=pytest.mark.skipif(zstandard is None, reason='zstandard not installed'))]
+
+
+def make_log(path, lines=400, error_line=250):
+    text = ''.join(
+        'UVM_ERROR /sb.sv(12) @ 1000: uvm_test_top.env.scoreboard [SB] Mismatch addr=0x3\n' if number == error_line
+        else f'UVM_INFO /drv.sv(40) @ {number * 10}: uvm_test_top.env.agent.driver [DRV] Line {number}\n'
+        for number in range(1, lines + 1))
+    text += '--- UVM Report Summary ---\nUVM_ERROR :    1\nUVM_FATAL :    0\n'
+    path.write_text(text, encoding='utf-8')
+    return text.encode()
+
+
+@pytest.mark.parametrize('fmt', FORMATS)
+def test_archive_round_trip(tmp_path, fmt):
+    log = tmp_path / 'run.log'
+    text = make_log(log)
+
+    index = LogArchiver(frame_bytes=1024, fmt=fmt).archive(str(log))
+    archive_file = str(log) + ('.zst' if fmt == 'zstd' else '.gz')
+
+    assert not log.exists()
+    assert len(index['frames']) > 10
+    assert index['size'] == len(text)
+    with open_log(archive_file) as f:
+        assert f.read() == text
+    if fmt == 'gzip':
+        assert gzip.decompress(open(archive_file, 'rb').read()) == text
+
+
+@pytest.mark.parametrize('fmt', FORMATS)
+def test_seek_to_first_error(tmp_path, fmt):
+    log = tmp_path / 'run.log'
+    text = make_log(log)
+    LogArchiver(frame_bytes=1024, fmt=fmt).archive(str(log))
+    archive = LogArchive(str(log) + ('.zst' if fmt == 'zstd' else '.gz'))
+
+    # The summary's "UVM_ERROR :" count line is not indexed as an error
+    assert archive.index['marker_counts'] == {'UVM_ERROR': 1, 'UVM_FATAL': 0, 'summary': 1}
+    line, offset = archive.first('UVM_ERROR')
+    assert line == 250
+    assert offset == text.index(b'UVM_ERROR /sb.sv')
+
+    # One frame holds the error line
+    number = archive.frame_of(offset)
+    frame = archive.read_frame(number)
+    start = offset - archive.frame_starts[number]
+    assert frame[start:].startswith(b'UVM_ERROR /sb.sv(12) @ 1000')
+
+    context = archive.lines_at(offset, before=2, after=1)
+    assert [number for number, _ in context] == [248, 249, 250, 251]
+    assert context[2][1].startswith('UVM_ERROR')
+    assert archive.offset_of_line(250) == offset
+
+
+def test_parser_reads_archived_log(tmp_path):
+    log = tmp_path / 'run.log'
+    log.write_bytes((REPO_ROOT / 'docs' / 'sample_execution_log.txt').read_bytes())
+    plain = parse_log_file(str(log))
+
+    LogArchiver(frame_bytes=512, fmt='gzip').archive(str(log))
+    archived = parse_log_file(str(log) + '.gz')
+
+    assert {key: value for key, value in archived.items() if key != 'log'} == \
+        {key: value for key, value in plain.items() if key != 'log'}
@@ -0,0 +1,75 @@
+"""Log parsing and PASS/FAIL/HANG classification against docs/sample_execution_log.txt."""
+
+import pytest
+
+from conftest import REPO_ROOT
+from log_parser import parse_log_file, classify_log
+
+SAMPLE_LOG = REPO_ROOT / 'docs' / 'sample_execution_log.txt'
+SUMMARY_START = 'UVM_INFO ${DSIM_HOME}\\uvm\\1.2\\src\\base\\uvm_report_server.svh(847)'
+SUMMARY_END = '=N:[dumpMXD] closing MXD dump'
+
+
+@pytest.fixture
+def sample_text():
+    return SAMPLE_LOG.read_text(encoding='utf-8')
+
+
+def parse_text(tmp_path, text):
+    log_file = tmp_path / 'run.log'
+    log_file.write_text(text, encoding='utf-8')
+    return parse_log_file(str(log_file))
+
+
+def test_sample_log():
+    result = parse_log_file(str(SAMPLE_LOG))
+
+    assert result['test'] == 'register_file_basic_test'
+    assert result['seed'] == 1
+    assert result['summary_found']
+    assert result['uvm_counts'] == {'UVM_INFO': 36, 'UVM_WARNING': 0, 'UVM_ERROR': 0, 'UVM_FATAL': 0}
+    assert result['final_time'] == 415000
+    assert result['time_unit'] == '1ps'
+    assert result['termination'] == '$finish'
+    assert result['exit_status'] == 'finished'
+    assert classify_log(result) == 'PASS'
+    assert classify_log(result, exit_code=0) == 'PASS'
+    assert classify_log(result, exit_code=1) == 'FAIL'
+
+
+def test_uvm_error_fails(tmp_path, sample_text):
+    error = ('UVM_ERROR .\\..\\env\\register_file_scoreboard.sv(77) @ 205000: '
+             'uvm_test_top.env.scoreboard [SB] Mismatch addr=0x2\n')
+    result = parse_text(tmp_path, sample_text.replace(SUMMARY_START, error + SUMMARY_START)
+                        .replace('UVM_ERROR :    0', 'UVM_ERROR :    1'))
+
+    assert result['uvm_counts']['UVM_ERROR'] == 1
+    assert result['messages'][0]['id'] == 'SB'
+    assert result['messages'][0]['time'] == 205000
+    assert classify_log(result, exit_code=0) == 'FAIL'
+
+
+def test_log_without_summary_passes_when_simulation_finished(tmp_path, sample_text):
+    # UVM_NONE (perf profile) suppresses the UVM_LOW report summary
+    text = sample_text[:sample_text.index(SUMMARY_START)] + sample_text[sample_text.index(SUMMARY_END):]
+    result = parse_text(tmp_path, text)
+
+    assert not result['summary_found']
+    assert classify_log(result) == 'PASS'
+    assert classify_log(result, exit_code=0) == 'PASS'
+
+
+def test_log_cut_short_fails(tmp_path, sample_text):
+    result = parse_text(tmp_path, sample_text[:sample_text.index(SUMMARY_START)])
+
+    assert result['exit_status'] == 'incomplete'
+    assert classify_log(result) == 'FAIL'
+    assert classify_log(result, exit_code=0) == 'FAIL'
+
+
+def test_watchdog_hang(tmp_path, sample_text):
+    hang = 'UVM_FATAL /w.sv(80) @ 300000: uvm_test_top.env.watchdog [WATCHDOG_HANG] No activity for 100000 ns\n'
+    result = parse_text(tmp_path, sample_text.replace(SUMMARY_START, hang + SUMMARY_START))
+
+    assert result['hang']
+    assert classify_log(result, exit_code=0) == 'HANG'
@@ -0,0 +1,95 @@
+"""Live progress: following a job's log, stall detection and the event stream."""
+
+from progress_stream import ProgressTracker, ProgressStream, ProgressReader
+
+
+def heartbeat(sim_time, activity):
+    return (f'UVM_INFO /watchdog.sv(30) @ {sim_time}: uvm_test_top.env.watchdog [HEARTBEAT] '
+            f'activity={activity}\n')
+
+
+def append(path, text):
+    with open(path, 'a', encoding='utf-8') as f:
+        f.write(text)
+
+
+def test_stall_counts_from_last_sim_time_advance(tmp_path):
+    log = tmp_path / 'run.log'
+    log.write_text('', encoding='utf-8')
+    tracker = ProgressTracker(str(log), start=100.0)
+
+    append(log, heartbeat(1000, 5))
+    tracker.poll(110.0)
+    assert tracker.sim_time == 1000
+    assert tracker.activity == 5
+    assert tracker.stalled_for(130.0) == 20.0
+
+    # Simulated time advancing resets the stall clock
+    append(log, heartbeat(2000, 9))
+    tracker.poll(140.0)
+    assert tracker.stalled_for(140.0) == 0.0
+
+    # The same simulated time again (e.g. a zero-delay loop) does not
+    append(log, heartbeat(2000, 9))
+    tracker.poll(170.0)
+    assert tracker.stalled_for(200.0) == 60.0
+
+
+def test_no_stall_without_heartbeats(tmp_path):
+    log = tmp_path / 'run.log'
+    log.write_text('UVM_INFO /drv.sv(40) @ 500: uvm_test_top.env.agent.driver [DRV] Drive\n', encoding='utf-8')
+    tracker = ProgressTracker(str(log), start=0.0)
+
+    tracker.poll(1.0)
+    assert tracker.sim_time == 500
+    assert tracker.stalled_for(1000.0) == 0.0
+
+
+def test_partial_line_is_read_on_next_poll(tmp_path):
+    log = tmp_path / 'run.log'
+    line = heartbeat(1000, 5)
+    log.write_text(line[:20], encoding='utf-8')
+    tracker = ProgressTracker(str(log), start=0.0)
+
+    tracker.poll(1.0)
+    assert tracker.sim_time is None
+    append(log, line[20:])
+    tracker.poll(2.0)
+    assert tracker.sim_time == 1000
+    assert tracker.counts['UVM_INFO'] == 1
+
+
+def test_snapshot_rates(tmp_path):
+    log = tmp_path / 'run.log'
+    log.write_text('', encoding='utf-8')
+    tracker = ProgressTracker(str(log), start=0.0)
+
+    append(log, heartbeat(1000, 10))
+    tracker.poll(10.0)
+    first = tracker.snapshot(10.0)
+    assert first['phase'] == 'simulate'
+    assert first['sim_time_per_second'] is None
+
+    append(log, heartbeat(3000, 30))
+    tracker.poll(20.0)
+    second = tracker.snapshot(20.0)
+    assert second['sim_time_per_second'] == 200.0
+    assert second['tx_per_second'] == 2.0
+    assert second['stalled_for'] == 0.0
+
+
+def test_reader_flags_stalled_and_slow_jobs(tmp_path):
+    stream = ProgressStream(str(tmp_path / 'progress.jsonl'))
+    stream.emit('run_start', run_id='r1')
+    for job, rate, stalled in [('fast', 1000.0, 0.0), ('normal', 900.0, 0.0),
+                               ('slow', 100.0, 0.0), ('stuck', 800.0, 400.0)]:
+        stream.emit('progress', run_id='r1', job=job, phase='simulate',
+                    sim_time_per_second=rate, stalled_for=stalled)
+    stream.emit('end', run_id='r1', job='done', status='PASS')
+    stream.close()
+
+    reader = ProgressReader(str(tmp_path))
+    assert reader.poll() == 6
+    assert reader.poll() == 0
+    assert reader.run['run_id'] == 'r1'
+    assert reader.flags(stall_seconds=300, slow_factor=0.25) == {'stuck': 'STALLED', 'slow': 'SLOW'}
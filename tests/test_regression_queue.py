@@ -0,0 +1,50 @@
+"""Leases and memory admission of the shared work queue."""
+
+import pytest
+
+from regression_queue import RegressionQueue
+
+
+@pytest.fixture
+def queue(tmp_path):
+    queue = RegressionQueue(str(tmp_path / 'queue.db'))
+    queue.create_run('run1', str(tmp_path))
+    yield queue
+    queue.close()
+
+
+def enqueue(queue, *memory_mb):
+    queue.enqueue('run1', [(priority, {'id': f'job{priority}', 'estimated_memory_mb': memory})
+                           for priority, memory in enumerate(memory_mb)])
+
+
+def claimed(claim):
+    return claim['job']['id'] if claim else None
+
+
+def test_jobs_are_leased_once_in_priority_order(queue):
+    enqueue(queue, 1, 1, 1)
+
+    assert [claimed(queue.claim(worker)) for worker in ('a:1', 'a:2', 'b:1', 'b:2')] == \
+        ['job0', 'job1', 'job2', None]
+
+
+def test_memory_budget_is_shared_by_the_workers_of_a_host(queue):
+    enqueue(queue, 2000, 2000, 500)
+
+    assert claimed(queue.claim('hostA:1', 3000)) == 'job0'
+    # job1 does not fit next to job0 on hostA, job2 does (first fit)
+    assert claimed(queue.claim('hostA:2', 3000)) == 'job2'
+    assert queue.claim('hostA:3', 3000) is None
+    # Another host has its own budget
+    assert claimed(queue.claim('hostB:1', 3000)) == 'job1'
+
+
+def test_job_larger_than_budget_runs_on_an_idle_host(queue):
+    enqueue(queue, 8000, 100)
+
+    assert claimed(queue.claim('hostA:1', 4000)) == 'job0'
+    assert queue.claim('hostA:2', 4000) is None
+
+    queue.complete('hostA:1', 'run1', 'job0', {'status': 'PASS'})
+    assert claimed(queue.claim('hostA:2', 4000)) == 'job1'
@@ -0,0 +1,97 @@
+"""Regression runner end to end against the stub dsim (tests/stub_dsim)."""
+
+from conftest import dsim_calls
+
+
+def jobs_by_id(results):
+    return {job['id']: job for job in results['jobs']}
+
+
+def test_pass_fail_and_timeout(run_regression):
+    code, results = run_regression('-s', '1', '-t', '5', '--no-rerun')
+
+    jobs = jobs_by_id(results)
+    assert code == 1
+    assert jobs['stub_pass_s1']['status'] == 'PASS'
+    assert jobs['stub_fail_s1']['status'] == 'FAIL'
+    assert jobs['stub_fail_s1']['uvm_counts']['UVM_ERROR'] == 1
+    assert jobs['stub_hang_s1']['status'] == 'TIMEOUT'
+    assert results['summary'] == {'PASS': 1, 'FAIL': 1, 'HANG': 0, 'TIMEOUT': 1, 'ERROR': 0}
+
+
+def test_all_passing_regression_exits_zero(run_regression):
+    code, results = run_regression('-s', '1', '-s', '2', 'stub_pass')
+
+    assert code == 0
+    assert [job['status'] for job in results['jobs']] == ['PASS', 'PASS']
+
+
+def test_failure_is_rerun_with_rerun_profile(project, run_regression):
+    code, results = run_regression('-s', '7', 'stub_pass', 'stub_fail')
+
+    jobs = jobs_by_id(results)
+    assert code == 1
+    assert jobs['stub_pass_s7'].get('rerun') is None
+    rerun = jobs['stub_fail_s7']['rerun']
+    assert rerun['status'] == 'FAIL'
+    assert rerun['reproduced'] is True
+    assert rerun['profile'] == 'rerun'
+    assert '+UVM_VERBOSITY=UVM_HIGH' in rerun['command']
+    assert dsim_calls(project).count(('stub_fail_test', '7')) == 2
+
+
+def test_unchanged_rerun_is_served_from_cache(project, run_regression):
+    run_regression('-s', '1', '-s', '2', 'stub_pass')
+    code, results = run_regression('-s', '1', '-s', '2', 'stub_pass')
+
+    assert code == 0
+    assert all(job['cached'] and job['status'] == 'PASS' for job in results['jobs'])
+    assert len(dsim_calls(project)) == 2
+
+    (project / 'sim' / 'exec' / 'stub.sv').write_text("module stub_tb; initial; endmodule\n", encoding='utf-8')
+    _, results = run_regression('-s', '1', '-s', '2', 'stub_pass')
+    assert not any(job['cached'] for job in results['jobs'])
+    assert len(dsim_calls(project)) == 4
+
+
+def test_default_seeds_repeat_so_nightly_rerun_is_cached(project, run_regression):
+    _, first = run_regression('-n', '2', 'stub_pass')
+    code, second = run_regression('-n', '2', 'stub_pass')
+
+    assert code == 0
+    assert [job['seed'] for job in second['jobs']] == [job['seed'] for job in first['jobs']]
+    assert len({job['seed'] for job in first['jobs']}) == 2
+    assert all(job['cached'] for job in second['jobs'])
+    assert len(dsim_calls(project)) == 2
+
+    _, swept = run_regression('-n', '2', '--base-seed', '20250727', 'stub_pass')
+    assert not any(job['cached'] for job in swept['jobs'])
+
+
+def test_force_ignores_cache(project, run_regression):
+    run_regression('-s', '1', 'stub_pass')
+    _, results = run_regression('-s', '1', 'stub_pass', '--force')
+
+    assert not results['jobs'][0]['cached']
+    assert len(dsim_calls(project)) == 2
+
+
+def test_queue_leases_each_job_to_one_of_two_workers(project, run_regression, monkeypatch):
+    monkeypatch.setenv('STUB_DSIM_SECONDS', '1.5')
+    seeds = [arg for seed in range(1, 5) for arg in ('-s', str(seed))]
+    code, results = run_regression(*seeds, 'stub_pass', '--queue', str(project / 'queue.db'), '-w', '2')
+
+    assert code == 0
+    assert [job['status'] for job in results['jobs']] == ['PASS'] * 4
+    assert len({job['worker'] for job in results['jobs']}) == 2
+    assert sorted(dsim_calls(project)) == [('stub_pass_test', str(seed)) for seed in range(1, 5)]
+
+
+def test_perf_profile_without_report_summary(project, run_regression):
+    code, results = run_regression('-s', '1', '-p', 'perf', 'stub_pass', 'stub_fail')
+
+    jobs = jobs_by_id(results)
+    assert jobs['stub_pass_s1']['status'] == 'PASS'
+    assert jobs['stub_pass_s1'].get('rerun') is None
+    assert jobs['stub_fail_s1']['status'] == 'FAIL'
+    assert code == 1
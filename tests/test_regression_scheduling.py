@@ -0,0 +1,139 @@
+"""Runtime history, longest-first scheduling and memory admission of the regression runner."""
+
+import pytest
+
+from regression_history import RegressionHistory, estimate_makespan
+from regression_runner import RegressionRunner
+
+
+@pytest.fixture
+def history(tmp_path):
+    history = RegressionHistory(str(tmp_path / 'history.db'))
+    yield history
+    history.close()
+
+
+@pytest.fixture
+def runner(history):
+    runner = RegressionRunner()
+    runner.config = {'regression': {'default_runtime_seconds': 60, 'stable_runs': 3, 'stable_sample_rate': 0.5}}
+    runner.history = history
+    return runner
+
+
+def record(history, test, seed, runtime, status='PASS', profile='regression', peak_memory_mb=None):
+    history.record('run', {'test': test, 'seed': seed, 'profile': profile, 'status': status,
+                           'runtime_seconds': runtime, 'peak_memory_mb': peak_memory_mb})
+
+
+def job(test, seed, profile='regression'):
+    return {'id': f'{test}_s{seed}', 'test': test, 'seed': seed, 'profile': profile}
+
+
+def test_estimate_prefers_same_seed_then_median_of_test(history):
+    for seed, runtime in ((1, 10.0), (2, 30.0), (3, 50.0), (1, 12.0)):
+        record(history, 'long', seed, runtime)
+
+    assert history.estimate('long', 1, 'regression') == 12.0
+    assert history.estimate('long', 9, 'regression') == 21.0
+    assert history.estimate('long', 9, 'perf') == 21.0
+    assert history.estimate('unknown', 1, 'regression') is None
+
+
+def test_launch_errors_and_reruns_are_not_recorded(history):
+    record(history, 'broken', 1, 0.0, status='ERROR')
+    history.record('run', {'test': 'flaky', 'seed': 1, 'profile': 'rerun', 'status': 'FAIL',
+                           'runtime_seconds': 5.0, 'is_rerun': True})
+
+    assert history.estimate('broken', 1, 'regression') is None
+    assert history.estimate('flaky', 1, 'rerun') is None
+
+
+def test_estimate_makespan():
+    assert estimate_makespan([10, 5, 5], 2) == 10
+    assert estimate_makespan([5, 5, 10], 2) == 15
+    assert estimate_makespan([], 4) == 0
+
+
+def test_schedule_jobs_longest_first(runner, history):
+    record(history, 'short', 1, 5.0)
+    record(history, 'long', 1, 100.0)
+
+    jobs, skipped, makespan = runner.schedule_jobs([job('short', 1), job('new', 1), job('long', 1)], 2, 'none')
+
+    assert [j['id'] for j in jobs] == ['long_s1', 'new_s1', 'short_s1']
+    # A job without history counts with the average of the known estimates
+    assert jobs[1]['estimated_seconds'] == 52.5
+    assert not jobs[1]['estimate_known']
+    assert skipped == []
+    assert makespan == 100.0
+
+
+@pytest.mark.parametrize('policy', ['deprioritize', 'sample'])
+def test_stable_expensive_tests(runner, history, policy):
+    for _ in range(3):
+        record(history, 'stable', 1, 100.0)
+        record(history, 'cheap', 1, 1.0)
+    record(history, 'failing', 1, 50.0, status='FAIL')
+
+    jobs = [job('stable', seed) for seed in (1, 2, 3, 4)] + [job('failing', 1), job('cheap', 1)]
+    jobs, skipped, _ = runner.schedule_jobs(jobs, 1, policy)
+
+    if policy == 'deprioritize':
+        assert [j['id'] for j in jobs] == ['failing_s1', 'cheap_s1', 'stable_s1', 'stable_s2', 'stable_s3', 'stable_s4']
+        assert skipped == []
+    else:
+        assert [j['id'] for j in jobs] == ['stable_s1', 'stable_s2', 'failing_s1', 'cheap_s1']
+        assert [j['id'] for j in skipped] == ['stable_s3', 'stable_s4']
+
+
+def queued(*memory_mb):
+    return [{'id': f'job{index}', 'estimated_memory_mb': memory} for index, memory in enumerate(memory_mb)]
+
+
+def running(*memory_mb):
+    return {pid: (None, {'estimated_memory_mb': estimated, 'memory_mb': measured})
+            for pid, (estimated, measured) in enumerate(memory_mb)}
+
+
+def test_admit_first_fit_within_budget(runner):
+    runner.memory_budget_mb = 4000
+    queue = queued(3000, 2500, 1000)
+
+    assert runner.admit(queue, running((2000, 0.0)))['id'] == 'job2'
+    assert [j['id'] for j in queue] == ['job0', 'job1']
+    assert runner.admit(queue, running((2000, 0.0), (1000, 0.0))) is None
+
+
+def test_admit_counts_measured_memory_of_running_jobs(runner):
+    runner.memory_budget_mb = 4000
+
+    assert runner.admit(queued(1500), running((2000, 1000.0)))['id'] == 'job0'
+    assert runner.admit(queued(1500), running((2000, 3000.0))) is None
+
+
+def test_admit_starts_oversized_job_alone(runner):
+    runner.memory_budget_mb = 4000
+    queue = queued(9000, 100)
+
+    assert runner.admit(queue, {})['id'] == 'job0'
+
+
+def test_admit_stops_backfilling_after_admission_wait(runner):
+    runner.memory_budget_mb = 4000
+    runner.admission_wait = 300
+    queue = queued(3000, 500, 500)
+    busy = running((2000, 0.0))
+
+    # The head's first refusal starts its wait; smaller jobs are backfilled meanwhile
+    assert runner.admit(queue, busy)['id'] == 'job1'
+    assert 'blocked_since' in queue[0]
+
+    queue[0]['blocked_since'] -= 301
+    assert runner.admit(queue, busy) is None
+
+
+def test_admit_without_budget_takes_head(runner):
+    runner.memory_budget_mb = None
+
+    assert runner.admit(queued(9000, 100), running((9000, 9000.0)))['id'] == 'job0'
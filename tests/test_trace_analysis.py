@@ -0,0 +1,78 @@
+"""Offline reference check and functional coverage of transaction traces."""
+
+import pytest
+import yaml
+
+from conftest import READ, WRITE, REPO_ROOT, write_trace
+from trace_analysis import CoverageModel, TraceAnalyzer, analyze_trace, check_trace
+from trace_reader import TraceReader
+
+CLEAN = [
+    (10, READ, 2, 0, 1),                # never written: reads the reset value
+    (20, WRITE, 1, 0x1234, 1),
+    (30, WRITE, 3, 0xFFFFFFFF, 1),
+    (40, READ, 1, 0x1234, 1),
+    (50, WRITE, 1, 0x80000000, 1),
+    (60, READ, 3, 0xFFFFFFFF, 1),
+    (70, READ, 1, 0x80000000, 1),
+]
+
+
+@pytest.fixture
+def config():
+    with open(REPO_ROOT / 'config.yaml', 'r', encoding='utf-8') as f:
+        return yaml.safe_load(f)
+
+
+def test_clean_trace_has_no_mismatches(tmp_path):
+    result = check_trace(TraceReader(write_trace(tmp_path / 'clean.trc', CLEAN)))
+
+    assert result == {'writes': 3, 'reads': 4, 'mismatches': 0}
+
+
+@pytest.mark.parametrize('byte_order', ['<', '>'])
+def test_injected_mismatch_is_flagged(tmp_path, byte_order):
+    records = list(CLEAN)
+    records[3] = (40, READ, 1, 0x4321, 1)       # stale data on the first read back of address 1
+    records[6] = (70, READ, 1, 0x1234, 1)       # and the old value after the rewrite
+
+    result = check_trace(TraceReader(write_trace(tmp_path / 'bad.trc', records, byte_order)))
+
+    assert result['mismatches'] == 2
+    assert result['first_mismatch'] == {'time': 40, 'address': 1, 'data': 0x4321, 'expected': 0x1234}
+
+
+def test_read_before_any_write_expects_reset_value(tmp_path):
+    reader = TraceReader(write_trace(tmp_path / 'reset.trc', [(10, READ, 0, 0, 1)]))
+
+    assert check_trace(reader)['mismatches'] == 0
+    assert check_trace(reader, reset_value=0xA5)['first_mismatch']['expected'] == 0xA5
+
+
+def test_coverage_bins_from_config(tmp_path, config):
+    reader = TraceReader(write_trace(tmp_path / 'clean.trc', CLEAN))
+    hits = CoverageModel(config).sample(reader)
+
+    assert hits['operation'] == [4, 3]
+    assert hits['address'] == [0, 4, 1, 2]
+    # zero, all_ones, low, high
+    assert hits['data'] == [1, 2, 2, 2]
+    assert 'ready' not in hits
+    # operation x address: READ then WRITE, addresses 0-3 within each
+    assert hits['operation_x_address'] == [0, 2, 1, 1, 0, 2, 0, 1]
+
+
+def test_analyzer_merges_traces_and_lists_failing_ones(tmp_path, config):
+    config_file = tmp_path / 'config.yaml'
+    config_file.write_text(yaml.safe_dump(config), encoding='utf-8')
+    clean = write_trace(tmp_path / 'clean.trc', CLEAN)
+    bad = write_trace(tmp_path / 'bad.trc', [(10, WRITE, 0, 5, 1), (20, READ, 0, 6, 1)])
+    missing = str(tmp_path / 'missing.trc')
+
+    summary = TraceAnalyzer(str(config_file), jobs=2).analyze([clean, bad, missing])
+
+    assert (summary['traces'], summary['errors'], summary['records']) == (3, 1, 9)
+    assert summary['mismatches'] == 1
+    assert summary['failing_traces'] == [bad]
+    assert summary['coverpoint_coverage']['address'] == 100.0
+    assert analyze_trace(missing, config)['error']
@@ -0,0 +1,41 @@
+"""Binary transaction traces read back in either byte order."""
+
+import numpy as np
+import pytest
+
+from conftest import READ, WRITE, write_trace
+from trace_reader import TraceReader
+
+RECORDS = [
+    (10, WRITE, 1, 0xDEADBEEF, 1),
+    ((5 << 32) + 20, READ, 1, 0xDEADBEEF, 1),
+    ((1 << 63) + 7, READ, 3, 0, 1),
+]
+
+
+@pytest.mark.parametrize('byte_order', ['<', '>'])
+def test_records_in_either_byte_order(tmp_path, byte_order):
+    reader = TraceReader(write_trace(tmp_path / 'run.trc', RECORDS, byte_order))
+
+    assert reader.byte_order == byte_order
+    assert reader.time_unit == '1ns'
+    assert len(reader) == 3
+    assert [int(time) for time in reader.records['time']] == [record[0] for record in RECORDS]
+    assert list(reader.records['data']) == [0xDEADBEEF, 0xDEADBEEF, 0]
+    assert list(reader.records['operation']) == [WRITE, READ, READ]
+    assert reader.enum_value('operation', 'WRITE') == WRITE
+    assert reader.summary()['operation'] == {'READ': 2, 'WRITE': 1}
+
+
+def test_little_endian_records_are_memory_mapped(tmp_path):
+    reader = TraceReader(write_trace(tmp_path / 'run.trc', RECORDS, '<'))
+
+    assert isinstance(reader.records, np.memmap)
+
+
+def test_bad_magic(tmp_path):
+    trace = tmp_path / 'run.trc'
+    trace.write_bytes(b'\0' * 32)
+
+    with pytest.raises(ValueError, match='bad magic'):
+        TraceReader(str(trace))